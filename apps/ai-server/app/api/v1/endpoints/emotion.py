@@ -1,21 +1,39 @@
-import os
-import tempfile
+from typing import (
+    Any,
+    Dict
+)
 
 from fastapi import (
     APIRouter, 
     Depends, 
-    File, 
     Header, 
-    UploadFile
+    HTTPException,
+    Request
 )
 from langchain.memory import ConversationBufferMemory
 
+from app.api.v1.endpoints.jobs import to_job_status
 from app.api.v1.endpoints.memory_debug import MemoryManager
+from app.models.job import JobStatus
 from app.models.emotion import (
     EmotionGroupResult, 
     EmotionGroupScore
 )
 from app.services.emotion_analyst import EmotionAnalysisService 
+from app.services.job_manager import (
+    JobProgress,
+    JobQueueFullError,
+    job_manager
+)
+from app.utils.upload import (
+    MAX_VIDEO_UPLOAD_BYTES,
+    UploadTooLargeError,
+    remove_quietly,
+    spool_upload,
+    spooled_upload,
+    upload_openapi
+)
+from app.utils.worker_pool import PoolSaturatedError, SharedProgress
 
 router = APIRouter()
 
@@ -25,38 +43,120 @@ router = APIRouter()
     response_model=EmotionGroupResult,
     tags=["Emotion"],
     summary="Upload Video and Analysis Emotion",
+    openapi_extra=upload_openapi("Video file to be analyzed"),
 )
 async def upload_video(
+    request: Request,
     x_session_id: str = Header(...),
-    file: UploadFile = File(..., description="Video file to be analyzed"),
     memory: ConversationBufferMemory = Depends(MemoryManager.MemoryDep),
 ) -> EmotionGroupResult:
 
-    # 임시 파일 생성: 확장자를 유지하며 임시 파일을 생성합니다.
-    suffix = os.path.splitext(file.filename or "")[-1] or ".mp4"
-    tmp_fd, tmp_path = tempfile.mkstemp(suffix=suffix)
+    service = EmotionAnalysisService(
+        memory=memory, 
+        session_id=x_session_id
+    )
 
     try:
-        with os.fdopen(tmp_fd, "wb") as f:
-            f.write(await file.read())
+        # 임시 파일 생성: 확장자를 유지하며 업로드를 받는 대로 임시 파일에 기록합니다.
+        async with spooled_upload(
+            request, 
+            max_bytes=MAX_VIDEO_UPLOAD_BYTES, 
+            suffix=".mp4",
+            keep_extension=True
+        ) as upload:
+            results = await service.aprocess_and_persist(
+                upload.path, 
+                upload.filename
+            )
+    except UploadTooLargeError as e:
+        raise HTTPException(
+            status_code=413,
+            detail=f"Video file is too large (limit {e.limit} bytes)"
+        )
+    except PoolSaturatedError as e:
+        raise HTTPException(
+            status_code=503,
+            detail=f"Emotion analysis is busy, retry later: {str(e)}"
+        )
+
+    return EmotionGroupResult(
+        file_name=upload.filename,
+        results=[EmotionGroupScore(**item) for item in results],
+    )
+
+
+@router.post(
+    "/emotion-analyzing/jobs",
+    response_model=JobStatus,
+    status_code=202,
+    tags=["Emotion"],
+    summary="Upload Video and Analyze Emotion in a background job",
+    openapi_extra=upload_openapi("Video file to be analyzed"),
+)
+async def submit_emotion_job(
+    request: Request,
+    x_session_id: str = Header(...),
+    memory: ConversationBufferMemory = Depends(MemoryManager.MemoryDep),
+) -> JobStatus:
 
-        service = EmotionAnalysisService(
-            memory=memory, 
-            session_id=x_session_id
+    try:
+        upload = await spool_upload(
+            request, 
+            max_bytes=MAX_VIDEO_UPLOAD_BYTES, 
+            suffix=".mp4",
+            keep_extension=True
         )
-        
-        results = service.process_and_persist(
-            tmp_path, 
-            file.filename
+    except UploadTooLargeError as e:
+        raise HTTPException(
+            status_code=413,
+            detail=f"Video file is too large (limit {e.limit} bytes)"
         )
 
+    file_name = upload.filename
+    service = EmotionAnalysisService(
+        memory=memory, 
+        session_id=x_session_id
+    )
+
+    async def run(progress: JobProgress) -> Dict[str, Any]:
+        # 워커 프로세스가 분석한 프레임 수를 공유 메모리로 받아 진행률로 기록
+        shared = SharedProgress()
+        try:
+            results = await progress.follow(
+                service.aprocess_and_persist(
+                    upload.path, 
+                    file_name, 
+                    progress=shared
+                ),
+                shared.read
+            )
+        finally:
+            shared.close()
+
         return EmotionGroupResult(
-            file_name=file.filename,
+            file_name=file_name,
             results=[EmotionGroupScore(**item) for item in results],
+        ).model_dump()
+
+    def cleanup() -> None:
+        remove_quietly(upload.path)
+        MemoryManager.release(x_session_id)
+
+    # 작업이 세션에 기록을 마칠 때까지 세션이 eviction 되지 않도록 고정
+    MemoryManager.acquire(x_session_id)
+    try:
+        job = job_manager.submit(
+            "emotion", 
+            run, 
+            session_id=x_session_id, 
+            unit="frames",
+            cleanup=cleanup
+        )
+    except JobQueueFullError as e:
+        cleanup()
+        raise HTTPException(
+            status_code=503,
+            detail=f"Job queue is full, retry later: {str(e)}"
         )
 
-    finally:
-        try:
-            os.remove(tmp_path)
-        except Exception:
-            pass
+    return to_job_status(job)
@@ -4,15 +4,22 @@ from fastapi import (
     Header,
     Body
 )
+from fastapi.responses import StreamingResponse
 from langchain.memory import ConversationBufferMemory
 
 from app.services.memory_logger import MemoryManager
 from app.models.evaluation import (
+    AnswerEvaluationBatchRequest,
+    AnswerEvaluationBatchResult,
     AnswerEvaluationRequest, 
     AnswerEvaluationResult,
+    AnswerWithFollowupRequest,
+    AnswerWithFollowupResult,
     SessionEvaluationResult,
 )
 from app.services.answer_evaluator import EvaluationService
+from app.services.speculative_followup import SpeculativeFollowupService
+from app.utils.sse import SSE_HEADERS
 
 router = APIRouter()
 
@@ -23,7 +30,7 @@ router = APIRouter()
     tags=["Evaluation"],
     summary="Evaluate User Answer"
 )
-def evaluate_answer(
+async def evaluate_answer(
     x_session_id: str = Header(...),
     req: AnswerEvaluationRequest = Body(...), 
     memory: ConversationBufferMemory = Depends(MemoryManager.MemoryDep)
@@ -34,19 +41,59 @@ def evaluate_answer(
         session_id=x_session_id
     )
 
-    return service.evaluate_answer(
+    return await service.aevaluate_answer(
         req, 
         memory
     )
 
 
+@router.post(
+    "/answer-evaluating/batch",
+    response_model=AnswerEvaluationBatchResult,
+    tags=["Evaluation"],
+    summary="Evaluate Multiple User Answers Concurrently"
+)
+async def evaluate_answers_batch(
+    x_session_id: str = Header(...),
+    req: AnswerEvaluationBatchRequest = Body(...),
+    memory: ConversationBufferMemory = Depends(MemoryManager.MemoryDep)
+) -> AnswerEvaluationBatchResult:
+
+    service = EvaluationService(
+        memory=memory,
+        session_id=x_session_id
+    )
+
+    return await service.aevaluate_answers(req.items)
+
+
+@router.post(
+    "/answer-evaluating-with-followup",
+    response_model=AnswerWithFollowupResult,
+    tags=["Evaluation"],
+    summary="Evaluate User Answer and Generate Follow-up Concurrently"
+)
+async def evaluate_answer_with_followup(
+    x_session_id: str = Header(...),
+    req: AnswerWithFollowupRequest = Body(...),
+    memory: ConversationBufferMemory = Depends(MemoryManager.MemoryDep)
+) -> AnswerWithFollowupResult:
+
+    service = SpeculativeFollowupService(
+        memory=memory,
+        session_id=x_session_id
+    )
+
+    return await service.aevaluate_with_followup(req, memory)
+
+
 @router.post(
     "/session-evaluating", 
     response_model=SessionEvaluationResult,
     tags=["Evaluation"],
     summary="Evaluate Entire Session"
 )
-def evaluate_session(
+async def evaluate_session(
     x_session_id: str = Header(...),
     memory: ConversationBufferMemory = Depends(MemoryManager.MemoryDep)
 ) -> SessionEvaluationResult:
@@ -56,4 +103,26 @@ def evaluate_session(
         session_id=x_session_id
     )
         
-    return service.evaluate_session(memory)
+    return await service.aevaluate_session(memory)
+
+
+@router.post(
+    "/session-evaluating/stream",
+    tags=["Evaluation"],
+    summary="Evaluate Entire Session (Server-Sent Events)"
+)
+async def stream_evaluate_session(
+    x_session_id: str = Header(...),
+    memory: ConversationBufferMemory = Depends(MemoryManager.MemoryDep)
+) -> StreamingResponse:
+
+    service = EvaluationService(
+        memory=memory,
+        session_id=x_session_id
+    )
+
+    return StreamingResponse(
+        service.astream_evaluate_session(memory),
+        media_type="text/event-stream",
+        headers=SSE_HEADERS,
+    )
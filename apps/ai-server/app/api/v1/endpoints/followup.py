@@ -1,10 +1,12 @@
 
 from fastapi import APIRouter, Body, Depends, Header
+from fastapi.responses import StreamingResponse
 from langchain.memory import ConversationBufferMemory
 
 from app.models.followup import FollowupRequest, FollowupResponse
 from app.services.followup_generator import FollowupGeneratorService
 from app.services.memory_logger import MemoryManager
+from app.utils.sse import SSE_HEADERS
 
 router = APIRouter()
 
@@ -15,11 +17,30 @@ router = APIRouter()
     tags=["Question"],
     summary="Generate Follow-up Question",
 )
-def generate_followup(
+async def generate_followup(
     x_session_id: str = Header(...),
     req: FollowupRequest = Body(...),
     memory: ConversationBufferMemory = Depends(MemoryManager.MemoryDep),
 ) -> FollowupResponse:
     service = FollowupGeneratorService(memory=memory, session_id=x_session_id)
 
-    return service.generate_followups(req, memory)
+    return await service.agenerate_followups(req, memory)
+
+
+@router.post(
+    "/followup-generating/stream",
+    tags=["Question"],
+    summary="Generate Follow-up Question (Server-Sent Events)",
+)
+async def stream_followup(
+    x_session_id: str = Header(...),
+    req: FollowupRequest = Body(...),
+    memory: ConversationBufferMemory = Depends(MemoryManager.MemoryDep),
+) -> StreamingResponse:
+    service = FollowupGeneratorService(memory=memory, session_id=x_session_id)
+
+    return StreamingResponse(
+        service.astream_followups(req, memory),
+        media_type="text/event-stream",
+        headers=SSE_HEADERS,
+    )
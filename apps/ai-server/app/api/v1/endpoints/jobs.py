@@ -0,0 +1,39 @@
+from typing import Any, Dict
+
+from fastapi import APIRouter, HTTPException
+
+from app.models.job import JobProgress, JobStatus
+from app.services.job_manager import Job, job_manager
+
+router = APIRouter()
+
+
+def to_job_status(job: Job) -> JobStatus:
+    return JobStatus(
+        job_id=job.job_id,
+        kind=job.kind,
+        status=job.status,
+        progress=JobProgress(done=job.done, total=job.total, unit=job.unit),
+        result=job.result,
+        error=job.error,
+        created_at=job.created_at,
+        started_at=job.started_at,
+        finished_at=job.finished_at,
+    )
+
+
+@router.get("/stats", tags=["Jobs"], summary="Get Job Queue Stats")
+def get_job_stats() -> Dict[str, Any]:
+
+    return job_manager.stats()
+
+
+@router.get(
+    "/{job_id}", response_model=JobStatus, tags=["Jobs"], summary="Get Job Status"
+)
+def get_job(job_id: str) -> JobStatus:
+
+    job = job_manager.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Job not found: {job_id}")
+    return to_job_status(job)
@@ -0,0 +1,46 @@
+from typing import Any, Dict
+
+from fastapi import APIRouter
+
+from app.utils.llm_utils import (
+    llm_cache_stats,
+    llm_rate_limit_stats,
+    llm_single_flight_stats,
+)
+from app.utils.prompt_registry import prompt_registry
+
+router = APIRouter()
+
+
+@router.get("/cache-stats", tags=["LLM"], summary="Get LLM Response Cache Stats")
+def get_llm_cache_stats() -> Dict[str, Any]:
+
+    return llm_cache_stats()
+
+
+@router.get(
+    "/single-flight-stats", tags=["LLM"], summary="Get LLM Request Coalescing Stats"
+)
+def get_llm_single_flight_stats() -> Dict[str, Any]:
+
+    return llm_single_flight_stats()
+
+
+@router.get(
+    "/rate-limit-stats", tags=["LLM"], summary="Get LLM Rate Limit Scheduler Stats"
+)
+def get_llm_rate_limit_stats() -> Dict[str, Any]:
+
+    return llm_rate_limit_stats()
+
+
+@router.get("/prompts", tags=["LLM"], summary="Get Loaded Prompt Templates")
+def get_prompt_stats() -> Dict[str, Any]:
+
+    return prompt_registry.stats()
+
+
+@router.post("/prompts/reload", tags=["LLM"], summary="Reload Prompt Templates")
+def reload_prompts() -> Dict[str, Any]:
+
+    return {"reloaded": prompt_registry.reload()}
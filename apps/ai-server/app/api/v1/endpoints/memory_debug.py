@@ -1,21 +1,26 @@
 from typing import (
     List, 
     Dict, 
-    Any
+    Any,
+    Optional
 )
 
 from fastapi import (
     APIRouter, 
     Depends, 
     Header, 
+    Query,
 )
 from langchain.memory import ConversationBufferMemory
 
 from app.models.memory import (
     Message,
-    MemoryDump
+    MemoryDump,
+    SessionEventList,
+    SessionEventOut
 )
 from app.services.memory_logger import MemoryManager 
+from app.services.session_events import get_event_log
 
 router = APIRouter()
 
@@ -68,3 +73,41 @@ def reset_memory(
         "ok": True, 
         "message": "memory cleared"
     }
+
+
+@router.get(
+    "/stats",
+    tags=["Session"],
+    summary="Get Session Store Stats"
+)
+def get_memory_stats() -> Dict[str, Any]:
+
+    return MemoryManager.stats()
+
+
+@router.get(
+    "/events",
+    response_model=SessionEventList,
+    tags=["Session"],
+    summary="Get Session Events"
+)
+def get_session_events(
+    type: Optional[str] = Query(None, description="이벤트 종류 (e.g. TAIL_QUESTION)"),
+    question_id: Optional[str] = Query(None, description="질문 ID"),
+    memory: ConversationBufferMemory = Depends(MemoryManager.MemoryDep),
+    x_session_id: str = Header(...),
+) -> SessionEventList:
+
+    events = get_event_log(memory).events(type, question_id)
+    return SessionEventList(
+        session_id=x_session_id,
+        events=[
+            SessionEventOut(
+                seq=ev.seq,
+                type=ev.type,
+                question_id=ev.question_id,
+                payload=ev.payload
+            )
+            for ev in events
+        ]
+    )
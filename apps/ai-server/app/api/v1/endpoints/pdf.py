@@ -1,44 +1,184 @@
+from typing import (
+    Any,
+    Dict
+)
+
 from fastapi import (
     APIRouter, 
-    File, 
-    UploadFile, 
     Depends,
-    Header
+    Header,
+    HTTPException,
+    Request
 )
+from fastapi.concurrency import run_in_threadpool
 from langchain.memory import ConversationBufferMemory
 
+from app.api.v1.endpoints.jobs import to_job_status
+from app.services.job_manager import (
+    JobProgress,
+    JobQueueFullError,
+    job_manager
+)
 from app.services.memory_logger import MemoryManager
-from app.models.pdf import PDFUploadResponse
-from app.services.pdf_processor import PDFAnalysisService
+from app.models.job import JobStatus
+from app.models.pdf import (
+    PDFPageReport,
+    PDFUploadResponse
+)
+from app.services.pdf_processor import (
+    PDFAnalysisService,
+    PDFParseResult,
+    pdf_cache
+)
+from app.utils.upload import (
+    MAX_PDF_UPLOAD_BYTES,
+    UploadTooLargeError,
+    remove_quietly,
+    spool_upload,
+    spooled_upload,
+    upload_openapi
+)
+from app.utils.worker_pool import PoolSaturatedError
 
 router = APIRouter() 
 
 
+def _to_response(
+    file_name: str, 
+    result: PDFParseResult
+) -> PDFUploadResponse:
+    
+    return PDFUploadResponse(
+        filename=file_name,
+        extracted_text=result.preprocessed_text,
+        cached=result.cached,
+        pages=[
+            PDFPageReport(
+                page=p.page, 
+                route=p.route, 
+                elapsed_ms=round(p.elapsed_ms, 1)
+            )
+            for p in result.pages
+        ]
+    )
+
+
 @router.post(
     "/pdf-text-parsing", 
     response_model=PDFUploadResponse,
     tags=["PDF"],
-    summary="Upload PDF and extract preprocessed text"
+    summary="Upload PDF and extract preprocessed text",
+    openapi_extra=upload_openapi("PDF file to be parsed")
 )
 async def parse_pdf(
+    request: Request,
     x_session_id: str = Header(...),
-    file: UploadFile = File(..., description="PDF file to be parsed"), 
     memory: ConversationBufferMemory = Depends(MemoryManager.MemoryDep),
 ) -> PDFUploadResponse:
     
-    file_bytes = await file.read()
-    
     service = PDFAnalysisService(
         memory=memory, 
         session_id=x_session_id
     )
     
-    results = service.process_and_persist(
-        file_bytes=file_bytes, 
-        file_name=file.filename
-    )
+    try:
+        async with spooled_upload(
+            request, 
+            max_bytes=MAX_PDF_UPLOAD_BYTES, 
+            suffix=".pdf"
+        ) as upload:
+            # 텍스트 추출/OCR 대기는 스레드에서 실행해 이벤트 루프를 막지 않는다
+            result = await run_in_threadpool(
+                service.process_and_persist,
+                file_name=upload.filename,
+                file_path=upload.path,
+                file_sha256=upload.sha256
+            )
+    except UploadTooLargeError as e:
+        raise HTTPException(
+            status_code=413,
+            detail=f"PDF file is too large (limit {e.limit} bytes)"
+        )
+    except PoolSaturatedError as e:
+        raise HTTPException(
+            status_code=503,
+            detail=f"PDF OCR is busy, retry later: {str(e)}"
+        )
 
-    return PDFUploadResponse(
-        filename=file.filename,
-        extracted_text=results
+    return _to_response(upload.filename, result)
+
+
+@router.post(
+    "/pdf-text-parsing/jobs", 
+    response_model=JobStatus,
+    status_code=202,
+    tags=["PDF"],
+    summary="Upload PDF and parse it in a background job",
+    openapi_extra=upload_openapi("PDF file to be parsed")
+)
+async def submit_pdf_parsing_job(
+    request: Request,
+    x_session_id: str = Header(...),
+    memory: ConversationBufferMemory = Depends(MemoryManager.MemoryDep),
+) -> JobStatus:
+    
+    try:
+        upload = await spool_upload(
+            request, 
+            max_bytes=MAX_PDF_UPLOAD_BYTES, 
+            suffix=".pdf"
+        )
+    except UploadTooLargeError as e:
+        raise HTTPException(
+            status_code=413,
+            detail=f"PDF file is too large (limit {e.limit} bytes)"
+        )
+
+    file_name = upload.filename
+    service = PDFAnalysisService(
+        memory=memory, 
+        session_id=x_session_id
     )
+
+    async def run(progress: JobProgress) -> Dict[str, Any]:
+        result = await run_in_threadpool(
+            service.process_and_persist,
+            file_name=file_name,
+            file_path=upload.path,
+            file_sha256=upload.sha256,
+            progress=progress.update
+        )
+        return _to_response(file_name, result).model_dump()
+
+    def cleanup() -> None:
+        remove_quietly(upload.path)
+        MemoryManager.release(x_session_id)
+
+    # 작업이 세션에 기록을 마칠 때까지 세션이 eviction 되지 않도록 고정
+    MemoryManager.acquire(x_session_id)
+    try:
+        job = job_manager.submit(
+            "pdf", 
+            run, 
+            session_id=x_session_id, 
+            unit="pages",
+            cleanup=cleanup
+        )
+    except JobQueueFullError as e:
+        cleanup()
+        raise HTTPException(
+            status_code=503,
+            detail=f"Job queue is full, retry later: {str(e)}"
+        )
+
+    return to_job_status(job)
+
+
+@router.get(
+    "/cache-stats",
+    tags=["PDF"],
+    summary="Get PDF Parse Cache Stats"
+)
+def get_pdf_cache_stats() -> Dict[str, Any]:
+
+    return pdf_cache.stats()
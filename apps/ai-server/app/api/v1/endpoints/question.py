@@ -4,7 +4,8 @@ from fastapi import (
     APIRouter, 
     Depends,
     Header,
-    Body
+    Body,
+    Response
 )
 from langchain.memory import ConversationBufferMemory
 
@@ -24,7 +25,8 @@ router = APIRouter()
     tags=["Question"],
     summary="Generate Interview Questions"
 )
-def generate_question(
+async def generate_question(
+    response: Response,
     x_session_id: str = Header(...),
     req: QuestionRequest = Body(...), 
     memory: ConversationBufferMemory = Depends(MemoryManager.MemoryDep)
@@ -35,8 +37,18 @@ def generate_question(
         session_id=x_session_id
     )
     
-    return service.generate_questions(
+    questions = await service.agenerate_questions(
         req.user_info, 
         req.constraints, 
         memory=memory
-    )
\ No newline at end of file
+    )
+
+    # 프롬프트 예상 토큰 수 (자기소개서 / 포트폴리오 압축 전 → 후)
+    report = service.prompt_budget
+    if report is not None:
+        response.headers["X-Prompt-Tokens-Before"] = str(report.tokens_before)
+        response.headers["X-Prompt-Tokens"] = str(report.tokens_after)
+        if report.steps:
+            response.headers["X-Prompt-Compaction"] = ",".join(report.steps)
+
+    return questions
\ No newline at end of file
@@ -1,29 +1,172 @@
-from fastapi import FastAPI
-
-from app.api.v1.endpoints import (
-    evaluation,
-    followup,
-    memory_debug,
-    pdf,
-    question,
-    session_log,
-    emotion,
-)
+import argparse
+import importlib
+import os
+from contextlib import asynccontextmanager
+from typing import Iterable, List, Optional
+
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse
 
-app = FastAPI(
-    title="AIew",
-    version="1.0.0"
+from app.utils.llm_utils import (
+    LLMCacheBypassMiddleware,
+    RateLimitedError,
+    aclose_groq_clients,
 )
+from app.utils.upload import (
+    MAX_PDF_UPLOAD_BYTES,
+    MAX_VIDEO_UPLOAD_BYTES,
+    UploadSizeLimitMiddleware,
+)
+from app.utils.worker_pool import shutdown_pools
+
+# 기능 그룹별 라우터 (module, prefix, tags)
+# 그룹에 해당하는 모듈만 import 되므로 무거운 의존성(fitz, pytesseract, cv2 등)은
+# 해당 그룹을 켠 워커에서만 로드된다.
+CAPABILITY_ROUTERS = {
+    "session": [
+        ("app.api.v1.endpoints.session_log", "/api/v1/session-log", ["Session"]),
+        ("app.api.v1.endpoints.memory_debug", "/api/v1/memory-debug", ["Session"]),
+    ],
+    "pdf": [
+        ("app.api.v1.endpoints.pdf", "/api/v1/pdf", ["PDF"]),
+        ("app.api.v1.endpoints.jobs", "/api/v1/jobs", ["Jobs"]),
+    ],
+    "llm": [
+        ("app.api.v1.endpoints.question", "/api/v1/question", ["Question"]),
+        ("app.api.v1.endpoints.evaluation", "/api/v1/evaluation", ["Evaluation"]),
+        ("app.api.v1.endpoints.followup", "/api/v1/followup", ["Question"]),
+        ("app.api.v1.endpoints.llm_debug", "/api/v1/llm-debug", ["LLM"]),
+    ],
+    "emotion": [
+        ("app.api.v1.endpoints.emotion", "/api/v1/emotion", ["Emotion"]),
+        ("app.api.v1.endpoints.jobs", "/api/v1/jobs", ["Jobs"]),
+    ],
+}
+
+# 예: AIEW_CAPABILITIES=session,llm  → 가벼운 LLM/세션 로그 전용 워커
+AIEW_CAPABILITIES = os.getenv("AIEW_CAPABILITIES", "all")
+
+
+def parse_capabilities(value: Optional[str] = None) -> List[str]:
+    value = (value or "all").strip().lower()
+    if value == "all":
+        return list(CAPABILITY_ROUTERS)
+
+    capabilities = [c.strip() for c in value.split(",") if c.strip()]
+    unknown = [c for c in capabilities if c not in CAPABILITY_ROUTERS]
+    if unknown:
+        raise ValueError(
+            f"Unknown capabilities: {', '.join(unknown)} "
+            f"(available: {', '.join(CAPABILITY_ROUTERS)})"
+        )
+    return [c for c in CAPABILITY_ROUTERS if c in capabilities]
+
+
+def create_app(capabilities: Optional[Iterable[str]] = None) -> FastAPI:
+    enabled = (
+        parse_capabilities(AIEW_CAPABILITIES)
+        if capabilities is None
+        else parse_capabilities(",".join(capabilities))
+    )
+
+    @asynccontextmanager
+    async def lifespan(app: FastAPI):
+        if "emotion" in enabled:
+            from app.services.emotion_analyst import (
+                EMOTION_WARMUP,
+                warmup_emotion_pool,
+            )
+
+            if EMOTION_WARMUP:
+                warmup_emotion_pool()
+        yield
+        if "pdf" in enabled or "emotion" in enabled:
+            from app.services.job_manager import job_manager
+
+            await job_manager.shutdown()
+        await aclose_groq_clients()
+        shutdown_pools()
+
+        from app.services.memory_logger import MemoryManager
+
+        MemoryManager.close()
+
+    app = FastAPI(
+        title="AIew",
+        version="1.0.0",
+        lifespan=lifespan
+    )
+
+    # 업로드 엔드포인트는 본문을 읽기 전에 Content-Length 로 크기 초과를 거절
+    upload_limits = {}
+    if "pdf" in enabled:
+        upload_limits["/api/v1/pdf/"] = MAX_PDF_UPLOAD_BYTES
+    if "emotion" in enabled:
+        upload_limits["/api/v1/emotion/"] = MAX_VIDEO_UPLOAD_BYTES
+    if upload_limits:
+        app.add_middleware(UploadSizeLimitMiddleware, limits=upload_limits)
+    if "llm" in enabled:
+        app.add_middleware(LLMCacheBypassMiddleware)
+
+        @app.exception_handler(RateLimitedError)
+        async def rate_limited_handler(request: Request, exc: RateLimitedError):
+            # LLM 호출 예산 초과: 클라이언트가 retry-after 후 다시 시도
+            return JSONResponse(
+                status_code=503,
+                content={"detail": str(exc)},
+                headers={"Retry-After": str(max(1, round(exc.retry_after)))},
+            )
+
+    included = set()
+    for capability in enabled:
+        for module_name, prefix, tags in CAPABILITY_ROUTERS[capability]:
+            if module_name in included:
+                continue  # 여러 그룹이 공유하는 라우터 (e.g. jobs)
+            included.add(module_name)
+            module = importlib.import_module(module_name)
+            app.include_router(module.router, prefix=prefix, tags=tags)
+
+    @app.get("/")
+    def read_root():
+        return {"message": "AIew API is running", "capabilities": enabled}
+
+    return app
+
+
+def __getattr__(name: str):
+    # `uvicorn app.main:app` 용 기본 앱: AIEW_CAPABILITIES 기준으로 첫 접근 시 생성
+    # (`python -m app.main` 실행 시 CLI 인자를 적용하기 전에 라우터를 import 하지 않도록)
+    if name == "app":
+        globals()["app"] = create_app()
+        return globals()["app"]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def main() -> None:
+    import uvicorn
+
+    parser = argparse.ArgumentParser(description="Run the AIew AI server")
+    parser.add_argument(
+        "--capabilities",
+        default=AIEW_CAPABILITIES,
+        help=f"all or a comma separated subset of: {', '.join(CAPABILITY_ROUTERS)}",
+    )
+    parser.add_argument("--host", default="0.0.0.0")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--workers", type=int, default=1)
+    args = parser.parse_args()
 
-app.include_router(session_log.router, prefix="/api/v1/session-log", tags=["Session"])
-app.include_router(memory_debug.router, prefix="/api/v1/memory-debug", tags=["Session"])
-app.include_router(pdf.router, prefix="/api/v1/pdf", tags=["PDF"])
-app.include_router(question.router, prefix="/api/v1/question", tags=["Question"])
-app.include_router(evaluation.router, prefix="/api/v1/evaluation", tags=["Evaluation"])
-app.include_router(followup.router, prefix="/api/v1/followup", tags=["Question"])
-app.include_router(emotion.router, prefix="/api/v1/emotion", tags=["Emotion"])
+    # uvicorn 워커 프로세스에서도 동일한 설정으로 create_app 이 호출되도록 env 로 전달
+    os.environ["AIEW_CAPABILITIES"] = ",".join(parse_capabilities(args.capabilities))
+    uvicorn.run(
+        "app.main:create_app",
+        factory=True,
+        host=args.host,
+        port=args.port,
+        workers=args.workers,
+        proxy_headers=True,
+    )
 
 
-@app.get("/")
-def read_root():
-    return {"message": "AIew API is running"}
+if __name__ == "__main__":
+    main()
@@ -8,6 +8,8 @@ from pydantic import (
     Field
 )
 
+from app.models.followup import FollowupResponse
+
 
 class TailDecision(str, Enum):
     create = "create"
@@ -97,4 +99,52 @@ class SessionEvaluationResult(BaseModel):
                 "session_feedback": "이번 세션에서 전반적으로 우수한 답변을 제공하셨습니다. 특히 기술적 질문에 대한 깊이 있는 이해와 명확한 설명이 돋보였습니다. 다만, 일부 질문에서는 더 구체적인 근거와 예시를 제시하면 더욱 향상될 수 있습니다. 앞으로도 이러한 강점을 유지하면서 개선할 부분에 집중하시면 좋겠습니다. 전체적으로 매우 긍정적인 평가를 드립니다."
             }                                                                                                                                                                                                                                                                                                                                                                                           
         }
-    }
\ No newline at end of file
+    }
+
+
+class AnswerWithFollowupRequest(AnswerEvaluationRequest):
+    depth: int = Field(
+        1, ge=1, le=3, description="꼬리질문 추궁 강도(1=가벼움, 3=깊게)"
+    )
+    auto_sequence: bool = Field(
+        True, description="True면 기존 꼬리질문 수를 기준으로 fu 번호 자동 증가"
+    )
+    next_followup_index: Optional[int] = Field(
+        None,
+        ge=1,
+        description="수동으로 fu 인덱스 지정(q3-fu{index}). auto_sequence=True면 무시",
+    )
+
+
+class AnswerWithFollowupResult(BaseModel):
+    evaluation: AnswerEvaluationResult
+    followup: Optional[FollowupResponse] = Field(
+        None, description="tail_decision 이 create 인 경우의 꼬리질문"
+    )
+    followup_error: Optional[str] = Field(
+        None, description="꼬리질문 생성 실패 사유 (평가 결과는 유효)"
+    )
+
+
+class AnswerEvaluationBatchRequest(BaseModel):
+    items: List[AnswerEvaluationRequest] = Field(
+        ..., min_length=1, max_length=50, description="평가할 답변 목록 (질문 순서대로)"
+    )
+
+
+class BatchItemError(BaseModel):
+    type: str = Field(..., description="예외 종류 (예: ValueError)")
+    message: str = Field(..., description="실패 사유")
+
+
+class AnswerEvaluationBatchItem(BaseModel):
+    index: int = Field(..., ge=0, description="요청 items 내 위치")
+    question_id: str = Field(..., description="평가 대상 질문 ID")
+    result: Optional[AnswerEvaluationResult] = Field(None, description="평가 결과 (성공 시)")
+    error: Optional[BatchItemError] = Field(None, description="실패 사유 (실패 시)")
+
+
+class AnswerEvaluationBatchResult(BaseModel):
+    succeeded: int = Field(..., ge=0, description="평가에 성공한 항목 수")
+    failed: int = Field(..., ge=0, description="평가에 실패한 항목 수")
+    items: List[AnswerEvaluationBatchItem] = Field(default_factory=list)
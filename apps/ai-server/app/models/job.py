@@ -0,0 +1,23 @@
+from typing import Any, Literal, Optional
+
+from pydantic import BaseModel, Field
+
+
+class JobProgress(BaseModel):
+    done: int = Field(0, description="처리한 단위 수 (페이지 / 프레임)")
+    total: int = Field(0, description="전체 단위 수 (영상은 목표 샘플 수 기준 추정치)")
+    unit: str = Field("", description="진행률 단위 (pages | frames)")
+
+
+class JobStatus(BaseModel):
+    job_id: str = Field(..., description="작업 ID")
+    kind: str = Field(..., description="작업 종류 (pdf | emotion)")
+    status: Literal["queued", "running", "succeeded", "failed"]
+    progress: JobProgress
+    result: Optional[Any] = Field(
+        None, description="완료된 경우 동기 API 와 같은 형식의 응답"
+    )
+    error: Optional[str] = Field(None, description="실패 사유")
+    created_at: float
+    started_at: Optional[float] = None
+    finished_at: Optional[float] = None
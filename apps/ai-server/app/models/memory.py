@@ -1,6 +1,8 @@
 from typing import (
+    Any,
     List, 
-    Literal
+    Literal,
+    Optional
 )
 from pydantic import (
     BaseModel,
@@ -28,4 +30,15 @@ class ShownQuestion(BaseModel):
 class UserAnswer(BaseModel):
     question_id: str = Field(..., pattern=r"^q\d+(-fu\d+)?$")
     answer: str = Field(..., description="User's Answer Text")
-    answer_duration_sec: int = Field(..., description="Time taken to answer in seconds")
\ No newline at end of file
+    answer_duration_sec: int = Field(..., description="Time taken to answer in seconds")
+
+class SessionEventOut(BaseModel):
+    seq: int = Field(..., description="세션 내 이벤트 순번")
+    type: str = Field(..., description="이벤트 종류 (e.g. ANSWER_EVALUATION)")
+    question_id: Optional[str] = Field(None, description="이벤트가 속한 질문 ID")
+    payload: Any = Field(None, description="기록된 payload")
+
+
+class SessionEventList(BaseModel):
+    session_id: str = Field(..., description="세션 ID")
+    events: List[SessionEventOut] = Field(..., description="조건에 맞는 이벤트 목록")
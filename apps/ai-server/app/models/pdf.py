@@ -1,6 +1,20 @@
-from pydantic import BaseModel
+from typing import List, Literal
+
+from pydantic import BaseModel, Field
+
+
+class PDFPageReport(BaseModel):
+    page: int = Field(..., description="페이지 번호 (1부터)")
+    route: Literal["text", "ocr"] = Field(..., description="텍스트 레이어 사용 / OCR")
+    elapsed_ms: float = Field(
+        ..., description="페이지 텍스트 추출 (OCR 이면 렌더링 + OCR) 소요 시간 (ms)"
+    )
 
 
 class PDFUploadResponse(BaseModel):
     filename: str
     extracted_text: str
+    cached: bool = Field(False, description="파싱 결과 캐시 적중 여부")
+    pages: List[PDFPageReport] = Field(
+        default_factory=list, description="페이지별 추출 경로 및 진단 정보"
+    )
@@ -1,26 +1,37 @@
+import asyncio
 import json
-from typing import Any, Dict, List, Optional
+import os
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
 
 from langchain.memory import ConversationBufferMemory
-from langchain.prompts import PromptTemplate
 
 from app.models.evaluation import (
+    AnswerEvaluationBatchItem,
+    AnswerEvaluationBatchResult,
     AnswerEvaluationRequest,
     AnswerEvaluationResult,
+    BatchItemError,
     SessionEvaluationResult,
 )
 from app.services.memory_logger import MemoryLogger
 from app.utils.extract_evaluation import extract_evaluation
 from app.utils.llm_utils import (
     PROMPT_BASE_DIR,
+    agroq_chat,
+    agroq_chat_stream,
     groq_chat,
-    load_prompt_template,
     strip_json,
 )
+from app.utils.prompt_registry import prompt_registry
+from app.utils.rate_limiter import PRIORITY_BATCH
+from app.utils.sse import stream_completion_events
 
 PROMPT_PATH = (PROMPT_BASE_DIR / "evaluation_prompt.txt").resolve()
 SESSION_PROMPT_PATH = (PROMPT_BASE_DIR / "session_evaluation_prompt.txt").resolve()
 
+# 일괄 평가에서 동시에 진행하는 LLM 호출 수
+EVALUATION_BATCH_CONCURRENCY = int(os.getenv("EVALUATION_BATCH_CONCURRENCY", "4"))
+
 
 class EvaluationService:
     def __init__(self, memory: ConversationBufferMemory = None, session_id: str = ""):
@@ -218,23 +229,7 @@ class EvaluationService:
 
         return item
 
-    def evaluate_answer(
-        self,
-        req: AnswerEvaluationRequest = ...,
-        memory: Optional[ConversationBufferMemory] = ...,
-    ) -> AnswerEvaluationResult:
-        # 0. '답변 누락 / 실질적 내용 없음' 예외 처리 → LLM 호출 생략
-        if self._is_truly_empty_answer(req.user_answer):
-            forced = self._build_forced_empty_result(req)
-            forced = self._preprocess_parsed_answer(forced)
-            eval_result = AnswerEvaluationResult.model_validate(forced)
-            self.logger.log_evaluation(eval_result.model_dump())
-            return eval_result
-
-        # 1. 정상 케이스 → LLM 프롬프트 구성 및 호출
-        raw_prompt = load_prompt_template(PROMPT_PATH)
-        prompt_template = PromptTemplate.from_template(raw_prompt)
-
+    def _build_answer_prompt(self, req: AnswerEvaluationRequest) -> str:
         category_for_prompt = "tailored" if req.use_tailored_category else req.category
 
         vars: Dict[str, Any] = {
@@ -253,8 +248,18 @@ class EvaluationService:
             else "null",
         }
 
-        prompt_text = prompt_template.format(**vars)
-        content = groq_chat(prompt_text, max_tokens=2048)
+        return prompt_registry.render(PROMPT_PATH, **vars)
+
+    def _evaluate_empty_answer(
+        self, req: AnswerEvaluationRequest
+    ) -> AnswerEvaluationResult:
+        forced = self._build_forced_empty_result(req)
+        forced = self._preprocess_parsed_answer(forced)
+        eval_result = AnswerEvaluationResult.model_validate(forced)
+        self.logger.log_evaluation(eval_result.model_dump())
+        return eval_result
+
+    def _finalize_answer(self, content: str) -> AnswerEvaluationResult:
         json_text = strip_json(content)
 
         try:
@@ -270,18 +275,18 @@ class EvaluationService:
 
         return eval_result
 
-    def evaluate_session(
+    def _build_session_prompt(
         self, memory: ConversationBufferMemory
-    ) -> SessionEvaluationResult:
+    ) -> Tuple[str, float]:
         avg_score, conversation_text = extract_evaluation(memory)
 
-        raw_prompt = load_prompt_template(SESSION_PROMPT_PATH)
-        prompt_template = PromptTemplate.from_template(raw_prompt)
-
         vars = {"conversation": conversation_text, "avg_score": avg_score}
 
-        prompt_text = prompt_template.format(**vars)
-        content = groq_chat(prompt_text, max_tokens=2048)
+        return prompt_registry.render(SESSION_PROMPT_PATH, **vars), float(avg_score)
+
+    def _finalize_session(
+        self, content: str, avg_score: float
+    ) -> SessionEvaluationResult:
         json_text = strip_json(content)
 
         try:
@@ -291,9 +296,119 @@ class EvaluationService:
                 f"LLM 세션 평가 응답이 JSON 형식이 아닙니다.\n Raw JSON: {json_text}"
             )
 
-        float_avg_score = float(avg_score)
-        parsed = self._preprocess_parsed_session(parsed, float_avg_score)
+        parsed = self._preprocess_parsed_session(parsed, avg_score)
         eval_result = SessionEvaluationResult.model_validate(parsed)
         self.logger.log_evaluation(eval_result.model_dump())
 
         return eval_result
+
+    def evaluate_answer(
+        self,
+        req: AnswerEvaluationRequest = ...,
+        memory: Optional[ConversationBufferMemory] = ...,
+    ) -> AnswerEvaluationResult:
+        # 0. '답변 누락 / 실질적 내용 없음' 예외 처리 → LLM 호출 생략
+        if self._is_truly_empty_answer(req.user_answer):
+            return self._evaluate_empty_answer(req)
+
+        # 1. 정상 케이스 → LLM 프롬프트 구성 및 호출
+        prompt_text = self._build_answer_prompt(req)
+        content = groq_chat(prompt_text, max_tokens=2048)
+
+        return self._finalize_answer(content)
+
+    async def aevaluate_answer(
+        self,
+        req: AnswerEvaluationRequest = ...,
+        memory: Optional[ConversationBufferMemory] = ...,
+    ) -> AnswerEvaluationResult:
+        if self._is_truly_empty_answer(req.user_answer):
+            return self._evaluate_empty_answer(req)
+
+        prompt_text = self._build_answer_prompt(req)
+        content = await agroq_chat(prompt_text, max_tokens=2048)
+
+        return self._finalize_answer(content)
+
+    async def aevaluate_answers(
+        self,
+        reqs: List[AnswerEvaluationRequest] = ...,
+        concurrency: int = EVALUATION_BATCH_CONCURRENCY,
+    ) -> AnswerEvaluationBatchResult:
+        """
+        여러 답변을 최대 concurrency 개씩 동시에 평가한다 (세션 전체 재평가 / 오프라인 채점용).
+
+        - 답변 누락은 LLM 호출 없이 규칙 기반으로 평가
+        - 평가 결과는 모든 호출이 끝난 뒤 요청 순서(질문 순서)대로 메모리에 기록
+        - 항목별 실패(LLM 오류, JSON / 검증 실패)는 전체를 실패시키지 않고 error 로 반환
+        """
+
+        semaphore = asyncio.Semaphore(max(1, concurrency))
+
+        async def generate(req: AnswerEvaluationRequest) -> Optional[str]:
+            if self._is_truly_empty_answer(req.user_answer):
+                return None
+            async with semaphore:
+                return await agroq_chat(
+                    self._build_answer_prompt(req),
+                    max_tokens=2048,
+                    priority=PRIORITY_BATCH,
+                )
+
+        contents = await asyncio.gather(
+            *(generate(req) for req in reqs), return_exceptions=True
+        )
+
+        items: List[AnswerEvaluationBatchItem] = []
+        for index, (req, content) in enumerate(zip(reqs, contents)):
+            item = AnswerEvaluationBatchItem(index=index, question_id=req.question_id)
+            try:
+                if isinstance(content, BaseException):
+                    raise content
+                item.result = (
+                    self._evaluate_empty_answer(req)
+                    if content is None
+                    else self._finalize_answer(content)
+                )
+            except Exception as e:
+                item.error = BatchItemError(type=type(e).__name__, message=str(e))
+            items.append(item)
+
+        failed = sum(1 for item in items if item.error is not None)
+        return AnswerEvaluationBatchResult(
+            succeeded=len(items) - failed,
+            failed=failed,
+            items=items,
+        )
+
+    def evaluate_session(
+        self, memory: ConversationBufferMemory
+    ) -> SessionEvaluationResult:
+        prompt_text, avg_score = self._build_session_prompt(memory)
+        content = groq_chat(prompt_text, max_tokens=2048, priority=PRIORITY_BATCH)
+
+        return self._finalize_session(content, avg_score)
+
+    async def aevaluate_session(
+        self, memory: ConversationBufferMemory
+    ) -> SessionEvaluationResult:
+        prompt_text, avg_score = self._build_session_prompt(memory)
+        content = await agroq_chat(
+            prompt_text, max_tokens=2048, priority=PRIORITY_BATCH
+        )
+
+        return self._finalize_session(content, avg_score)
+
+    def astream_evaluate_session(
+        self, memory: ConversationBufferMemory
+    ) -> AsyncIterator[str]:
+        """세션 평가 생성 과정을 SSE 이벤트로 중계 (마지막 result 이벤트가 SessionEvaluationResult)"""
+
+        prompt_text, avg_score = self._build_session_prompt(memory)
+        deltas = agroq_chat_stream(
+            prompt_text, max_tokens=2048, priority=PRIORITY_BATCH
+        )
+
+        return stream_completion_events(
+            deltas, lambda content: self._finalize_session(content, avg_score)
+        )
@@ -1,13 +1,32 @@
 import json
+import os
 from typing import (
     Any,
     Dict, 
-    List
+    List,
+    Optional
 )
 
 from langchain.memory import ConversationBufferMemory
 
-from app.utils.video_analysis import video_analysis
+from app.utils import video_worker
+from app.utils.worker_pool import BoundedProcessPool, SharedProgress
+
+EMOTION_POOL_SIZE = int(os.getenv("EMOTION_POOL_SIZE", "1"))
+EMOTION_QUEUE_DEPTH = int(os.getenv("EMOTION_QUEUE_DEPTH", "4"))
+# 1이면 서버 시작 시 감정 분석 워커를 미리 띄워 FER 모델을 로드
+EMOTION_WARMUP = os.getenv("EMOTION_WARMUP", "0") == "1"
+
+emotion_pool = BoundedProcessPool(
+    name="emotion",
+    max_workers=EMOTION_POOL_SIZE,
+    queue_depth=EMOTION_QUEUE_DEPTH,
+    initializer=video_worker.init_worker,
+)
+
+
+def warmup_emotion_pool() -> None:
+    emotion_pool.warmup(video_worker.ping)
 
 
 class EmotionAnalysisService:
@@ -41,11 +60,36 @@ class EmotionAnalysisService:
         file_name: str = ""
     ) -> List[Dict]:
         
-        results = video_analysis(file_path)
+        results = video_worker.analyze(file_path)
         if results:
             self._save_results_to_memory(
                 file_name, 
                 results
             )
         
-        return results
\ No newline at end of file
+        return results
+
+    async def aprocess_and_persist(
+        self,
+        file_path: str = "",
+        file_name: str = "",
+        progress: Optional[SharedProgress] = None
+    ) -> List[Dict]:
+        """
+        영상 분석을 감정 분석 프로세스 풀에서 실행하고 결과를 기다린다.
+        progress 가 주어지면 워커가 분석한 프레임 수를 기록한다.
+        풀이 가득 찬 경우 PoolSaturatedError 가 발생한다.
+        """
+
+        results = await emotion_pool.run(
+            video_worker.analyze,
+            file_path,
+            progress.name if progress is not None else None
+        )
+        if results:
+            self._save_results_to_memory(
+                file_name,
+                results
+            )
+
+        return results
@@ -1,17 +1,20 @@
 import json
-from typing import Any, Dict, List, Optional
+from typing import Any, AsyncIterator, Dict, List, Optional
 
 from langchain.memory import ConversationBufferMemory
-from langchain.prompts import PromptTemplate
 
 from app.models.followup import FollowupRequest, FollowupResponse
 from app.services.memory_logger import MemoryLogger
+from app.services.session_events import get_event_log
 from app.utils.llm_utils import (
     PROMPT_BASE_DIR,
+    agroq_chat,
+    agroq_chat_stream,
     groq_chat,
-    load_prompt_template,
     strip_json,
 )
+from app.utils.prompt_registry import prompt_registry
+from app.utils.sse import stream_completion_events
 
 PROMPT_PATH = (PROMPT_BASE_DIR / "followup_prompt.txt").resolve()
 
@@ -31,19 +34,7 @@ class FollowupGeneratorService:
     ) -> int:
         if memory is None:
             return 0
-        msgs = getattr(memory, "chat_memory", None)
-        if not msgs or not getattr(msgs, "messages", None):
-            return 0
-        cnt = 0
-        for m in msgs.messages:
-            content = str(getattr(m, "content", ""))
-            if (
-                '"parent_question_id"' in content
-                and f'"{parent_qid}"' in content
-                and '"followup_id"' in content
-            ):
-                cnt += 1
-        return cnt
+        return get_event_log(memory).count("TAIL_QUESTION", parent_qid)
 
     def _preprocess_parsed(self, item: Dict[str, Any]) -> Dict[str, Any]:
         key_time = "expected_answer_time_sec"
@@ -123,14 +114,7 @@ class FollowupGeneratorService:
 
         return out
 
-    def generate_followups(
-        self,
-        req: FollowupRequest = ...,
-        memory: Optional[ConversationBufferMemory] = ...,
-    ) -> List[FollowupResponse]:
-        raw_prompt = load_prompt_template(PROMPT_PATH)
-        prompt_template = PromptTemplate.from_template(raw_prompt)
-
+    def _build_prompt(self, req: FollowupRequest) -> str:
         category_for_prompt = "tailored" if req.use_tailored_category else req.category
         vars = {
             "question_id": req.question_id,
@@ -149,11 +133,14 @@ class FollowupGeneratorService:
             "depth": req.depth,
         }
 
-        prompt_text = prompt_template.format(**vars)
-        content = groq_chat(
-            prompt_text,
-            max_tokens=2048,
-        )
+        return prompt_registry.render(PROMPT_PATH, **vars)
+
+    def _finalize(
+        self,
+        content: str,
+        req: FollowupRequest,
+        memory: Optional[ConversationBufferMemory] = None,
+    ) -> FollowupResponse:
         json_text = strip_json(content)
 
         try:
@@ -169,3 +156,43 @@ class FollowupGeneratorService:
         self.logger.log_tail_question(followup.model_dump())
 
         return followup
+
+    def generate_followups(
+        self,
+        req: FollowupRequest = ...,
+        memory: Optional[ConversationBufferMemory] = ...,
+    ) -> FollowupResponse:
+        prompt_text = self._build_prompt(req)
+        content = groq_chat(
+            prompt_text,
+            max_tokens=2048,
+        )
+
+        return self._finalize(content, req, memory)
+
+    async def agenerate_followups(
+        self,
+        req: FollowupRequest = ...,
+        memory: Optional[ConversationBufferMemory] = ...,
+    ) -> FollowupResponse:
+        prompt_text = self._build_prompt(req)
+        content = await agroq_chat(
+            prompt_text,
+            max_tokens=2048,
+        )
+
+        return self._finalize(content, req, memory)
+
+    def astream_followups(
+        self,
+        req: FollowupRequest = ...,
+        memory: Optional[ConversationBufferMemory] = ...,
+    ) -> AsyncIterator[str]:
+        """꼬리 질문 생성 과정을 SSE 이벤트로 중계 (마지막 result 이벤트가 FollowupResponse)"""
+
+        prompt_text = self._build_prompt(req)
+        deltas = agroq_chat_stream(prompt_text, max_tokens=2048)
+
+        return stream_completion_events(
+            deltas, lambda content: self._finalize(content, req, memory)
+        )
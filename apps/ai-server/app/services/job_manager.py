@@ -0,0 +1,308 @@
+import asyncio
+import json
+import os
+import sqlite3
+import threading
+import time
+import uuid
+from abc import ABC, abstractmethod
+from dataclasses import asdict, dataclass, replace
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+from app.utils.worker_pool import PoolSaturatedError
+
+JOB_BACKEND = os.getenv("JOB_BACKEND", "memory")
+JOB_SQLITE_PATH = os.getenv("JOB_SQLITE_PATH", "/tmp/aiew-jobs.sqlite3")
+# 동시에 실행하는 작업 수 / 실행 대기 가능한 작업 수 (초과 시 제출 거절)
+JOB_MAX_CONCURRENCY = int(os.getenv("JOB_MAX_CONCURRENCY", "2"))
+JOB_QUEUE_DEPTH = int(os.getenv("JOB_QUEUE_DEPTH", "16"))
+# 끝난 작업 상태를 보관하는 시간
+JOB_TTL_SEC = int(os.getenv("JOB_TTL_SEC", "3600"))
+# 실행 중 프로세스 풀이 가득 찬 경우 재시도 간격 / 최대 대기 시간
+JOB_BUSY_RETRY_SEC = 0.5
+JOB_BUSY_MAX_WAIT_SEC = float(os.getenv("JOB_BUSY_MAX_WAIT_SEC", "300"))
+# 진행률을 저장소에 기록하는 최소 간격
+JOB_PROGRESS_INTERVAL_SEC = 0.5
+
+
+class JobQueueFullError(RuntimeError):
+    """실행 중 + 대기 중인 작업 수가 허용치를 넘었을 때 발생"""
+
+
+@dataclass
+class Job:
+    job_id: str
+    kind: str
+    session_id: str = ""
+    status: str = "queued"  # queued | running | succeeded | failed
+    done: int = 0
+    total: int = 0
+    unit: str = ""
+    result: Any = None
+    error: Optional[str] = None
+    created_at: float = 0.0
+    started_at: Optional[float] = None
+    finished_at: Optional[float] = None
+
+
+class JobStore(ABC):
+    """작업 상태 저장소. 결과(result)는 JSON 직렬화 가능한 값이어야 한다."""
+
+    @abstractmethod
+    def save(self, job: Job) -> None: ...
+
+    @abstractmethod
+    def get(self, job_id: str) -> Optional[Job]: ...
+
+    @abstractmethod
+    def purge(self, finished_before: float) -> None: ...
+
+    def close(self) -> None:
+        pass
+
+
+class InProcessJobStore(JobStore):
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._jobs: Dict[str, Job] = {}
+
+    def save(self, job: Job) -> None:
+        with self._lock:
+            self._jobs[job.job_id] = replace(job)
+
+    def get(self, job_id: str) -> Optional[Job]:
+        with self._lock:
+            job = self._jobs.get(job_id)
+            return replace(job) if job is not None else None
+
+    def purge(self, finished_before: float) -> None:
+        with self._lock:
+            expired = [
+                job_id
+                for job_id, job in self._jobs.items()
+                if job.finished_at is not None and job.finished_at < finished_before
+            ]
+            for job_id in expired:
+                del self._jobs[job_id]
+
+
+class SQLiteJobStore(JobStore):
+    """
+    SQLite 파일 기반 작업 상태 저장소. 같은 호스트의 여러 워커 프로세스가
+    파일을 공유하므로 작업을 받은 워커와 다른 워커로 상태 조회가 들어와도 응답할 수 있다.
+    """
+
+    def __init__(self, path: str = JOB_SQLITE_PATH):
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            path, timeout=30, isolation_level=None, check_same_thread=False
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS jobs (
+                job_id TEXT PRIMARY KEY,
+                data TEXT NOT NULL,
+                finished_at REAL
+            )
+            """
+        )
+
+    def save(self, job: Job) -> None:
+        data = json.dumps(asdict(job), ensure_ascii=False)
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO jobs (job_id, data, finished_at) VALUES (?, ?, ?)",
+                (job.job_id, data, job.finished_at),
+            )
+
+    def get(self, job_id: str) -> Optional[Job]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT data FROM jobs WHERE job_id = ?", (job_id,)
+            ).fetchone()
+        return Job(**json.loads(row[0])) if row else None
+
+    def purge(self, finished_before: float) -> None:
+        with self._lock:
+            self._conn.execute(
+                "DELETE FROM jobs WHERE finished_at IS NOT NULL AND finished_at < ?",
+                (finished_before,),
+            )
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+class JobProgress:
+    """작업 함수에 전달되는 진행률 핸들 (스레드에서 호출해도 안전)"""
+
+    def __init__(self, store: JobStore, job: Job):
+        self._store = store
+        self._job = job
+        self._lock = threading.Lock()
+        self._last_saved = 0.0
+
+    def update(self, done: int, total: int) -> None:
+        with self._lock:
+            self._job.done, self._job.total = done, total
+            now = time.monotonic()
+            if done >= total or now - self._last_saved >= JOB_PROGRESS_INTERVAL_SEC:
+                self._last_saved = now
+                self._store.save(self._job)
+
+    async def follow(
+        self,
+        awaitable: Awaitable[Any],
+        read: Callable[[], Tuple[int, int]],
+    ) -> Any:
+        """
+        awaitable 을 기다리는 동안 read() (e.g. 워커 프로세스의 SharedProgress) 로
+        진행률을 주기적으로 가져와 기록한다.
+        """
+
+        task = asyncio.ensure_future(awaitable)
+        while True:
+            done, _ = await asyncio.wait({task}, timeout=JOB_PROGRESS_INTERVAL_SEC)
+            self.update(*read())
+            if done:
+                return task.result()
+
+
+JobFn = Callable[[JobProgress], Awaitable[Any]]
+
+
+class JobManager:
+    """
+    오래 걸리는 작업(OCR, 영상 분석)을 요청과 분리해 실행하는 프로세스 내 작업 큐.
+
+    - submit 은 즉시 job_id 를 돌려주고 작업은 이벤트 루프의 태스크로 실행
+    - 동시에 실행하는 작업은 max_concurrency 개, 그 외 queue_depth 개까지 대기
+    - 실제 CPU 작업은 각 서비스의 프로세스 풀에서 실행되며, 풀이 가득 차면
+      JOB_BUSY_MAX_WAIT_SEC 동안 재시도
+    """
+
+    def __init__(
+        self,
+        store: JobStore,
+        max_concurrency: int = JOB_MAX_CONCURRENCY,
+        queue_depth: int = JOB_QUEUE_DEPTH,
+        ttl_sec: int = JOB_TTL_SEC,
+    ):
+        self.store = store
+        self.max_concurrency = max(1, max_concurrency)
+        self.queue_depth = max(0, queue_depth)
+        self.ttl_sec = ttl_sec
+
+        self._tasks: Dict[str, asyncio.Task] = {}
+        self._semaphore: Optional[asyncio.Semaphore] = None
+
+    def submit(
+        self,
+        kind: str,
+        fn: JobFn,
+        session_id: str = "",
+        unit: str = "",
+        cleanup: Optional[Callable[[], None]] = None,
+    ) -> Job:
+        """
+        작업을 등록하고 실행을 예약한다. cleanup 은 작업이 끝난 뒤 (성공/실패와 무관하게) 호출된다.
+        대기열이 가득 찬 경우 JobQueueFullError 가 발생한다.
+        """
+
+        if len(self._tasks) >= self.max_concurrency + self.queue_depth:
+            raise JobQueueFullError(
+                f"job queue is full ({self.max_concurrency} running, "
+                f"queue depth {self.queue_depth})"
+            )
+
+        if self.ttl_sec:
+            self.store.purge(time.time() - self.ttl_sec)
+
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        job = Job(
+            job_id=uuid.uuid4().hex,
+            kind=kind,
+            session_id=session_id,
+            unit=unit,
+            created_at=time.time(),
+        )
+        self.store.save(job)
+
+        task = asyncio.get_running_loop().create_task(self._run(job, fn, cleanup))
+        self._tasks[job.job_id] = task
+        task.add_done_callback(lambda _: self._tasks.pop(job.job_id, None))
+        return job
+
+    async def _run(
+        self,
+        job: Job,
+        fn: JobFn,
+        cleanup: Optional[Callable[[], None]],
+    ) -> None:
+        try:
+            async with self._semaphore:
+                job.status = "running"
+                job.started_at = time.time()
+                self.store.save(job)
+
+                progress = JobProgress(self.store, job)
+                deadline = time.monotonic() + JOB_BUSY_MAX_WAIT_SEC
+                while True:
+                    try:
+                        job.result = await fn(progress)
+                        break
+                    except PoolSaturatedError:
+                        if time.monotonic() >= deadline:
+                            raise
+                        await asyncio.sleep(JOB_BUSY_RETRY_SEC)
+
+            job.status = "succeeded"
+        except asyncio.CancelledError:
+            job.status = "failed"
+            job.error = "cancelled"
+            raise
+        except Exception as e:
+            job.status = "failed"
+            job.error = f"{type(e).__name__}: {e}"
+        finally:
+            job.finished_at = time.time()
+            self.store.save(job)
+            if cleanup is not None:
+                cleanup()
+
+    def get(self, job_id: str) -> Optional[Job]:
+        return self.store.get(job_id)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "backend": type(self.store).__name__,
+            "active": len(self._tasks),
+            "max_concurrency": self.max_concurrency,
+            "queue_depth": self.queue_depth,
+        }
+
+    async def shutdown(self) -> None:
+        tasks = list(self._tasks.values())
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+        self.store.close()
+
+
+def create_job_store(kind: str = JOB_BACKEND) -> JobStore:
+    kind = kind.strip().lower()
+    if kind == "memory":
+        return InProcessJobStore()
+    if kind == "sqlite":
+        return SQLiteJobStore(JOB_SQLITE_PATH)
+    raise ValueError(f"Unknown JOB_BACKEND: {kind} (memory|sqlite)")
+
+
+job_manager = JobManager(create_job_store())
@@ -1,8 +1,11 @@
 import json
+import os
 from typing import (
     Any, 
     Dict, 
-    List
+    Iterator,
+    List,
+    Tuple
 )
 
 from fastapi import (
@@ -11,6 +14,79 @@ from fastapi import (
 )
 from langchain.memory import ConversationBufferMemory
 
+from app.services.session_backend import (
+    BackendChatMessageHistory,
+    SessionBackend,
+    create_session_backend,
+)
+from app.services.session_events import get_event_log
+from app.services.session_store import SessionStore, new_conversation_memory
+
+# 세션 메모리 상한 (0이면 제한 없음)
+SESSION_MAX_ENTRIES = int(os.getenv("SESSION_MAX_ENTRIES", "1000"))
+SESSION_MAX_BYTES = int(os.getenv("SESSION_MAX_BYTES", str(256 * 1024 * 1024)))
+SESSION_IDLE_TTL_SEC = float(os.getenv("SESSION_IDLE_TTL_SEC", str(3 * 60 * 60)))
+
+# 메시지 하나에 기록하는 payload JSON 최대 길이 (prevent exceeding memory limit)
+MEMORY_PAYLOAD_MAX_CHARS = 4000
+
+
+def _dumps(
+    payload: Any
+) -> str:
+
+    return json.dumps(payload, ensure_ascii=False, separators=(",", ":"))
+
+
+def _cap_strings(
+    value: Any, 
+    cap: int
+) -> Any:
+
+    if isinstance(value, str):
+        return value if len(value) <= cap else value[:cap] + "…"
+    if isinstance(value, dict):
+        return {k: _cap_strings(v, cap) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_cap_strings(v, cap) for v in value]
+    return value
+
+
+def _fit_payload(
+    payload: Any, 
+    limit: int = MEMORY_PAYLOAD_MAX_CHARS
+) -> Tuple[str, Any]:
+    """
+    JSON 길이가 limit 이하가 되도록 payload 안의 문자열 값을 줄인다.
+    (기록할 JSON, 그 JSON 과 같은 payload) 를 반환하므로 기록된 값은 항상 파싱 가능하고
+    다른 워커가 sync 로 읽은 이벤트와 record 로 인덱싱한 이벤트가 같다.
+    """
+
+    compact = _dumps(payload)
+    if len(compact) <= limit:
+        return compact, payload
+
+    # 문자열 값 최대 길이(cap)를 이분 탐색해 limit 안에 들어가는 가장 큰 값을 찾는다
+    lo, hi = 16, len(compact)
+    best = None
+    while lo <= hi:
+        cap = (lo + hi) // 2
+        capped = _cap_strings(payload, cap)
+        text = _dumps(capped)
+        if len(text) <= limit:
+            best = (text, capped)
+            lo = cap + 1
+        else:
+            hi = cap - 1
+    if best is not None:
+        return best
+
+    # 구조 자체가 limit 보다 크면 잘린 원문을 JSON 문자열로 기록
+    # (이스케이프로 길이가 최대 2배가 되므로 limit 의 절반만 사용)
+    preview = compact[: limit // 2 - 1]
+    return _dumps(preview), preview
+
+
 class MemoryLogger:
     def __init__(
         self,
@@ -27,11 +103,16 @@ class MemoryLogger:
         payload: Dict[str, Any] = {}
     ) -> None:
         
-        pretty = json.dumps(payload, ensure_ascii=False, indent=4)
+        compact, stored = _fit_payload(payload)
         self.memory.save_context(
             {"input": f"[{title}]"}, 
-            {"output": pretty[:4000]} # prevent exceeding memory limit
+            {"output": compact}
         ) 
+        get_event_log(self.memory, sync=False).record(
+            title,
+            stored,
+            self.memory.chat_memory.messages
+        )
         
 
     def log_main_questions(
@@ -91,8 +172,33 @@ class MemoryLogger:
         self._log("PDF_PARSE", parsed_data)
     
 
+def _create_memory(
+    session_id: str = ""
+) -> ConversationBufferMemory:
+
+    return new_conversation_memory(
+        BackendChatMessageHistory(MemoryManager._backend, session_id)
+    )
+
+
+def _on_session_evicted(
+    session_id: str = ""
+) -> None:
+
+    # 프로세스 내 저장소는 로컬 캐시가 곧 원본이므로 함께 삭제
+    if MemoryManager._backend.owns_local_data:
+        MemoryManager._backend.clear(session_id)
+
+
 class MemoryManager:
-    _memory_store: Dict[str, ConversationBufferMemory] = {}
+    _backend: SessionBackend = create_session_backend()
+    _store = SessionStore(
+        factory=_create_memory,
+        max_entries=SESSION_MAX_ENTRIES,
+        max_bytes=SESSION_MAX_BYTES,
+        idle_ttl_sec=SESSION_IDLE_TTL_SEC,
+        on_evict=_on_session_evicted,
+    )
 
     @classmethod
     def get_memory(
@@ -100,21 +206,48 @@ class MemoryManager:
         session_id: str = ""
     ) -> ConversationBufferMemory:
 
-        if session_id not in cls._memory_store:
-            cls._memory_store[session_id] = ConversationBufferMemory(
-                memory_key="history",
-                input_key="input",
-                output_key="output",
-                return_messages=False
-            )
-        return cls._memory_store[session_id]
+        return cls._store.get(session_id)
+
+
+    @classmethod
+    def acquire(
+        cls, 
+        session_id: str = ""
+    ) -> ConversationBufferMemory:
+        """release 할 때까지 세션이 eviction 되지 않도록 고정 (백그라운드 작업 등)"""
+
+        return cls._store.acquire(session_id)
+
+
+    @classmethod
+    def release(
+        cls, 
+        session_id: str = ""
+    ) -> None:
+
+        cls._store.release(session_id)
+
+
+    @classmethod
+    def stats(cls) -> Dict[str, Any]:
+        
+        return {
+            "backend": type(cls._backend).__name__,
+            **cls._store.stats(),
+        }
+
+
+    @classmethod
+    def close(cls) -> None:
+
+        cls._backend.close()
         
         
     @classmethod
     def MemoryDep(
         cls,
         x_session_id: str = Header(...)
-    ) -> ConversationBufferMemory:
+    ) -> Iterator[ConversationBufferMemory]:
 
         if not x_session_id:
             raise HTTPException(
@@ -122,4 +255,9 @@ class MemoryManager:
                 detail="X-Session-Id header required"
             )
         
-        return cls.get_memory(x_session_id)
\ No newline at end of file
+        # 요청(스트리밍 응답 포함)이 끝날 때까지 세션을 고정하고, 끝나면 크기 재계산
+        memory = cls.acquire(x_session_id)
+        try:
+            yield memory
+        finally:
+            cls.release(x_session_id)
\ No newline at end of file
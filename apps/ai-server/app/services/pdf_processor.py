@@ -1,19 +1,81 @@
-import json
+import hashlib
+import os
+from dataclasses import asdict, dataclass
 from typing import (
     Any, 
+    Callable,
     Dict, 
+    List,
+    Optional
 )
 
 from langchain.memory import ConversationBufferMemory
 
 from app.utils.pdf_utils import (
-    is_digital_pdf,
-    extract_text_from_digital_pdf,
-    extract_text_from_image_pdf,
+    PDFSource,
+    PageText,
+    init_ocr_worker,
+    extract_pdf_pages,
+    extraction_settings,
+    join_page_texts,
     preprocess_text
 )
+from app.utils.cache import TieredCache, content_key
+from app.utils.worker_pool import BoundedProcessPool
 from app.services.memory_logger import MemoryLogger
 
+# 이미지 PDF 페이지 OCR 프로세스 풀 (0 또는 1이면 요청 스레드에서 순차 처리)
+OCR_WORKERS = int(os.getenv("OCR_WORKERS", str(min(4, os.cpu_count() or 1))))
+OCR_QUEUE_DEPTH = int(os.getenv("OCR_QUEUE_DEPTH", "16"))
+
+ocr_pool = (
+    BoundedProcessPool(
+        name="ocr",
+        max_workers=OCR_WORKERS,
+        queue_depth=OCR_QUEUE_DEPTH,
+        initializer=init_ocr_worker,
+    )
+    if OCR_WORKERS > 1 else None
+)
+
+# 파싱 결과 캐시 (파일 내용 + 추출 설정 기준). PDF_CACHE_DIR 를 주면 디스크 캐시를
+# 워커 프로세스 간에 공유한다.
+PDF_CACHE_MAX_ENTRIES = int(os.getenv("PDF_CACHE_MAX_ENTRIES", "128"))
+PDF_CACHE_MAX_BYTES = int(os.getenv("PDF_CACHE_MAX_BYTES", str(64 * 1024 * 1024)))
+PDF_CACHE_DIR = os.getenv("PDF_CACHE_DIR", "")
+PDF_CACHE_DISK_MAX_BYTES = int(os.getenv("PDF_CACHE_DISK_MAX_BYTES", str(512 * 1024 * 1024)))
+# 추출/전처리 로직이 바뀌어 이전 캐시를 무효화해야 할 때 올린다
+PDF_PARSE_VERSION = 1
+
+pdf_cache = TieredCache(
+    name="pdf",
+    max_entries=PDF_CACHE_MAX_ENTRIES,
+    max_bytes=PDF_CACHE_MAX_BYTES,
+    dir=PDF_CACHE_DIR or None,
+    disk_max_bytes=PDF_CACHE_DISK_MAX_BYTES,
+)
+
+
+def _sha256_of(
+    source: PDFSource
+) -> str:
+    
+    h = hashlib.sha256()
+    if isinstance(source, str):
+        with open(source, "rb") as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b""):
+                h.update(chunk)
+    else:
+        h.update(source)
+    return h.hexdigest()
+
+
+@dataclass
+class PDFParseResult:
+    preprocessed_text: str
+    pages: List[PageText]
+    cached: bool = False
+
 
 class PDFAnalysisService:
     def __init__(
@@ -32,26 +94,65 @@ class PDFAnalysisService:
     def process_and_persist(
         self, 
         file_bytes: bytes = b"", 
-        file_name: str = ""
-    ) -> str:
+        file_name: str = "",
+        file_path: str = "",
+        file_sha256: str = "",
+        progress: Optional[Callable[[int, int], None]] = None
+    ) -> PDFParseResult:
+        """
+        PDF 텍스트를 추출/전처리해 세션 메모리에 기록한다.
+        텍스트 레이어가 없는 페이지만 OCR 로 처리하고, 같은 파일/설정의
+        결과는 캐시에서 가져온다.
+        file_path 가 주어지면 file_bytes 대신 디스크의 파일을 읽는다.
+        (file_sha256 은 업로드 시 미리 계산한 파일 해시)
+        progress 는 (처리한 페이지 수, 전체 페이지 수) 로 호출된다.
+        OCR 풀이 가득 찬 경우 PoolSaturatedError 가 발생한다.
+        """
         
-        is_digital = is_digital_pdf(file_bytes)
-        extracted_text = (
-            extract_text_from_digital_pdf(file_bytes)
-            if is_digital else
-            extract_text_from_image_pdf(file_bytes)
-        )
-        
-        preprocessed_text = preprocess_text(extracted_text)
+        source: PDFSource = file_path or file_bytes
+        result = self._parse(source, file_sha256 or _sha256_of(source), progress)
+        ocr_pages = [p.page for p in result.pages if p.route == "ocr"]
         
         parsed_data: Dict[str, Any] = {
             "filename": file_name,
-            "digital": is_digital,
-            "preprocessed_text": preprocessed_text
+            "digital": not ocr_pages,
+            "ocr_pages": ocr_pages,
+            "preprocessed_text": result.preprocessed_text
         }
         
         self.logger.log_pdf_parsing(
             parsed_data=parsed_data
         )
             
-        return preprocessed_text
+        return result
+
+    def _parse(
+        self, 
+        source: PDFSource,
+        file_sha256: str,
+        progress: Optional[Callable[[int, int], None]] = None
+    ) -> PDFParseResult:
+        
+        key = content_key(file_sha256, PDF_PARSE_VERSION, extraction_settings())
+        cached = pdf_cache.get(key)
+        if cached is not None:
+            if progress is not None:
+                progress(len(cached["pages"]), len(cached["pages"]))
+            return PDFParseResult(
+                preprocessed_text=cached["preprocessed_text"],
+                pages=[PageText(**p) for p in cached["pages"]],
+                cached=True
+            )
+
+        pages = extract_pdf_pages(source, ocr_pool, progress)
+        preprocessed_text = preprocess_text(join_page_texts(pages))
+
+        pdf_cache.set(key, {
+            "preprocessed_text": preprocessed_text,
+            "pages": [asdict(p) for p in pages]
+        })
+
+        return PDFParseResult(
+            preprocessed_text=preprocessed_text,
+            pages=pages
+        )
@@ -1,17 +1,20 @@
 import json
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 
 from langchain.memory import ConversationBufferMemory
-from langchain.prompts import PromptTemplate
 
 from app.models.question import QuestionConstraints, QuestionResponse, UserInfo
 from app.services.memory_logger import MemoryLogger
 from app.utils.llm_utils import (
+    LLM_DEFAULT_MODEL,
     PROMPT_BASE_DIR,
+    agroq_chat,
     groq_chat,
-    load_prompt_template,
     strip_json,
 )
+from app.utils.prompt_budget import PromptBudgetReport, fit_prompt
+from app.utils.prompt_registry import prompt_registry
+from app.utils.rate_limiter import PRIORITY_BATCH
 
 PROMPT_PATH = (PROMPT_BASE_DIR / "question_prompt.txt").resolve()
 
@@ -25,6 +28,8 @@ class QuestionGeneratorService:
         self.memory = memory
         self.session_id = session_id
         self.logger = MemoryLogger(memory=memory, session_id=session_id)
+        # 마지막으로 만든 프롬프트의 토큰 예산 적용 결과
+        self.prompt_budget: Optional[PromptBudgetReport] = None
 
     def _preprocess_parsed(self, item: Dict[str, Any]) -> Dict[str, Any]:
         key_time = "estimated_answer_time_sec"
@@ -111,15 +116,11 @@ class QuestionGeneratorService:
             out.append(q)
         return out[:5]
 
-    def generate_questions(
+    def _build_prompt(
         self,
-        user_info: UserInfo = ...,
-        constraints: QuestionConstraints = ...,
-        memory: ConversationBufferMemory = ...,
-    ) -> List[Dict[str, Any]]:
-        raw = load_prompt_template(PROMPT_PATH)
-        prompt_template = PromptTemplate.from_template(raw)
-
+        user_info: UserInfo,
+        constraints: QuestionConstraints,
+    ) -> str:
         vars = {
             "desired_role": user_info.desired_role,
             "company": user_info.company,
@@ -134,11 +135,21 @@ class QuestionGeneratorService:
             "seed": constraints.seed if constraints.seed is not None else "null",
         }
 
-        prompt_text = prompt_template.format(**vars)
-        content = groq_chat(
-            prompt_text,
-            max_tokens=2048,
+        # 자기소개서 / 포트폴리오가 길면 모델 토큰 예산에 맞게 줄인다
+        prompt_text, self.prompt_budget = fit_prompt(
+            prompt_registry.get(PROMPT_PATH),
+            vars,
+            compactable=("resume_text", "portfolio_text"),
+            model=LLM_DEFAULT_MODEL,
+            query=(user_info.desired_role, user_info.core_values),
         )
+        return prompt_text
+
+    def _finalize(
+        self,
+        content: str,
+        constraints: QuestionConstraints,
+    ) -> List[Dict[str, Any]]:
         json_text = strip_json(content)
 
         try:
@@ -163,3 +174,35 @@ class QuestionGeneratorService:
         self.logger.log_main_questions(final)
 
         return final
+
+    def generate_questions(
+        self,
+        user_info: UserInfo = ...,
+        constraints: QuestionConstraints = ...,
+        memory: ConversationBufferMemory = ...,
+    ) -> List[Dict[str, Any]]:
+        prompt_text = self._build_prompt(user_info, constraints)
+        content = groq_chat(
+            prompt_text,
+            max_tokens=2048,
+            priority=PRIORITY_BATCH,
+            seed=constraints.seed,
+        )
+
+        return self._finalize(content, constraints)
+
+    async def agenerate_questions(
+        self,
+        user_info: UserInfo = ...,
+        constraints: QuestionConstraints = ...,
+        memory: ConversationBufferMemory = ...,
+    ) -> List[Dict[str, Any]]:
+        prompt_text = self._build_prompt(user_info, constraints)
+        content = await agroq_chat(
+            prompt_text,
+            max_tokens=2048,
+            priority=PRIORITY_BATCH,
+            seed=constraints.seed,
+        )
+
+        return self._finalize(content, constraints)
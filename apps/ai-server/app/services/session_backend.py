@@ -0,0 +1,406 @@
+import json
+import os
+import sqlite3
+import threading
+from abc import ABC, abstractmethod
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from langchain_core.chat_history import BaseChatMessageHistory
+from langchain_core.messages import BaseMessage, message_to_dict, messages_from_dict
+
+from app.services.session_events import SessionEventLog
+
+# 세션 저장소 종류: memory | sqlite | redis
+SESSION_BACKEND = os.getenv("SESSION_BACKEND", "memory")
+SESSION_SQLITE_PATH = os.getenv("SESSION_SQLITE_PATH", "/tmp/aiew-sessions.sqlite3")
+SESSION_REDIS_URL = os.getenv("SESSION_REDIS_URL", "redis://localhost:6379/0")
+SESSION_REDIS_PREFIX = os.getenv("SESSION_REDIS_PREFIX", "aiew:session:")
+SESSION_REDIS_TTL_SEC = int(os.getenv("SESSION_REDIS_TTL_SEC", str(24 * 60 * 60)))
+
+# 낙관적 동시성 충돌 시 재시도 횟수
+SESSION_APPEND_RETRIES = 5
+
+Snapshot = Tuple[List[BaseMessage], int]
+
+
+class VersionConflictError(RuntimeError):
+    """expected_version 과 저장소의 현재 버전이 다를 때 발생"""
+
+
+class SessionBackend(ABC):
+    """
+    세션 메시지 저장소 인터페이스.
+
+    세션마다 메시지 목록과 버전(쓰기마다 1씩 증가)을 가진다.
+    append 에 expected_version 을 넘기면 버전이 같을 때만 쓰기가 반영된다.
+    """
+
+    # True 면 MemoryManager 의 로컬 캐시에서 세션이 제거될 때 저장소 데이터도 삭제
+    owns_local_data: bool = False
+
+    @abstractmethod
+    def load(self, session_id: str) -> Snapshot: ...
+
+    def load_many(self, session_ids: Iterable[str]) -> Dict[str, Snapshot]:
+        return {session_id: self.load(session_id) for session_id in session_ids}
+
+    @abstractmethod
+    def version(self, session_id: str) -> int: ...
+
+    @abstractmethod
+    def append(
+        self,
+        session_id: str,
+        messages: Sequence[BaseMessage],
+        expected_version: Optional[int] = None,
+    ) -> int: ...
+
+    def append_many(
+        self, batch: Dict[str, Tuple[Sequence[BaseMessage], Optional[int]]]
+    ) -> Dict[str, int]:
+        return {
+            session_id: self.append(session_id, messages, expected_version)
+            for session_id, (messages, expected_version) in batch.items()
+        }
+
+    @abstractmethod
+    def clear(self, session_id: str) -> None: ...
+
+    def close(self) -> None:
+        pass
+
+
+def _dumps(messages: Sequence[BaseMessage]) -> List[str]:
+    return [json.dumps(message_to_dict(m), ensure_ascii=False) for m in messages]
+
+
+def _loads(rows: Iterable[str]) -> List[BaseMessage]:
+    return messages_from_dict([json.loads(r) for r in rows])
+
+
+class InProcessSessionBackend(SessionBackend):
+    """프로세스 메모리에 메시지 객체를 그대로 보관 (기본값, 직렬화 없음)"""
+
+    owns_local_data = True
+
+    def __init__(self):
+        self._sessions: Dict[str, Snapshot] = {}
+        self._lock = threading.Lock()
+
+    def load(self, session_id: str) -> Snapshot:
+        with self._lock:
+            messages, version = self._sessions.get(session_id, ([], 0))
+            return list(messages), version
+
+    def version(self, session_id: str) -> int:
+        with self._lock:
+            return self._sessions.get(session_id, ([], 0))[1]
+
+    def append(
+        self,
+        session_id: str,
+        messages: Sequence[BaseMessage],
+        expected_version: Optional[int] = None,
+    ) -> int:
+        with self._lock:
+            current, version = self._sessions.get(session_id, ([], 0))
+            if expected_version is not None and expected_version != version:
+                raise VersionConflictError(session_id)
+            current.extend(messages)
+            self._sessions[session_id] = (current, version + 1)
+            return version + 1
+
+    def clear(self, session_id: str) -> None:
+        with self._lock:
+            self._sessions.pop(session_id, None)
+
+
+class SQLiteSessionBackend(SessionBackend):
+    """
+    SQLite 파일 기반 저장소. 같은 호스트의 여러 워커 프로세스가 파일을 공유한다.
+    """
+
+    def __init__(self, path: str = SESSION_SQLITE_PATH):
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            path, timeout=30, isolation_level=None, check_same_thread=False
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS session_versions (
+                session_id TEXT PRIMARY KEY,
+                version INTEGER NOT NULL,
+                length INTEGER NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS session_messages (
+                session_id TEXT NOT NULL,
+                seq INTEGER NOT NULL,
+                data TEXT NOT NULL,
+                PRIMARY KEY (session_id, seq)
+            );
+            """
+        )
+
+    def load(self, session_id: str) -> Snapshot:
+        return self.load_many([session_id])[session_id]
+
+    def load_many(self, session_ids: Iterable[str]) -> Dict[str, Snapshot]:
+        ids = list(dict.fromkeys(session_ids))
+        if not ids:
+            return {}
+        marks = ",".join("?" * len(ids))
+
+        with self._lock:
+            self._conn.execute("BEGIN")
+            try:
+                versions = dict(
+                    self._conn.execute(
+                        f"SELECT session_id, version FROM session_versions "
+                        f"WHERE session_id IN ({marks})",
+                        ids,
+                    ).fetchall()
+                )
+                rows = self._conn.execute(
+                    f"SELECT session_id, data FROM session_messages "
+                    f"WHERE session_id IN ({marks}) ORDER BY session_id, seq",
+                    ids,
+                ).fetchall()
+            finally:
+                self._conn.execute("COMMIT")
+
+        grouped: Dict[str, List[str]] = {session_id: [] for session_id in ids}
+        for session_id, data in rows:
+            grouped[session_id].append(data)
+        return {
+            session_id: (_loads(grouped[session_id]), versions.get(session_id, 0))
+            for session_id in ids
+        }
+
+    def version(self, session_id: str) -> int:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT version FROM session_versions WHERE session_id = ?",
+                (session_id,),
+            ).fetchone()
+        return row[0] if row else 0
+
+    def append(
+        self,
+        session_id: str,
+        messages: Sequence[BaseMessage],
+        expected_version: Optional[int] = None,
+    ) -> int:
+        return self.append_many({session_id: (messages, expected_version)})[session_id]
+
+    def append_many(
+        self, batch: Dict[str, Tuple[Sequence[BaseMessage], Optional[int]]]
+    ) -> Dict[str, int]:
+        out: Dict[str, int] = {}
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                for session_id, (messages, expected_version) in batch.items():
+                    row = self._conn.execute(
+                        "SELECT version, length FROM session_versions "
+                        "WHERE session_id = ?",
+                        (session_id,),
+                    ).fetchone()
+                    version, length = row if row else (0, 0)
+                    if expected_version is not None and expected_version != version:
+                        raise VersionConflictError(session_id)
+
+                    self._conn.executemany(
+                        "INSERT INTO session_messages (session_id, seq, data) "
+                        "VALUES (?, ?, ?)",
+                        [
+                            (session_id, length + i, data)
+                            for i, data in enumerate(_dumps(messages))
+                        ],
+                    )
+                    self._conn.execute(
+                        "INSERT OR REPLACE INTO session_versions "
+                        "(session_id, version, length) VALUES (?, ?, ?)",
+                        (session_id, version + 1, length + len(messages)),
+                    )
+                    out[session_id] = version + 1
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+            self._conn.execute("COMMIT")
+        return out
+
+    def clear(self, session_id: str) -> None:
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                self._conn.execute(
+                    "DELETE FROM session_messages WHERE session_id = ?", (session_id,)
+                )
+                self._conn.execute(
+                    "UPDATE session_versions SET version = version + 1, length = 0 "
+                    "WHERE session_id = ?",
+                    (session_id,),
+                )
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+            self._conn.execute("COMMIT")
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+class RedisSessionBackend(SessionBackend):
+    """
+    Redis 프로토콜 저장소 (Redis / Valkey / KeyDB 등).
+    blue/green 인스턴스와 여러 워커가 같은 세션 상태를 공유한다.
+    """
+
+    def __init__(
+        self,
+        url: str = SESSION_REDIS_URL,
+        prefix: str = SESSION_REDIS_PREFIX,
+        ttl_sec: int = SESSION_REDIS_TTL_SEC,
+        client=None,
+    ):
+        if client is None:
+            try:
+                import redis
+            except ImportError as e:
+                raise RuntimeError(
+                    "SESSION_BACKEND=redis requires the 'redis' package: %s" % e
+                )
+            client = redis.Redis.from_url(url)
+
+        self.client = client
+        self.prefix = prefix
+        self.ttl_sec = ttl_sec
+
+    def _keys(self, session_id: str) -> Tuple[str, str]:
+        base = f"{self.prefix}{session_id}"
+        return f"{base}:messages", f"{base}:version"
+
+    def load(self, session_id: str) -> Snapshot:
+        return self.load_many([session_id])[session_id]
+
+    def load_many(self, session_ids: Iterable[str]) -> Dict[str, Snapshot]:
+        ids = list(dict.fromkeys(session_ids))
+        pipe = self.client.pipeline(transaction=True)
+        for session_id in ids:
+            messages_key, version_key = self._keys(session_id)
+            pipe.get(version_key)
+            pipe.lrange(messages_key, 0, -1)
+        replies = pipe.execute()
+
+        out: Dict[str, Snapshot] = {}
+        for i, session_id in enumerate(ids):
+            version, rows = replies[2 * i], replies[2 * i + 1]
+            out[session_id] = (_loads(rows), int(version or 0))
+        return out
+
+    def version(self, session_id: str) -> int:
+        return int(self.client.get(self._keys(session_id)[1]) or 0)
+
+    def append(
+        self,
+        session_id: str,
+        messages: Sequence[BaseMessage],
+        expected_version: Optional[int] = None,
+    ) -> int:
+        from redis.exceptions import WatchError
+
+        messages_key, version_key = self._keys(session_id)
+        with self.client.pipeline(transaction=True) as pipe:
+            try:
+                pipe.watch(version_key)
+                version = int(pipe.get(version_key) or 0)
+                if expected_version is not None and expected_version != version:
+                    raise VersionConflictError(session_id)
+                if not messages:
+                    # RPUSH 는 값이 하나 이상 필요하다. 기록할 것이 없으면 버전도 그대로
+                    return version
+
+                pipe.multi()
+                pipe.rpush(messages_key, *_dumps(messages))
+                pipe.incr(version_key)
+                if self.ttl_sec > 0:
+                    pipe.expire(messages_key, self.ttl_sec)
+                    pipe.expire(version_key, self.ttl_sec)
+                replies = pipe.execute()
+            except WatchError:
+                raise VersionConflictError(session_id)
+        return int(replies[1])
+
+    def clear(self, session_id: str) -> None:
+        messages_key, version_key = self._keys(session_id)
+        pipe = self.client.pipeline(transaction=True)
+        pipe.delete(messages_key)
+        pipe.incr(version_key)
+        pipe.execute()
+
+    def close(self) -> None:
+        self.client.close()
+
+
+class BackendChatMessageHistory(BaseChatMessageHistory):
+    """
+    SessionBackend 위의 LangChain 호환 메시지 히스토리.
+
+    마지막으로 읽은 메시지와 버전을 캐시해 두고, 저장소 버전이 바뀐 경우에만
+    다시 읽는다. save_context 의 human/ai 메시지 쌍은 한 번의 append 로 기록된다.
+    events 는 이 히스토리에 대한 타입별 이벤트 인덱스다.
+    """
+
+    def __init__(self, backend: SessionBackend, session_id: str = ""):
+        self.backend = backend
+        self.session_id = session_id
+        self.events = SessionEventLog()
+        self._messages: List[BaseMessage] = []
+        self._version = 0
+
+    def _refresh(self) -> None:
+        self._messages, self._version = self.backend.load(self.session_id)
+
+    @property
+    def messages(self) -> List[BaseMessage]:
+        if self.backend.version(self.session_id) != self._version:
+            self._refresh()
+        return self._messages
+
+    def add_messages(self, messages: Sequence[BaseMessage]) -> None:
+        messages = list(messages)
+        for _ in range(SESSION_APPEND_RETRIES):
+            try:
+                self._version = self.backend.append(
+                    self.session_id, messages, expected_version=self._version
+                )
+            except VersionConflictError:
+                # 다른 워커가 먼저 기록함 → 최신 상태를 읽고 그 뒤에 이어서 기록
+                self._refresh()
+                continue
+            self._messages = self._messages + messages
+            return
+        raise VersionConflictError(
+            f"Failed to append to session '{self.session_id}' after "
+            f"{SESSION_APPEND_RETRIES} attempts"
+        )
+
+    def clear(self) -> None:
+        self.backend.clear(self.session_id)
+        self.events.reset()
+        self._refresh()
+
+
+def create_session_backend(kind: str = SESSION_BACKEND) -> SessionBackend:
+    kind = kind.strip().lower()
+    if kind == "memory":
+        return InProcessSessionBackend()
+    if kind == "sqlite":
+        return SQLiteSessionBackend(SESSION_SQLITE_PATH)
+    if kind == "redis":
+        return RedisSessionBackend(SESSION_REDIS_URL)
+    raise ValueError(f"Unknown SESSION_BACKEND: {kind} (memory|sqlite|redis)")
@@ -0,0 +1,164 @@
+import json
+import re
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Sequence
+
+from langchain.memory import ConversationBufferMemory
+from langchain_core.messages import BaseMessage
+
+# "[TITLE]" 또는 "[TITLE]{...}" 형태의 human 메시지
+_TITLE_RE = re.compile(r"^\[([A-Z_]+)\](.*)$", re.DOTALL)
+
+# 이벤트 종류별로 question_id 인덱스에 사용할 payload 키
+_QUESTION_KEYS: Dict[str, Sequence[str]] = {
+    "ANSWER_EVALUATION": ("question_id",),
+    "TAIL_QUESTION": ("parent_question_id",),
+    "USER_ANSWER": ("question_id",),
+    "QUESTION_SHOWN": ("question_id", "main_question_id", "followup_id"),
+}
+
+
+@dataclass(frozen=True)
+class SessionEvent:
+    seq: int
+    type: str
+    question_id: Optional[str]
+    payload: Any
+
+
+def _question_id(event_type: str, payload: Any) -> Optional[str]:
+    if not isinstance(payload, dict):
+        return None
+    for key in _QUESTION_KEYS.get(event_type, ()):
+        value = payload.get(key)
+        if isinstance(value, str) and value:
+            return value
+    return None
+
+
+def _parse_payload(text: str) -> Any:
+    try:
+        return json.loads(text)
+    except (TypeError, ValueError):
+        return text  # 잘린 payload 등은 원문 그대로 보관
+
+
+class SessionEventLog:
+    """
+    세션 메시지 히스토리에 대한 타입별 이벤트 인덱스 (append-only).
+
+    MemoryLogger 가 기록한 이벤트는 payload 를 그대로 받아 O(1) 로 추가하고,
+    그 외 경로(다른 워커, FACE_ANALYSIS 등)로 추가된 메시지는 sync 시점에
+    새로 늘어난 부분만 파싱한다.
+    """
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self) -> None:
+        self._events: List[SessionEvent] = []
+        self._by_type: Dict[str, List[int]] = defaultdict(list)
+        self._by_question: Dict[str, List[int]] = defaultdict(list)
+        self._counts: Dict[tuple, int] = defaultdict(int)
+        self._cursor = 0  # 인덱싱을 마친 메시지 수
+        self._pending_title: Optional[str] = None
+
+    def __len__(self) -> int:
+        return len(self._events)
+
+    def _append(self, event_type: str, payload: Any) -> None:
+        question_id = _question_id(event_type, payload)
+        event = SessionEvent(
+            seq=len(self._events),
+            type=event_type,
+            question_id=question_id,
+            payload=payload,
+        )
+        self._events.append(event)
+        self._by_type[event_type].append(event.seq)
+        if question_id is not None:
+            self._by_question[question_id].append(event.seq)
+        self._counts[(event_type, question_id)] += 1
+
+    def record(
+        self,
+        event_type: str,
+        payload: Any,
+        messages: Sequence[BaseMessage],
+    ) -> None:
+        """MemoryLogger 가 human/ai 메시지 쌍을 막 기록한 직후 호출"""
+        if self._pending_title is None and self._cursor == len(messages) - 2:
+            self._append(event_type, payload)
+            self._cursor = len(messages)
+        else:
+            self.sync(messages)
+
+    def sync(self, messages: Sequence[BaseMessage]) -> None:
+        if len(messages) < self._cursor:
+            self.reset()  # clear() 된 히스토리
+
+        for message in messages[self._cursor :]:
+            content = str(message.content)
+            if message.type == "human":
+                m = _TITLE_RE.match(content)
+                if m is None:
+                    self._pending_title = None
+                elif m.group(2):
+                    self._pending_title = None
+                    self._append(m.group(1), _parse_payload(m.group(2)))
+                else:
+                    self._pending_title = m.group(1)
+            elif message.type == "ai" and self._pending_title is not None:
+                self._append(self._pending_title, _parse_payload(content))
+                self._pending_title = None
+        self._cursor = len(messages)
+
+    def events(
+        self,
+        event_type: Optional[str] = None,
+        question_id: Optional[str] = None,
+    ) -> List[SessionEvent]:
+        if event_type is None and question_id is None:
+            return list(self._events)
+        if question_id is None:
+            return [self._events[i] for i in self._by_type.get(event_type, [])]
+
+        selected = [self._events[i] for i in self._by_question.get(question_id, [])]
+        if event_type is not None:
+            selected = [e for e in selected if e.type == event_type]
+        return selected
+
+    def count(self, event_type: str, question_id: Optional[str] = None) -> int:
+        if question_id is None:
+            return len(self._by_type.get(event_type, []))
+        return self._counts.get((event_type, question_id), 0)
+
+    def latest(
+        self,
+        event_type: str,
+        question_id: Optional[str] = None,
+        before_seq: Optional[int] = None,
+    ) -> Optional[SessionEvent]:
+        for event in reversed(self.events(event_type, question_id)):
+            if before_seq is None or event.seq < before_seq:
+                return event
+        return None
+
+
+def get_event_log(
+    memory: ConversationBufferMemory,
+    sync: bool = True,
+) -> SessionEventLog:
+    """
+    세션 메모리에 붙어 있는 이벤트 로그를 반환한다.
+    (이벤트 로그가 없는 히스토리면 메시지 전체를 한 번 인덱싱한 임시 로그)
+    """
+    history = memory.chat_memory
+    log = getattr(history, "events", None)
+    if log is None:
+        log = SessionEventLog()
+        sync = True
+    if sync:
+        log.sync(history.messages)
+    return log
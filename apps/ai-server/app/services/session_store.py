@@ -0,0 +1,224 @@
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Optional
+
+from langchain.memory import ConversationBufferMemory
+from langchain_core.chat_history import BaseChatMessageHistory
+
+
+def _message_bytes(message: Any) -> int:
+    return len(str(getattr(message, "content", "")).encode("utf-8"))
+
+
+@dataclass
+class SessionEntry:
+    memory: ConversationBufferMemory
+    last_access: float
+    size_bytes: int = 0
+    counted_messages: int = 0
+    pins: int = 0  # 사용 중인 요청 / 작업 수 (0보다 크면 eviction 대상에서 제외)
+
+
+@dataclass
+class SessionStoreStats:
+    hits: int = 0
+    misses: int = 0
+    evictions: Dict[str, int] = field(
+        default_factory=lambda: {"lru": 0, "ttl": 0, "bytes": 0}
+    )
+
+
+class SessionStore:
+    """
+    세션 ID → 세션 메모리 저장소 (LRU + idle TTL 기반 eviction).
+
+    - max_entries: 최대 세션 수 (0이면 제한 없음)
+    - max_bytes: 모든 세션 메시지 크기 합의 상한 (0이면 제한 없음)
+    - idle_ttl_sec: 마지막 접근 이후 이 시간이 지나면 제거 (0이면 제한 없음)
+
+    세션 크기는 접근 시점과 release 시점(요청 / 작업이 기록을 마친 뒤)마다
+    새로 추가된 메시지만 더해 갱신한다. 메시지 읽기(백엔드 I/O)는 락 밖에서 하고
+    계산된 크기만 락 안에서 반영한다.
+    acquire ~ release 사이의 세션은 고정(pin)되어 eviction 되지 않는다.
+    on_evict 는 세션이 저장소에서 제거될 때 호출된다.
+    """
+
+    def __init__(
+        self,
+        factory: Callable[[str], ConversationBufferMemory],
+        max_entries: int = 0,
+        max_bytes: int = 0,
+        idle_ttl_sec: float = 0,
+        clock: Callable[[], float] = time.monotonic,
+        on_evict: Optional[Callable[[str], None]] = None,
+    ):
+        self.factory = factory
+        self.on_evict = on_evict
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.idle_ttl_sec = idle_ttl_sec
+        self.clock = clock
+
+        self._entries: "OrderedDict[str, SessionEntry]" = OrderedDict()
+        self._total_bytes = 0
+        self._lock = threading.RLock()
+        self._stats = SessionStoreStats()
+
+    def __contains__(self, session_id: str) -> bool:
+        with self._lock:
+            return session_id in self._entries
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def get(self, session_id: str = "") -> ConversationBufferMemory:
+        return self._get(session_id, pin=False)
+
+    def acquire(self, session_id: str = "") -> ConversationBufferMemory:
+        """세션을 반환하고 release 될 때까지 eviction 되지 않도록 고정한다"""
+        return self._get(session_id, pin=True)
+
+    def release(self, session_id: str = "") -> None:
+        """acquire 의 고정을 풀고, 그동안 기록된 메시지로 크기를 다시 계산한다"""
+        with self._lock:
+            entry = self._entries.get(session_id)
+            if entry is None:
+                return
+            entry.pins = max(0, entry.pins - 1)
+            entry.last_access = self.clock()
+        self._refresh_size(session_id, entry)
+
+    def _get(self, session_id: str, pin: bool) -> ConversationBufferMemory:
+        with self._lock:
+            now = self.clock()
+            self._evict_expired(now)
+
+            entry = self._entries.get(session_id)
+            hit = entry is not None
+            if entry is None:
+                self._stats.misses += 1
+                entry = SessionEntry(memory=self.factory(session_id), last_access=now)
+                self._entries[session_id] = entry
+            else:
+                self._stats.hits += 1
+                entry.last_access = now
+                self._entries.move_to_end(session_id)
+
+            if pin:
+                entry.pins += 1
+            self._evict_over_capacity(keep=session_id)
+
+        if hit:
+            self._refresh_size(session_id, entry)
+        return entry.memory
+
+    def discard(self, session_id: str = "") -> None:
+        with self._lock:
+            entry = self._entries.pop(session_id, None)
+            if entry is not None:
+                self._total_bytes -= entry.size_bytes
+                if self.on_evict is not None:
+                    self.on_evict(session_id)
+
+    def session_size(self, session_id: str = "") -> Optional[int]:
+        with self._lock:
+            entry = self._entries.get(session_id)
+            if entry is None:
+                return None
+        self._refresh_size(session_id, entry)
+        with self._lock:
+            return entry.size_bytes
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self._stats.hits + self._stats.misses
+            return {
+                "entries": len(self._entries),
+                "bytes": self._total_bytes,
+                "max_entries": self.max_entries,
+                "max_bytes": self.max_bytes,
+                "idle_ttl_sec": self.idle_ttl_sec,
+                "hits": self._stats.hits,
+                "misses": self._stats.misses,
+                "hit_ratio": round(self._stats.hits / lookups, 4) if lookups else 0.0,
+                "evictions": dict(self._stats.evictions),
+            }
+
+    def _refresh_size(self, session_id: str, entry: SessionEntry) -> None:
+        with self._lock:
+            base_size, base_count = entry.size_bytes, entry.counted_messages
+
+        # 백엔드 히스토리는 messages 접근이 SQLite / Redis 왕복이므로 락 밖에서 읽는다
+        chat_memory = getattr(entry.memory, "chat_memory", None)
+        messages = getattr(chat_memory, "messages", None) or []
+
+        if len(messages) < base_count:
+            # clear() 등으로 메시지가 줄어든 경우 전체 재계산
+            size = sum(_message_bytes(m) for m in messages)
+        else:
+            size = base_size + sum(_message_bytes(m) for m in messages[base_count:])
+
+        with self._lock:
+            if self._entries.get(session_id) is not entry:
+                return  # 그 사이 제거됨
+            # 다른 요청이 먼저 갱신했다면 그쪽 값을 유지한다
+            if (entry.size_bytes, entry.counted_messages) == (base_size, base_count):
+                self._total_bytes += size - entry.size_bytes
+                entry.size_bytes = size
+                entry.counted_messages = len(messages)
+            self._evict_over_capacity(keep=session_id)
+
+    def _evict(self, session_id: str, reason: str) -> None:
+        entry = self._entries.pop(session_id)
+        self._total_bytes -= entry.size_bytes
+        self._stats.evictions[reason] += 1
+        if self.on_evict is not None:
+            self.on_evict(session_id)
+
+    def _evict_expired(self, now: float) -> None:
+        if self.idle_ttl_sec <= 0:
+            return
+        # OrderedDict 는 접근 순서로 정렬되어 있으므로 앞쪽부터 만료 여부 확인
+        for session_id, entry in list(self._entries.items()):
+            if now - entry.last_access < self.idle_ttl_sec:
+                break
+            if entry.pins == 0:
+                self._evict(session_id, "ttl")
+
+    def _evict_over_capacity(self, keep: str) -> None:
+        if not self._over_capacity():
+            return
+        # 오래된 순으로, 사용 중(pin)이거나 방금 접근한 세션은 건너뛴다
+        candidates = [
+            session_id
+            for session_id, entry in self._entries.items()
+            if entry.pins == 0 and session_id != keep
+        ]
+        for session_id in candidates:
+            if self.max_entries > 0 and len(self._entries) > self.max_entries:
+                self._evict(session_id, "lru")
+            elif self.max_bytes > 0 and self._total_bytes > self.max_bytes:
+                self._evict(session_id, "bytes")
+            else:
+                break
+
+    def _over_capacity(self) -> bool:
+        return (self.max_entries > 0 and len(self._entries) > self.max_entries) or (
+            self.max_bytes > 0 and self._total_bytes > self.max_bytes
+        )
+
+
+def new_conversation_memory(
+    chat_memory: Optional[BaseChatMessageHistory] = None,
+) -> ConversationBufferMemory:
+    extra: Dict[str, Any] = {"chat_memory": chat_memory} if chat_memory else {}
+    return ConversationBufferMemory(
+        **extra,
+        memory_key="history",
+        input_key="input",
+        output_key="output",
+        return_messages=False,
+    )
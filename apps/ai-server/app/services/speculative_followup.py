@@ -0,0 +1,97 @@
+import asyncio
+from typing import Optional
+
+from langchain.memory import ConversationBufferMemory
+
+from app.models.evaluation import (
+    AnswerWithFollowupRequest,
+    AnswerWithFollowupResult,
+    TailDecision,
+)
+from app.models.followup import FollowupRequest
+from app.services.answer_evaluator import EvaluationService
+from app.services.followup_generator import FollowupGeneratorService
+from app.utils.llm_utils import agroq_chat
+
+
+class SpeculativeFollowupService:
+    """
+    답변 평가와 꼬리질문 생성을 동시에 시작해 LLM 왕복 한 번을 임계 경로에서 뺀다.
+
+    - 꼬리질문은 평가 결과(evaluation_summary) 없이 질문/답변만으로 미리 생성
+    - 평가가 create 이면 꼬리질문을 반환하고, skip 이면 꼬리질문 호출을 취소(버림)
+      (temperature 0.8 / seed 없음이라 LLM 캐시 대상이 아니므로 버린 결과는 재사용되지 않는다.
+      이후 /followup/followup-generating 요청은 evaluation_summary 를 포함해 새로 생성한다)
+    - 메모리 기록 순서는 항상 ANSWER_EVALUATION → TAIL_QUESTION
+    """
+
+    def __init__(
+        self,
+        memory: Optional[ConversationBufferMemory] = None,
+        session_id: str = "",
+    ):
+        self.memory = memory
+        self.session_id = session_id
+        self.evaluator = EvaluationService(memory=memory, session_id=session_id)
+        self.followups = FollowupGeneratorService(memory=memory, session_id=session_id)
+
+    @staticmethod
+    def _followup_request(req: AnswerWithFollowupRequest) -> FollowupRequest:
+        return FollowupRequest(
+            question_id=req.question_id,
+            category=req.category,
+            question_text=req.question_text,
+            criteria=req.criteria,
+            skills=req.skills,
+            user_answer=req.user_answer,
+            remaining_time_sec=req.remaining_time_sec,
+            remaining_main_questions=req.remaining_main_questions,
+            depth=req.depth,
+            use_tailored_category=req.use_tailored_category,
+            auto_sequence=req.auto_sequence,
+            next_followup_index=req.next_followup_index,
+        )
+
+    async def aevaluate_with_followup(
+        self,
+        req: AnswerWithFollowupRequest = ...,
+        memory: Optional[ConversationBufferMemory] = ...,
+    ) -> AnswerWithFollowupResult:
+        followup_req = self._followup_request(req)
+        # _build_prompt 는 요청 필드만 쓰고 메모리/이벤트 로그를 읽지 않으므로 평가 전에
+        # 만들어도 된다. 이벤트 로그에 의존하는 번호 매기기(기존 꼬리질문 수)는
+        # 평가가 기록된 뒤 _finalize 에서 계산된다.
+        followup_task = asyncio.ensure_future(
+            agroq_chat(self.followups._build_prompt(followup_req), max_tokens=2048)
+        )
+        # 버린 꼬리질문 호출의 예외가 "never retrieved" 경고로 남지 않도록
+        followup_task.add_done_callback(lambda t: t.cancelled() or t.exception())
+
+        try:
+            if self.evaluator._is_truly_empty_answer(req.user_answer):
+                evaluation = self.evaluator._evaluate_empty_answer(req)
+            else:
+                content = await agroq_chat(
+                    self.evaluator._build_answer_prompt(req), max_tokens=2048
+                )
+                evaluation = self.evaluator._finalize_answer(content)
+        except BaseException:
+            followup_task.cancel()
+            raise
+
+        if evaluation.tail_decision != TailDecision.create:
+            followup_task.cancel()
+            return AnswerWithFollowupResult(evaluation=evaluation)
+
+        try:
+            content = await followup_task
+            followup = self.followups._finalize(content, followup_req, memory)
+        except Exception as e:
+            # 평가는 이미 기록되었으므로 꼬리질문만 실패로 돌려주고,
+            # 클라이언트는 /followup/followup-generating 으로 다시 요청할 수 있다
+            return AnswerWithFollowupResult(
+                evaluation=evaluation,
+                followup_error=f"{type(e).__name__}: {e}",
+            )
+
+        return AnswerWithFollowupResult(evaluation=evaluation, followup=followup)
@@ -0,0 +1,271 @@
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+# 디스크 상한을 넘으면 이 비율까지 줄여, 상한 근처에서 쓰기마다 재스캔하지 않도록 한다
+DISK_EVICT_TARGET_RATIO = 0.9
+
+
+def content_key(*parts: Any) -> str:
+    """bytes / str / JSON 직렬화 가능한 값들로 sha256 캐시 키를 만든다"""
+
+    h = hashlib.sha256()
+    for part in parts:
+        if isinstance(part, bytes):
+            data = part
+        elif isinstance(part, str):
+            data = part.encode("utf-8")
+        else:
+            data = json.dumps(part, sort_keys=True, ensure_ascii=False).encode("utf-8")
+        h.update(len(data).to_bytes(8, "big"))
+        h.update(data)
+    return h.hexdigest()
+
+
+class TieredCache:
+    """
+    JSON 값을 저장하는 2단 캐시.
+
+    - memory: 프로세스 내 LRU (항목 수 / 바이트 상한)
+    - ttl_sec: 0 이 아니면 저장 후 ttl_sec 가 지난 값은 두 계층 모두에서 무시
+    - disk:   dir 가 주어진 경우에만 사용. 키마다 파일 하나를 임시 파일 +
+              os.replace 로 원자적으로 써서 여러 워커 프로세스가 같은
+              디렉터리를 공유해도 반쯤 쓰인 값을 읽지 않는다.
+              전체 크기가 disk_max_bytes 를 넘으면 오래 읽히지 않은 파일부터
+              상한의 DISK_EVICT_TARGET_RATIO 까지 삭제.
+              전체 크기는 시작 시 한 번 스캔한 뒤 쓰기마다 누적해 두고, 상한을
+              넘었을 때만 디렉터리를 다시 스캔한다 (다른 프로세스가 쓴 파일은
+              다음 스캔 때 반영된다).
+
+    값은 직렬화된 바이트로 보관하므로 get 은 매번 새 객체를 돌려준다.
+    """
+
+    def __init__(
+        self,
+        name: str = "",
+        max_entries: int = 128,
+        max_bytes: int = 64 * 1024 * 1024,
+        dir: Optional[str] = None,
+        disk_max_bytes: int = 512 * 1024 * 1024,
+        ttl_sec: float = 0,
+        clock=time.time,
+    ):
+        self.name = name
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.dir = dir or None
+        self.disk_max_bytes = disk_max_bytes
+        self.ttl_sec = ttl_sec
+        self._clock = clock
+
+        self._lock = threading.Lock()
+        # key -> (만료 시각 또는 None, 직렬화된 값)
+        self._entries: "OrderedDict[str, Tuple[Optional[float], bytes]]" = OrderedDict()
+        self._bytes = 0
+        self._stats = {
+            "memory_hits": 0,
+            "disk_hits": 0,
+            "misses": 0,
+            "puts": 0,
+            "memory_evictions": 0,
+            "disk_evictions": 0,
+            "expired": 0,
+            "disk_errors": 0,
+        }
+
+        self._disk_lock = threading.Lock()
+        self._disk_bytes = 0
+        if self.dir:
+            os.makedirs(self.dir, exist_ok=True)
+            if self.disk_max_bytes:
+                self._disk_bytes = sum(size for _, size, _ in self._disk_files())
+
+    def _expired(self, expires_at: Optional[float]) -> bool:
+        return expires_at is not None and expires_at <= self._clock()
+
+    # memory tier
+    def _remember(self, key: str, expires_at: Optional[float], data: bytes) -> None:
+        if self.max_bytes and len(data) > self.max_bytes:
+            return
+
+        self._forget(key)
+        self._entries[key] = (expires_at, data)
+        self._bytes += len(data)
+
+        while self._entries and (
+            (self.max_entries and len(self._entries) > self.max_entries)
+            or (self.max_bytes and self._bytes > self.max_bytes)
+        ):
+            _, (_, evicted) = self._entries.popitem(last=False)
+            self._bytes -= len(evicted)
+            self._stats["memory_evictions"] += 1
+
+    def _forget(self, key: str) -> None:
+        old = self._entries.pop(key, None)
+        if old is not None:
+            self._bytes -= len(old[1])
+
+    # disk tier
+    def _path(self, key: str) -> str:
+        return os.path.join(self.dir, key[:2], key + ".json")
+
+    def _read_disk(self, key: str) -> Optional[bytes]:
+        path = self._path(key)
+        try:
+            with open(path, "rb") as f:
+                data = f.read()
+            os.utime(path)  # LRU 순서 갱신
+            return data
+        except FileNotFoundError:
+            return None
+        except OSError:
+            self._stats["disk_errors"] += 1
+            return None
+
+    def _write_disk(self, key: str, data: bytes) -> None:
+        path = self._path(key)
+        try:
+            old_size = os.stat(path).st_size
+        except OSError:
+            old_size = 0
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    f.write(data)
+                os.replace(tmp_path, path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+        except OSError:
+            self._stats["disk_errors"] += 1
+            return
+
+        with self._disk_lock:
+            self._disk_bytes += len(data) - old_size
+            if self.disk_max_bytes and self._disk_bytes > self.disk_max_bytes:
+                self._evict_disk()
+
+    def _disk_files(self):
+        for sub in os.scandir(self.dir):
+            if not sub.is_dir():
+                continue
+            for entry in os.scandir(sub.path):
+                if entry.name.endswith(".json"):
+                    try:
+                        st = entry.stat()
+                    except FileNotFoundError:
+                        continue  # 다른 프로세스가 먼저 삭제
+                    yield entry.path, st.st_size, st.st_mtime
+
+    def _evict_disk(self) -> None:
+        """디렉터리를 다시 스캔해 누적 크기를 맞추고, 상한을 넘으면 오래된 파일부터 삭제"""
+
+        files = list(self._disk_files())
+        total = sum(size for _, size, _ in files)
+        self._disk_bytes = total
+        if total <= self.disk_max_bytes:
+            return
+
+        target = int(self.disk_max_bytes * DISK_EVICT_TARGET_RATIO)
+        for path, size, _ in sorted(files, key=lambda f: f[2]):
+            try:
+                os.remove(path)
+                self._stats["disk_evictions"] += 1
+            except FileNotFoundError:
+                pass
+            total -= size
+            if total <= target:
+                break
+        self._disk_bytes = total
+
+    def _disk_usage(self) -> Dict[str, int]:
+        files = list(self._disk_files())
+        return {
+            "disk_entries": len(files),
+            "disk_bytes": sum(size for _, size, _ in files),
+        }
+
+    # public API
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                expires_at, data = entry
+                if not self._expired(expires_at):
+                    self._entries.move_to_end(key)
+                    self._stats["memory_hits"] += 1
+                    return json.loads(data)
+                self._forget(key)
+                self._stats["expired"] += 1
+
+        if self.dir:
+            raw = self._read_disk(key)
+            if raw is not None:
+                # 디스크 항목: {"expires_at": float | null, "value": ...}
+                try:
+                    record = json.loads(raw)
+                    expires_at, value = record["expires_at"], record["value"]
+                except (ValueError, TypeError, KeyError):
+                    expires_at, value = None, None
+                if value is not None and not self._expired(expires_at):
+                    data = json.dumps(
+                        value, ensure_ascii=False, separators=(",", ":")
+                    ).encode("utf-8")
+                    with self._lock:
+                        self._remember(key, expires_at, data)
+                        self._stats["disk_hits"] += 1
+                    return value
+
+        with self._lock:
+            self._stats["misses"] += 1
+        return None
+
+    def set(self, key: str, value: Any) -> None:
+        expires_at = self._clock() + self.ttl_sec if self.ttl_sec else None
+        data = json.dumps(value, ensure_ascii=False, separators=(",", ":")).encode(
+            "utf-8"
+        )
+        with self._lock:
+            self._remember(key, expires_at, data)
+            self._stats["puts"] += 1
+
+        if self.dir:
+            record = json.dumps(
+                {"expires_at": expires_at, "value": value},
+                ensure_ascii=False,
+                separators=(",", ":"),
+            ).encode("utf-8")
+            self._write_disk(key, record)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            stats: Dict[str, Any] = dict(self._stats)
+            stats.update(
+                name=self.name,
+                memory_entries=len(self._entries),
+                memory_bytes=self._bytes,
+                max_entries=self.max_entries,
+                max_bytes=self.max_bytes,
+                ttl_sec=self.ttl_sec,
+                disk_dir=self.dir,
+                disk_max_bytes=self.disk_max_bytes if self.dir else 0,
+            )
+
+        hits = stats["memory_hits"] + stats["disk_hits"]
+        lookups = hits + stats["misses"]
+        stats["hit_ratio"] = round(hits / lookups, 4) if lookups else 0.0
+        if self.dir:
+            stats.update(self._disk_usage())
+        return stats
@@ -1,59 +1,46 @@
-import json
-from typing import Dict, List
+from typing import List
 from statistics import mean
 from langchain.memory import ConversationBufferMemory
 
+from app.services.session_events import get_event_log
+
 
 def extract_evaluation(
     memory: ConversationBufferMemory
 ) -> tuple[float, str]:
-    msgs = memory.chat_memory.messages
-    qa_pairs: List[Dict] = []
+    events = get_event_log(memory)
     scores: List[float] = []
     conversation_blocks: List[str] = []
 
-    last_human = None
-
-    for m in msgs:
-        if m.type == "human":
-            last_human = m.content.strip()
-
-        elif m.type == "ai":
-            content = m.content.strip()
-            if content.startswith("{") and '"overall_score"' in content:
-                try:
-                    parsed = json.loads(content)
-                    qid = parsed.get("question_id")
-                    score = parsed.get("overall_score")
-                    feedback = parsed.get("feedback")
-
-                    if qid is None:
-                        continue
-                        
-                    qa = {
-                        "question_id": qid,
-                        "overall_score": score,
-                        "answer_text": last_human or "",
-                        "feedback": feedback or "",
-                    }
-                    qa_pairs.append(qa)
-
-                    if score is not None:
-                        scores.append(score)
-
-                    block = (
-                        f"QID: {qid}\n"
-                        f"Answer: {last_human or ''}\n"
-                        f"Feedback: {feedback or ''}"
-                    )
-                    conversation_blocks.append(block)
-
-                    last_human = None # Reset after processing
-
-                except json.JSONDecodeError:
-                    continue
-    
-    avg_score = round(mean(scores), 2) 
+    for ev in events.events("ANSWER_EVALUATION"):
+        parsed = ev.payload
+        if not isinstance(parsed, dict) or "overall_score" not in parsed:
+            continue
+
+        qid = ev.question_id
+        if qid is None:
+            continue
+
+        score = parsed.get("overall_score")
+        feedback = parsed.get("feedback")
+
+        # 해당 평가 직전에 기록된 같은 질문의 사용자 답변
+        answer_ev = events.latest("USER_ANSWER", qid, before_seq=ev.seq)
+        answer_text = ""
+        if answer_ev is not None and isinstance(answer_ev.payload, dict):
+            answer_text = str(answer_ev.payload.get("answer") or "")
+
+        if score is not None:
+            scores.append(score)
+
+        block = (
+            f"QID: {qid}\n"
+            f"Answer: {answer_text}\n"
+            f"Feedback: {feedback or ''}"
+        )
+        conversation_blocks.append(block)
+
+    avg_score = round(mean(scores), 2)
     conversation_text = "\n\n".join(conversation_blocks)
 
     return float(avg_score), conversation_text
@@ -0,0 +1,154 @@
+import os
+from dataclasses import dataclass
+from typing import Any, Iterator, Optional, Tuple
+
+import cv2
+
+TARGET_SAMPLES = 100
+
+# 프레임 샘플링 방식
+# - seek: 필요한 프레임 위치로 바로 이동해서 해당 프레임만 디코딩
+# - grab: 모든 프레임을 grab 하되, 샘플 프레임만 retrieve(변환/복사)
+# - read: 모든 프레임을 read (기존 방식)
+VIDEO_SAMPLING_MODE = os.getenv("VIDEO_SAMPLING_MODE", "seek")
+
+# 다음 샘플까지의 간격이 이 값 이하이면 seek 대신 grab 으로 전진
+SEEK_MIN_GAP = int(os.getenv("VIDEO_SEEK_MIN_GAP", "8"))
+
+
+@dataclass
+class SamplingStats:
+    mode: str = ""
+    decoded: int = 0  # grab/read 호출 수 (seek 시 키프레임부터의 내부 디코딩은 제외)
+    sampled: int = 0  # 실제로 분석에 넘긴 프레임 수
+    seeks: int = 0
+    fallback: bool = False
+
+
+def _read_sequential(
+    cap: cv2.VideoCapture,
+    sample_rate: int,
+    start_frame: int,
+    retrieve_all: bool,
+    stats: SamplingStats,
+) -> Iterator[Tuple[int, Any]]:
+    """start_frame(1-based) 이후의 프레임을 순차적으로 훑으며 샘플 프레임만 반환"""
+    frame_idx = start_frame
+    while True:
+        if retrieve_all:
+            ret, frame = cap.read()
+        else:
+            ret = cap.grab()
+            frame = None
+        if not ret:
+            return
+        stats.decoded += 1
+        frame_idx += 1
+        if frame_idx % sample_rate != 0:
+            continue
+
+        if frame is None:
+            ret, frame = cap.retrieve()
+            if not ret:
+                continue
+        yield frame_idx, frame
+
+
+def _read_seeking(
+    cap: cv2.VideoCapture,
+    sample_rate: int,
+    total_frames: int,
+    stats: SamplingStats,
+) -> Iterator[Tuple[int, Optional[Any]]]:
+    """
+    샘플 위치로 seek 해서 필요한 프레임만 디코딩한다.
+    seek 결과를 믿을 수 없으면 (마지막으로 반환한 프레임 번호, None)을
+    yield 하고 종료한다.
+    """
+    position = 0  # 다음 grab 으로 디코딩될 프레임의 0-based 위치
+    for target in range(sample_rate, total_frames + 1, sample_rate):
+        wanted = target - 1
+        gap = wanted - position
+        if gap < 0 or gap > SEEK_MIN_GAP:
+            stats.seeks += 1
+            if not cap.set(cv2.CAP_PROP_POS_FRAMES, wanted):
+                yield target - sample_rate, None
+                return
+            position = wanted
+        else:
+            while position < wanted:
+                if not cap.grab():
+                    return
+                stats.decoded += 1
+                position += 1
+
+        ret, frame = cap.read()
+        if not ret:
+            # 프레임 수가 실제보다 크게 기록된 컨테이너: 끝까지 읽은 것으로 간주
+            return
+        stats.decoded += 1
+        position += 1
+
+        reported = int(cap.get(cv2.CAP_PROP_POS_FRAMES))
+        if reported > 0 and reported != position:
+            yield target - sample_rate, None
+            return
+        yield target, frame
+
+    # 프레임 수가 실제보다 작게 기록된 경우를 위해 나머지 구간은 순차적으로 확인
+    yield from _read_sequential(cap, sample_rate, position, False, stats)
+
+
+def sample_frames(
+    path: str = "",
+    target_samples: int = TARGET_SAMPLES,
+    mode: str = VIDEO_SAMPLING_MODE,
+    stats: Optional[SamplingStats] = None,
+) -> Iterator[Tuple[int, float, Any]]:
+    """
+    영상에서 약 target_samples 개의 프레임을 균등 간격으로 뽑아
+    (프레임 번호(1-based), 시간(초), RGB 프레임)을 반환한다.
+    """
+    stats = stats if stats is not None else SamplingStats()
+
+    cap = cv2.VideoCapture(path)
+    if not cap.isOpened():
+        raise ValueError(f"Cannot open video file: {path}")
+
+    try:
+        total_frames = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
+        fps = cap.get(cv2.CAP_PROP_FPS) or 30  # 기본값 30
+        sample_rate = max(1, total_frames // target_samples)  # 최소 1로 보장
+
+        if mode == "seek" and (total_frames <= 0 or sample_rate <= SEEK_MIN_GAP):
+            # 프레임 수를 알 수 없거나 간격이 좁으면 seek 이득이 없음
+            mode = "grab"
+        stats.mode = mode
+
+        frames: Iterator[Tuple[int, Optional[Any]]]
+        if mode == "seek":
+            frames = _read_seeking(cap, sample_rate, total_frames, stats)
+        else:
+            frames = _read_sequential(cap, sample_rate, 0, mode == "read", stats)
+
+        for frame_idx, frame in frames:
+            if frame is None:
+                # seek 불가 → 처음부터 다시 열어 마지막 샘플 이후를 순차적으로 처리
+                stats.fallback = True
+                cap.release()
+                cap = cv2.VideoCapture(path)
+                for seq_idx, seq_frame in _read_sequential(
+                    cap, sample_rate, 0, False, stats
+                ):
+                    if seq_idx <= frame_idx:
+                        continue
+                    stats.sampled += 1
+                    rgb = cv2.cvtColor(seq_frame, cv2.COLOR_BGR2RGB)
+                    yield seq_idx, seq_idx / fps, rgb
+                break
+
+            stats.sampled += 1
+            rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+            yield frame_idx, frame_idx / fps, rgb
+    finally:
+        cap.release()
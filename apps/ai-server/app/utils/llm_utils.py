@@ -1,10 +1,23 @@
+import inspect
 import os
 import re
+import threading
+import time
+from contextvars import ContextVar
 from pathlib import Path
-from typing import Optional
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
 
 from dotenv import load_dotenv
 
+from app.utils.cache import TieredCache, content_key
+from app.utils.prompt_budget import estimate_tokens
+from app.utils.rate_limiter import (
+    PRIORITY_INTERACTIVE,
+    RateLimitedError,
+    RateScheduler,
+)
+from app.utils.single_flight import AsyncSingleFlight, SingleFlight
+
 load_dotenv()
 
 PROMPT_BASE_DIR = (
@@ -31,37 +44,493 @@ def strip_json(
     return text[i : j + 1] if i != -1 and j != -1 and j > i else text
 
 
-def _get_groq_client():
+LLM_DEFAULT_MODEL = "llama-3.1-8b-instant"
+
+# Groq 클라이언트 커넥션 풀 설정 (프로세스 전역에서 공유)
+GROQ_MAX_CONNECTIONS = int(os.getenv("GROQ_MAX_CONNECTIONS", "100"))
+GROQ_MAX_KEEPALIVE_CONNECTIONS = int(os.getenv("GROQ_MAX_KEEPALIVE_CONNECTIONS", "20"))
+GROQ_KEEPALIVE_EXPIRY_SEC = float(os.getenv("GROQ_KEEPALIVE_EXPIRY_SEC", "30"))
+GROQ_CONNECT_TIMEOUT_SEC = float(os.getenv("GROQ_CONNECT_TIMEOUT_SEC", "5"))
+GROQ_TIMEOUT_SEC = float(os.getenv("GROQ_TIMEOUT_SEC", "60"))
+# SDK 자체 재시도 횟수. 호출 예산(스케줄러)을 켜면 429 재시도는 스케줄러가 맡으므로 0
+GROQ_MAX_RETRIES = int(os.getenv("GROQ_MAX_RETRIES", "2"))
+
+_groq_clients: Dict[str, Any] = {}
+_groq_clients_lock = threading.Lock()
+
+
+def _get_groq_api_key() -> str:
     groq_key = os.getenv("GROQ_API_KEY")
     if not groq_key:
         raise ValueError(
             "GROQ_API_KEY is not set in environment variables or .env file."
         )
+    return groq_key
+
+
+def _groq_http_options() -> Dict[str, Any]:
+    import httpx
+
+    return {
+        "limits": httpx.Limits(
+            max_connections=GROQ_MAX_CONNECTIONS,
+            max_keepalive_connections=GROQ_MAX_KEEPALIVE_CONNECTIONS,
+            keepalive_expiry=GROQ_KEEPALIVE_EXPIRY_SEC,
+        ),
+        "timeout": httpx.Timeout(GROQ_TIMEOUT_SEC, connect=GROQ_CONNECT_TIMEOUT_SEC),
+    }
+
+
+def _client_max_retries() -> int:
+    # SDK 가 429 를 직접 재시도하면 스케줄러 재시도와 겹치고 예산에도 잡히지 않는다
+    return 0 if _rate_scheduler.enabled else GROQ_MAX_RETRIES
+
+
+def _create_groq_client():
+    groq_key = _get_groq_api_key()
     try:
-        from groq import Groq
+        from groq import DefaultHttpxClient, Groq
 
-        return Groq(api_key=groq_key)
+        return Groq(
+            api_key=groq_key,
+            max_retries=_client_max_retries(),
+            http_client=DefaultHttpxClient(**_groq_http_options()),
+        )
     except Exception as e:
         raise RuntimeError("Failed to import or create Groq client: %s" % e)
 
 
+def _create_async_groq_client():
+    groq_key = _get_groq_api_key()
+    try:
+        from groq import AsyncGroq, DefaultAsyncHttpxClient
+
+        return AsyncGroq(
+            api_key=groq_key,
+            max_retries=_client_max_retries(),
+            http_client=DefaultAsyncHttpxClient(**_groq_http_options()),
+        )
+    except Exception as e:
+        raise RuntimeError("Failed to import or create AsyncGroq client: %s" % e)
+
+
+def _get_registered_client(kind: str, factory):
+    client = _groq_clients.get(kind)
+    if client is not None:
+        return client
+
+    with _groq_clients_lock:
+        client = _groq_clients.get(kind)
+        if client is None:
+            client = factory()
+            _groq_clients[kind] = client
+    return client
+
+
+def _get_groq_client():
+    """
+    프로세스 전역에서 공유하는 Groq 클라이언트를 반환한다.
+    keep-alive 커넥션 풀을 재사용하므로 요청마다 TLS 핸드셰이크를 하지 않는다.
+    """
+    return _get_registered_client("sync", _create_groq_client)
+
+
+def _get_async_groq_client():
+    return _get_registered_client("async", _create_async_groq_client)
+
+
+def close_groq_clients() -> None:
+    """
+    동기 클라이언트만 닫는다. 비동기 클라이언트의 close() 는 이벤트 루프에서
+    await 해야 하므로 등록된 채로 두고 aclose_groq_clients 에서 닫는다.
+    """
+    with _groq_clients_lock:
+        client = _groq_clients.pop("sync", None)
+
+    if client is not None:
+        client.close()
+
+
+async def aclose_groq_clients() -> None:
+    with _groq_clients_lock:
+        clients = list(_groq_clients.values())
+        _groq_clients.clear()
+
+    for client in clients:
+        result = client.close()
+        if inspect.iscoroutine(result):
+            await result
+
+
+def _chat_request(
+    prompt_text: str,
+    model: str,
+    max_tokens: int,
+    temperature: float,
+    response_format: Optional[dict],
+    seed: Optional[int] = None,
+) -> Dict[str, Any]:
+    request = {
+        "messages": [{"role": "user", "content": prompt_text}],
+        "model": model,
+        "max_tokens": max_tokens,
+        "temperature": temperature,
+        "response_format": response_format or {"type": "json_object"},
+    }
+    if seed is not None:
+        request["seed"] = seed
+    return request
+
+
+# LLM 응답 캐시 (opt-in): model / temperature / max_tokens / response_format / seed / 프롬프트 기준
+# 결정적인 요청(temperature == 0 또는 seed 지정)만 캐시한다. 그 외 요청은 매번 새로 샘플링.
+LLM_CACHE_ENABLED = os.getenv("LLM_CACHE_ENABLED", "0") == "1"
+LLM_CACHE_TTL_SEC = float(os.getenv("LLM_CACHE_TTL_SEC", "3600"))
+LLM_CACHE_MAX_ENTRIES = int(os.getenv("LLM_CACHE_MAX_ENTRIES", "1024"))
+LLM_CACHE_MAX_BYTES = int(os.getenv("LLM_CACHE_MAX_BYTES", str(32 * 1024 * 1024)))
+LLM_CACHE_DIR = os.getenv("LLM_CACHE_DIR", "")
+LLM_CACHE_DISK_MAX_BYTES = int(os.getenv("LLM_CACHE_DISK_MAX_BYTES", str(256 * 1024 * 1024)))
+
+_llm_cache: Optional[TieredCache] = (
+    TieredCache(
+        name="llm",
+        max_entries=LLM_CACHE_MAX_ENTRIES,
+        max_bytes=LLM_CACHE_MAX_BYTES,
+        dir=LLM_CACHE_DIR or None,
+        disk_max_bytes=LLM_CACHE_DISK_MAX_BYTES,
+        ttl_sec=LLM_CACHE_TTL_SEC,
+    )
+    if LLM_CACHE_ENABLED else None
+)
+_llm_cache_counters = {"bypasses": 0, "uncacheable": 0, "saved_latency_ms": 0.0}
+_llm_cache_counters_lock = threading.Lock()
+
+# 요청 단위 캐시 우회 (X-LLM-Cache: bypass 헤더 → LLMCacheBypassMiddleware 가 설정)
+llm_cache_bypass: ContextVar[bool] = ContextVar("llm_cache_bypass", default=False)
+
+
+def _request_key(request: Dict[str, Any]) -> str:
+    return content_key(
+        request["model"],
+        request["temperature"],
+        request["max_tokens"],
+        request["response_format"],
+        request.get("seed"),
+        content_key(request["messages"][0]["content"]),
+    )
+
+
+def _cacheable(request: Dict[str, Any]) -> bool:
+    return request["temperature"] == 0 or request.get("seed") is not None
+
+
+def _cached_completion(request: Dict[str, Any], key: str) -> Optional[str]:
+    if _llm_cache is None:
+        return None
+
+    if not _cacheable(request):
+        with _llm_cache_counters_lock:
+            _llm_cache_counters["uncacheable"] += 1
+        return None
+
+    if llm_cache_bypass.get():
+        with _llm_cache_counters_lock:
+            _llm_cache_counters["bypasses"] += 1
+        return None
+
+    cached = _llm_cache.get(key)
+    if cached is None:
+        return None
+
+    with _llm_cache_counters_lock:
+        _llm_cache_counters["saved_latency_ms"] += cached["latency_ms"]
+    return cached["content"]
+
+
+def _store_completion(
+    request: Dict[str, Any], key: str, content: str, started: float
+) -> None:
+    if _llm_cache is None or not _cacheable(request):
+        return
+    _llm_cache.set(
+        key,
+        {
+            "content": content,
+            "latency_ms": round((time.perf_counter() - started) * 1000, 1),
+        },
+    )
+
+
+def llm_cache_stats() -> Dict[str, Any]:
+    if _llm_cache is None:
+        return {"enabled": False}
+
+    stats = _llm_cache.stats()
+    with _llm_cache_counters_lock:
+        stats.update(
+            enabled=True,
+            bypasses=_llm_cache_counters["bypasses"],
+            uncacheable=_llm_cache_counters["uncacheable"],
+            saved_latency_ms=round(_llm_cache_counters["saved_latency_ms"], 1),
+        )
+    return stats
+
+
+# 같은 요청(캐시 키 기준)이 동시에 여러 번 들어오면 업스트림 호출 하나의 결과를 공유한다.
+# 캐시 사용 여부와 무관하게 동작하며, 실행 중인 요청만 합치므로 결과를 보관하지는 않는다.
+LLM_SINGLE_FLIGHT = os.getenv("LLM_SINGLE_FLIGHT", "1") == "1"
+
+_single_flight = SingleFlight()
+_async_single_flight = AsyncSingleFlight()
+
+
+def llm_single_flight_stats() -> Dict[str, Any]:
+    calls = _single_flight.calls + _async_single_flight.calls
+    coalesced = _single_flight.coalesced + _async_single_flight.coalesced
+    return {
+        "enabled": LLM_SINGLE_FLIGHT,
+        "calls": calls,
+        "coalesced": coalesced,
+        "upstream_calls": calls - coalesced,
+        "in_flight": _single_flight.in_flight() + _async_single_flight.in_flight(),
+    }
+
+
+# 클라이언트 측 호출 예산 (Groq 조직 한도에 맞춰 설정, 0이면 제한 없음)
+LLM_RATE_LIMIT_RPM = float(os.getenv("LLM_RATE_LIMIT_RPM", "0"))
+LLM_RATE_LIMIT_TPM = float(os.getenv("LLM_RATE_LIMIT_TPM", "0"))
+LLM_RATE_LIMIT_MAX_QUEUE = int(os.getenv("LLM_RATE_LIMIT_MAX_QUEUE", "256"))
+LLM_RATE_LIMIT_MAX_WAIT_SEC = float(os.getenv("LLM_RATE_LIMIT_MAX_WAIT_SEC", "30"))
+# 업스트림 429 를 받았을 때 스케줄러를 거쳐 다시 시도하는 횟수
+LLM_RATE_LIMIT_RETRIES = int(os.getenv("LLM_RATE_LIMIT_RETRIES", "2"))
+
+_rate_scheduler = RateScheduler(
+    rpm=LLM_RATE_LIMIT_RPM,
+    tpm=LLM_RATE_LIMIT_TPM,
+    max_queue=LLM_RATE_LIMIT_MAX_QUEUE,
+    max_wait_sec=LLM_RATE_LIMIT_MAX_WAIT_SEC,
+)
+
+
+def _estimate_tokens(request: Dict[str, Any]) -> int:
+    # 프롬프트 + 최대 응답 토큰으로 예약하고 응답 후 usage 로 보정
+    return estimate_tokens(request["messages"][0]["content"]) + request["max_tokens"]
+
+
+def _upstream_retry_after(e: BaseException) -> Optional[float]:
+    """업스트림 429 이면 retry-after(초), 아니면 None"""
+
+    if getattr(e, "status_code", None) != 429:
+        return None
+    response = getattr(e, "response", None)
+    try:
+        return float(response.headers.get("retry-after", "1"))
+    except (AttributeError, TypeError, ValueError):
+        return 1.0
+
+
+def _used_tokens(chat_completion) -> Optional[int]:
+    usage = getattr(chat_completion, "usage", None)
+    if usage is None:
+        # 스트리밍 응답은 마지막 청크의 x_groq.usage 에 사용량이 온다
+        usage = getattr(getattr(chat_completion, "x_groq", None), "usage", None)
+    return getattr(usage, "total_tokens", None)
+
+
+def llm_rate_limit_stats() -> Dict[str, Any]:
+    return _rate_scheduler.stats()
+
+
+class LLMCacheBypassMiddleware:
+    """X-LLM-Cache: bypass 요청은 캐시를 읽지 않고 새 응답으로 갱신한다"""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+
+        headers = dict(scope.get("headers") or [])
+        bypass = headers.get(b"x-llm-cache", b"").strip().lower() == b"bypass"
+        token = llm_cache_bypass.set(bypass)
+        try:
+            return await self.app(scope, receive, send)
+        finally:
+            llm_cache_bypass.reset(token)
+
+
+def _completion_content(chat_completion) -> str:
+    content = chat_completion.choices[0].message.content
+    if content is None:
+        raise ValueError("Groq API returned no content.")
+    return content
+
+
+def _create(
+    client, request: Dict[str, Any], estimated: int, priority: str
+) -> Tuple[Any, float]:
+    """호출 예산을 받아 업스트림을 호출한다. (응답, 호출 시작 시각) 반환"""
+
+    for attempt in range(LLM_RATE_LIMIT_RETRIES + 1):
+        _rate_scheduler.acquire(priority, estimated)
+        started = time.perf_counter()
+        try:
+            return client.chat.completions.create(**request), started
+        except BaseException as e:
+            # 실패한 호출은 사용 토큰 0 으로 정산해 예약한 예상치를 돌려준다
+            _rate_scheduler.settle(estimated, 0)
+            retry_after = _upstream_retry_after(e)
+            if retry_after is None or not _rate_scheduler.enabled:
+                raise
+            _rate_scheduler.backoff(retry_after)
+            if attempt == LLM_RATE_LIMIT_RETRIES:
+                raise RateLimitedError(
+                    "LLM upstream rate limit exceeded", retry_after=retry_after
+                ) from e
+
+
+async def _acreate(
+    client, request: Dict[str, Any], estimated: int, priority: str
+) -> Tuple[Any, float]:
+    for attempt in range(LLM_RATE_LIMIT_RETRIES + 1):
+        await _rate_scheduler.aacquire(priority, estimated)
+        started = time.perf_counter()
+        try:
+            return await client.chat.completions.create(**request), started
+        except BaseException as e:
+            # 실패한 호출은 사용 토큰 0 으로 정산해 예약한 예상치를 돌려준다
+            _rate_scheduler.settle(estimated, 0)
+            retry_after = _upstream_retry_after(e)
+            if retry_after is None or not _rate_scheduler.enabled:
+                raise
+            _rate_scheduler.backoff(retry_after)
+            if attempt == LLM_RATE_LIMIT_RETRIES:
+                raise RateLimitedError(
+                    "LLM upstream rate limit exceeded", retry_after=retry_after
+                ) from e
+
+
+def _completion(request: Dict[str, Any], key: str, priority: str) -> str:
+    estimated = _estimate_tokens(request)
+    chat_completion, started = _create(_get_groq_client(), request, estimated, priority)
+
+    _rate_scheduler.settle(estimated, _used_tokens(chat_completion))
+    content = _completion_content(chat_completion)
+    _store_completion(request, key, content, started)
+    return content
+
+
+async def _acompletion(request: Dict[str, Any], key: str, priority: str) -> str:
+    estimated = _estimate_tokens(request)
+    chat_completion, started = await _acreate(
+        _get_async_groq_client(), request, estimated, priority
+    )
+
+    _rate_scheduler.settle(estimated, _used_tokens(chat_completion))
+    content = _completion_content(chat_completion)
+    _store_completion(request, key, content, started)
+    return content
+
+
 def groq_chat(
     prompt_text: str,
-    model: str = "llama-3.1-8b-instant",
+    model: str = LLM_DEFAULT_MODEL,
     max_tokens: int = 1024,
     temperature: float = 0.8,
     response_format: Optional[dict] = None,
+    priority: str = PRIORITY_INTERACTIVE,
+    seed: Optional[int] = None,
 ) -> str:
-    client = _get_groq_client()
-    response_format = response_format or {"type": "json_object"}
-    chat_completion = client.chat.completions.create(
-        messages=[{"role": "user", "content": prompt_text}],
-        model=model,
-        max_tokens=max_tokens,
-        temperature=temperature,
-        response_format=response_format,
+    """
+    priority: 호출 예산이 부족할 때의 처리 순서
+    (PRIORITY_INTERACTIVE: 면접 진행 중 호출, PRIORITY_BATCH: 세션 평가 / 질문 생성)
+    seed: 결정적 생성용 시드. temperature 가 0 이거나 seed 가 있을 때만 응답 캐시를 사용한다.
+    """
+
+    request = _chat_request(
+        prompt_text, model, max_tokens, temperature, response_format, seed
     )
-    content = chat_completion.choices[0].message.content
-    if content is None:
+    key = _request_key(request)
+    cached = _cached_completion(request, key)
+    if cached is not None:
+        return cached
+
+    if not LLM_SINGLE_FLIGHT:
+        return _completion(request, key, priority)
+    return _single_flight.run(key, lambda: _completion(request, key, priority))
+
+
+async def agroq_chat(
+    prompt_text: str,
+    model: str = LLM_DEFAULT_MODEL,
+    max_tokens: int = 1024,
+    temperature: float = 0.8,
+    response_format: Optional[dict] = None,
+    priority: str = PRIORITY_INTERACTIVE,
+    seed: Optional[int] = None,
+) -> str:
+    request = _chat_request(
+        prompt_text, model, max_tokens, temperature, response_format, seed
+    )
+    key = _request_key(request)
+    cached = _cached_completion(request, key)
+    if cached is not None:
+        return cached
+
+    if not LLM_SINGLE_FLIGHT:
+        return await _acompletion(request, key, priority)
+    return await _async_single_flight.run(
+        key, lambda: _acompletion(request, key, priority)
+    )
+
+
+async def agroq_chat_stream(
+    prompt_text: str,
+    model: str = LLM_DEFAULT_MODEL,
+    max_tokens: int = 1024,
+    temperature: float = 0.8,
+    priority: str = PRIORITY_INTERACTIVE,
+    seed: Optional[int] = None,
+) -> AsyncIterator[str]:
+    """
+    agroq_chat 의 스트리밍 버전: 생성되는 텍스트 조각(delta)을 도착하는 대로 yield 한다.
+    Groq JSON 모드는 스트리밍을 지원하지 않으므로 response_format 없이 요청하며,
+    JSON 추출은 호출한 쪽에서 전체 응답을 모은 뒤 strip_json 으로 한다.
+    캐시에 있으면 전체 응답을 한 번에 yield 하고, 끝까지 받은 응답은 캐시에 저장한다.
+    (같은 요청을 합치는 single-flight 는 적용하지 않는다)
+    """
+
+    request = _chat_request(prompt_text, model, max_tokens, temperature, None, seed)
+    del request["response_format"]
+    key = _request_key(dict(request, response_format=None))
+    cached = _cached_completion(request, key)
+    if cached is not None:
+        yield cached
+        return
+
+    estimated = _estimate_tokens(request)
+    stream, started = await _acreate(
+        _get_async_groq_client(), dict(request, stream=True), estimated, priority
+    )
+
+    parts: List[str] = []
+    used_tokens: Optional[int] = None
+    try:
+        async for chunk in stream:
+            if chunk.choices:
+                delta = chunk.choices[0].delta.content
+                if delta:
+                    parts.append(delta)
+                    yield delta
+            used_tokens = _used_tokens(chunk) or used_tokens
+    finally:
+        # 클라이언트 연결 끊김 / 업스트림 오류로 중단돼도 그때까지 받은 usage 로 정산하고
+        # 업스트림 연결을 닫는다 (usage 를 받기 전이면 예약한 예상치를 그대로 둔다)
+        _rate_scheduler.settle(estimated, used_tokens)
+        await stream.close()
+
+    content = "".join(parts)
+    if not content:
         raise ValueError("Groq API returned no content.")
-    return content
+    _store_completion(request, key, content, started)
@@ -1,98 +1,247 @@
 import re
-import io
-from io import BytesIO
-from typing import List
+import os
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, wait
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Union
 
 import fitz # PyMuPDF
 import pytesseract
 from PIL import Image
 
+from app.utils.worker_pool import BoundedProcessPool, PoolSaturatedError
 
-def is_digital_pdf(
-    file_bytes: bytes
-) -> bool:
-    
-    doc = fitz.open("pdf", file_bytes)
-    for page in doc:
-        if page.get_text("text").strip():
-            return True
-    return False
 
+# PDF 원본: 메모리의 바이트 또는 디스크의 파일 경로
+# (경로로 넘기면 OCR 워커에 파일 내용 대신 경로만 전달된다)
+PDFSource = Union[bytes, str]
 
 
-def extract_text_from_digital_pdf(
-    file_bytes: bytes
-) -> str:
+def open_pdf(
+    source: PDFSource
+) -> fitz.Document:
     
-    with fitz.open(stream=BytesIO(file_bytes), filetype="pdf") as doc:
-        text = ""
-        for page in doc:
-            text += page.get_text()
-        return text
+    if isinstance(source, str):
+        return fitz.open(source, filetype="pdf")
+    return fitz.open("pdf", source)
 
 
+OCR_DPI = 300
+OCR_LANG = "eng+kor"
+# 1이면 페이지를 처음부터 흑백(8bit)으로 렌더링 (tesseract 도 내부적으로 흑백 변환)
+OCR_GRAYSCALE = os.getenv("OCR_GRAYSCALE", "0") == "1"
+
+
+@dataclass
+class PageText:
+    page: int  # 1-based
+    text: str
+    elapsed_ms: float
+    route: str = "ocr"  # "text": 텍스트 레이어 사용 / "ocr": 렌더링 후 OCR
 
-def extract_text_from_image_pdf(
-    file_bytes: bytes
-) -> str:
-    
-    doc = fitz.open("pdf", file_bytes)
-    full_text = ""
 
-    for page_num in range(len(doc)):
-        page = doc.load_page(page_num)
-        pix = page.get_pixmap(dpi=300)
-        img_data = pix.tobytes("png")
-        image = Image.open(io.BytesIO(img_data))
+def extraction_settings() -> Dict[str, Any]:
+    """추출 결과에 영향을 주는 설정 (파싱 결과 캐시 키에 포함)"""
 
-        text = pytesseract.image_to_string(image, lang="eng+kor")
-        full_text += text + "\n"
+    return {
+        "dpi": OCR_DPI,
+        "lang": OCR_LANG,
+        "grayscale": OCR_GRAYSCALE,
+    }
 
-    return full_text
+
+def init_ocr_worker() -> None:
+    # 페이지 단위로 프로세스를 나눠 쓰므로 tesseract 내부 OpenMP 스레드는 1개로 제한
+    os.environ.setdefault("OMP_THREAD_LIMIT", "1")
+
+
+def pixmap_to_image(
+    pix: fitz.Pixmap
+) -> Image.Image:
+    """
+    렌더링된 pixmap 샘플 버퍼를 복사/인코딩 없이 PIL 이미지로 감싼다.
+    (이미지는 pix 의 버퍼를 참조하므로 pix 보다 오래 쓰지 않는다)
+    """
+
+    mode = "L" if pix.n == 1 else "RGB"
+    image = Image.frombuffer(
+        mode, (pix.width, pix.height), pix.samples_mv, "raw", mode, pix.stride, 1
+    )
+    # pytesseract 는 image.format 형식으로 임시 파일을 써서 tesseract 에 넘긴다.
+    # 무압축 PNM 으로 넘겨 PNG 압축/해제를 생략한다.
+    image.format = "PPM"
+    return image
+
+
+def _ocr_loaded_page(
+    page: fitz.Page
+) -> PageText:
+    """이미 열린 문서의 페이지를 OCR_DPI 로 렌더링해 OCR"""
+
+    start = time.perf_counter()
+    pix = page.get_pixmap(
+        dpi=OCR_DPI,
+        colorspace=fitz.csGRAY if OCR_GRAYSCALE else fitz.csRGB,
+        alpha=False,
+    )
+    image = pixmap_to_image(pix)
+
+    text = pytesseract.image_to_string(image, lang=OCR_LANG)
+
+    return PageText(
+        page=page.number + 1,
+        text=text,
+        elapsed_ms=(time.perf_counter() - start) * 1000,
+    )
+
+
+def ocr_page(
+    source: PDFSource, 
+    page_num: int = 0
+) -> PageText:
+    """OCR 프로세스 풀의 작업 단위 (워커에서 문서를 열어 한 페이지만 처리)"""
+
+    with open_pdf(source) as doc:
+        return _ocr_loaded_page(doc.load_page(page_num))
+
+
+def _ocr_pages_in_pool(
+    source: PDFSource,
+    page_numbers: List[int],
+    pool: BoundedProcessPool,
+    on_page: Optional[Callable[[PageText], None]] = None,
+) -> List[PageText]:
+    """
+    페이지를 워커 프로세스에 나눠 OCR 하고 page_numbers 순서대로 반환한다.
+    한 요청이 동시에 점유하는 작업 수는 pool.max_workers 로 제한한다.
+    on_page 는 페이지가 끝나는 순서대로 호출된다.
+    """
+
+    results: Dict[int, PageText] = {}
+    in_flight: Dict[Future, int] = {}
+    pending = list(reversed(page_numbers))
+
+    try:
+        while pending or in_flight:
+            while pending and len(in_flight) < pool.max_workers:
+                try:
+                    future = pool.submit(ocr_page, source, pending[-1])
+                except PoolSaturatedError:
+                    if not in_flight:
+                        raise
+                    break  # 진행 중인 페이지가 끝나면 다시 제출
+                in_flight[future] = pending.pop()
+
+            done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in done:
+                page_num = in_flight.pop(future)
+                results[page_num] = future.result()
+                if on_page is not None:
+                    on_page(results[page_num])
+    finally:
+        for future in in_flight:
+            future.cancel()
+
+    return [results[i] for i in page_numbers]
+
+
+def extract_pdf_pages(
+    source: PDFSource,
+    pool: Optional[BoundedProcessPool] = None,
+    progress: Optional[Callable[[int, int], None]] = None
+) -> List[PageText]:
+    """
+    문서를 한 번 열어 페이지마다 추출 경로를 정한다.
+    - 텍스트 레이어가 있는 페이지: 그대로 사용 (route="text")
+    - 없는 페이지(스캔본 등): OCR (route="ocr"), pool 이 있으면 병렬 처리
+    progress 가 주어지면 페이지가 끝날 때마다 (처리한 페이지 수, 전체 페이지 수) 로 호출한다.
+    """
+
+    pages: Dict[int, PageText] = {}
+    ocr_targets: List[int] = []
+
+    def _done(result: PageText) -> None:
+        pages[result.page - 1] = result
+        if progress is not None:
+            progress(len(pages), page_count)
+
+    with open_pdf(source) as doc:
+        page_count = len(doc)
+        for page in doc:
+            start = time.perf_counter()
+            text = page.get_text()
+            if text.strip():
+                _done(PageText(
+                    page=page.number + 1,
+                    text=text,
+                    elapsed_ms=(time.perf_counter() - start) * 1000,
+                    route="text",
+                ))
+            else:
+                ocr_targets.append(page.number)
+
+        if pool is None or len(ocr_targets) <= 1:
+            for page_num in ocr_targets:
+                _done(_ocr_loaded_page(doc.load_page(page_num)))
+            ocr_targets = []
+
+    if ocr_targets:
+        _ocr_pages_in_pool(source, ocr_targets, pool, on_page=_done)
+
+    return [pages[i] for i in sorted(pages)]
+
+
+def join_page_texts(
+    pages: List[PageText]
+) -> str:
+    # 텍스트 레이어는 기존 디지털 PDF 추출과, OCR 결과는 기존 이미지 PDF 추출과 같은 형식
+    return "".join(
+        p.text if p.route == "text" else p.text + "\n"
+        for p in pages
+    )
+
+
+# preprocess_text 에서 쓰는 줄 병합 조건
+# 조건1: 종결 부호로 끝나는 줄
+_SENTENCE_ENDINGS = (".", "?", "!", "…")
+# 조건2: 조사/동사/전치사/부사 등 문맥상 이어질 가능성이 높은 어미
+_CONTINUATION_ENDINGS = (
+    "은", "는", "이", "가", "을", "를", "고", "도", "지만", "하며", "하고", "되어",
+    "한다", "했다", "있다", "같은", "되며", "및", "하거나", "위한", "에서", "으로",
+    "으로서", "수", "때문",
+)
+# 조건3: 다음 줄이 자연스럽게 이어질 수 있는 시작어 (한글 자모 단독 시작은 제외)
+_CONTINUATION_START = re.compile(r"[a-zA-Z가-힣0-9]")
 
 
 def preprocess_text(
     text: str
-) -> List[str]:
+) -> str:
     """
     문장 병합 및 정제
     - 문장 중간에서 끊긴 줄은 이어 붙이고, 의미 있는 개행은 유지
     - 조사/종결어미/동사 등으로 끝나는 줄은 다음 줄과 이어 붙일 가능성 높음
     """
-    lines = text.splitlines()
-    processed_text = ""
-    i = 0
+    lines = [line.strip() for line in text.splitlines()]
+    parts: List[str] = []
+    last = len(lines) - 1
 
-    while i < len(lines):
-        line = lines[i].strip()
+    for i, line in enumerate(lines):
         if not line:
-            processed_text += "\n"
-            i += 1
+            parts.append("\n")
             continue
 
-        next_line = lines[i + 1].strip() if i + 1 < len(lines) else ""
-
-        # 조건1: 종결 부호로 끝나지 않음 (문장 중간)
-        cond1 = not re.search(r"[.?!…]$", line)
+        next_line = lines[i + 1] if i < last else ""
 
-        # 조건2: 조사/동사/전치사/부사 등 문맥상 이어질 가능성
-        cond2 = re.search(
-            r"(은|는|이|가|을|를|고|도|지만|하며|하고|되어|한다|했다|있다|같은|되며|및|하거나|위한|에서|으로|으로서|수|때문)$",
-            line,
-        )
-
-        # 조건3: 다음 줄이 자연스럽게 이어질 수 있는 시작어
-        cond3 = re.match(r"^[a-zA-Z가-힣0-9]", next_line) and not re.match(
-            r"^[ㄱ-ㅎㅏ-ㅣ]", next_line
-        )
-
-        if next_line and (cond1 or cond2 or cond3):
-            processed_text += line + " "
-            i += 1
+        if next_line and (
+            not line.endswith(_SENTENCE_ENDINGS)
+            or line.endswith(_CONTINUATION_ENDINGS)
+            or _CONTINUATION_START.match(next_line)
+        ):
+            parts.append(line)
+            parts.append(" ")
         else:
-            processed_text += line + "\n"
-            i += 1
-
-    preprocessed_text = "".join(processed_text)
+            parts.append(line)
+            parts.append("\n")
 
-    return preprocessed_text
+    return "".join(parts)
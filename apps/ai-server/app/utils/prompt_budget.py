@@ -0,0 +1,277 @@
+import math
+import os
+import re
+from dataclasses import dataclass, field
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+)
+
+if TYPE_CHECKING:
+    from langchain.prompts import PromptTemplate
+
+# 모델별 프롬프트 토큰 예산 (응답 max_tokens 제외)
+# 예: PROMPT_TOKEN_BUDGETS=llama-3.1-8b-instant=6000,llama-3.3-70b-versatile=8000
+PROMPT_TOKEN_BUDGET = int(os.getenv("PROMPT_TOKEN_BUDGET", "6000"))
+PROMPT_TOKEN_BUDGETS = os.getenv("PROMPT_TOKEN_BUDGETS", "")
+
+
+def _parse_budgets(value: str) -> Dict[str, int]:
+    budgets: Dict[str, int] = {}
+    for item in value.split(","):
+        model, sep, budget = item.strip().rpartition("=")
+        if sep and model:
+            budgets[model.strip()] = int(budget)
+    return budgets
+
+
+_model_budgets = _parse_budgets(PROMPT_TOKEN_BUDGETS)
+
+
+def token_budget(model: str) -> int:
+    """0이면 예산 제한 없음"""
+    return _model_budgets.get(model, PROMPT_TOKEN_BUDGET)
+
+
+_ASCII_WORD_RE = re.compile(r"[\x21-\x7e]+")
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    토크나이저 없이 쓰는 보수적 토큰 수 추정.
+    ASCII 는 4자당 1토큰 (단어 단위 올림), 한글 등 비 ASCII 문자는 1자당 1토큰.
+    """
+
+    if not text:
+        return 0
+    ascii_tokens = 0
+    for word in _ASCII_WORD_RE.findall(text):
+        ascii_tokens += math.ceil(len(word) / 4)
+    non_ascii = sum(1 for ch in text if ord(ch) > 0x7E)
+    return ascii_tokens + non_ascii
+
+
+# compaction
+# trim 단계에서 각 변수에 먼저 고르게 나눠 주는 예산 비율 (나머지는 크기에 비례)
+MIN_SHARE_RATIO = 0.5
+_INLINE_SPACE_RE = re.compile(r"[ \t 　]+")
+_SENTENCE_SPLIT_RE = re.compile(r"(?<=[.!?。])\s+")
+# 자기소개서 / 포트폴리오에서 자주 쓰는 단락 시작 표시 (e.g. "1. [지원 동기]", "프로젝트 2:")
+_SECTION_START_RE = re.compile(
+    r"\s+(?=\d+\.\s*\[|프로젝트\s*\d+\s*[:：]|Project\s*\d+\s*[:：])"
+    r"|(?<!\d\.)\s+(?=\[[^\]]{1,30}\])"
+)
+_METRIC_RE = re.compile(
+    r"\d+(?:[.,]\d+)?\s*(?:%|배|명|건|초|ms|s\b|점|원|개월|주)|→|->"
+)
+_QUERY_TERM_RE = re.compile(r"[0-9A-Za-z가-힣+#]{2,}")
+
+
+def _normalize(sentence: str) -> str:
+    return _INLINE_SPACE_RE.sub(" ", sentence).strip().lower()
+
+
+def collapse_whitespace(text: str) -> str:
+    """줄 안의 연속 공백을 하나로, 앞뒤 공백 제거, 연속 빈 줄은 하나로"""
+
+    lines = [_INLINE_SPACE_RE.sub(" ", line).strip() for line in text.splitlines()]
+    out: List[str] = []
+    for line in lines:
+        if not line and (not out or not out[-1]):
+            continue
+        out.append(line)
+    return "\n".join(out).strip()
+
+
+def dedupe_sentences(text: str) -> str:
+    """텍스트 안에서 이미 나온 문장(공백 / 대소문자 정규화 기준)을 제거한다"""
+
+    seen: Set[str] = set()
+    out_lines: List[str] = []
+    for line in text.splitlines():
+        kept = []
+        for sentence in _SENTENCE_SPLIT_RE.split(line):
+            key = _normalize(sentence)
+            if not key:
+                continue
+            if len(key) >= 8:  # 짧은 조각("성과:", "- ")은 중복이어도 유지
+                if key in seen:
+                    continue
+                seen.add(key)
+            kept.append(sentence)
+        if kept or not line.strip():
+            out_lines.append(" ".join(kept))
+    return collapse_whitespace("\n".join(out_lines))
+
+
+def split_sections(text: str) -> List[str]:
+    """빈 줄 / 단락 시작 표시 기준으로 단락 목록을 만든다"""
+
+    sections: List[str] = []
+    for block in re.split(r"\n\s*\n", text):
+        for part in _SECTION_START_RE.split(block):
+            part = part.strip()
+            if part:
+                sections.append(part)
+    return sections
+
+
+def _query_terms(query: Iterable[str]) -> Set[str]:
+    return {t.lower() for q in query if q for t in _QUERY_TERM_RE.findall(q)}
+
+
+def _section_score(section: str, index: int, terms: Set[str]) -> float:
+    lowered = section.lower()
+    relevance = sum(1 for t in terms if t in lowered)
+    metrics = min(5, len(_METRIC_RE.findall(section)))
+    # 관련 키워드 > 정량 성과 > 앞쪽 단락 순으로 가중
+    return 2.0 * relevance + 1.0 * metrics + 1.0 / (1 + index)
+
+
+def _truncate_to_tokens(text: str, max_tokens: int) -> str:
+    """문장 단위로 앞에서부터 max_tokens 까지 남긴다 (첫 문장이 넘으면 문자 단위로 자름)"""
+
+    out: List[str] = []
+    used = 0
+    for sentence in _SENTENCE_SPLIT_RE.split(text):
+        cost = estimate_tokens(sentence) + 1
+        if used + cost > max_tokens:
+            if not out:
+                chars = 0
+                for ch in sentence:
+                    used += 1 if ord(ch) > 0x7E else 0.25
+                    if used > max_tokens:
+                        break
+                    chars += 1
+                out.append(sentence[:chars].rstrip())
+            break
+        out.append(sentence)
+        used += cost
+    return " ".join(out)
+
+
+def trim_to_budget(text: str, max_tokens: int, query: Sequence[str] = ()) -> str:
+    """
+    단락을 query(희망 직무, 인재상 등)와의 관련도 / 정량 성과 / 위치로 점수화해
+    높은 순으로 max_tokens 까지 고른 뒤 원래 순서대로 이어 붙인다.
+    """
+
+    if estimate_tokens(text) <= max_tokens:
+        return text
+    if max_tokens <= 0:
+        return ""
+
+    sections = split_sections(text)
+    terms = _query_terms(query)
+    ranked = sorted(
+        range(len(sections)),
+        key=lambda i: _section_score(sections[i], i, terms),
+        reverse=True,
+    )
+
+    chosen: Dict[int, str] = {}
+    remaining = max_tokens
+    for i in ranked:
+        cost = estimate_tokens(sections[i]) + 1
+        if cost <= remaining:
+            chosen[i] = sections[i]
+            remaining -= cost
+        elif remaining >= 32 and not chosen:
+            # 가장 관련도 높은 단락도 통째로 들어가지 않으면 앞부분만
+            chosen[i] = _truncate_to_tokens(sections[i], remaining - 1)
+            remaining = 0
+        if remaining < 8:
+            break
+
+    return "\n".join(chosen[i] for i in sorted(chosen))
+
+
+def _split_budget(available: int, sizes: Dict[str, int]) -> Dict[str, int]:
+    """
+    available 토큰을 변수별로 나눈다. 각 변수는 먼저 (자기 크기 이내에서) 최소 몫을 받고,
+    남은 예산은 최소 몫을 넘는 크기에 비례해 나눈다. 작은 변수가 큰 변수에 밀려 사라지지 않는다.
+    """
+
+    if not sizes:
+        return {}
+    floor = int(available * MIN_SHARE_RATIO) // len(sizes)
+    shares = {name: min(size, floor) for name, size in sizes.items()}
+    rest = available - sum(shares.values())
+    excess = {name: size - shares[name] for name, size in sizes.items()}
+    total = sum(excess.values()) or 1
+    for name in sizes:
+        shares[name] += rest * excess[name] // total
+    return shares
+
+
+@dataclass
+class PromptBudgetReport:
+    model: str
+    budget: int
+    tokens_before: int
+    tokens_after: int
+    steps: List[str] = field(default_factory=list)
+    variables: Dict[str, Dict[str, int]] = field(default_factory=dict)
+
+
+def fit_prompt(
+    template: "PromptTemplate",
+    vars: Dict[str, Any],
+    compactable: Sequence[str],
+    model: str,
+    query: Sequence[str] = (),
+    budget: Optional[int] = None,
+) -> Tuple[str, PromptBudgetReport]:
+    """
+    template 을 vars 로 렌더링하되 예상 토큰 수가 모델 예산을 넘으면
+    compactable 변수(e.g. resume_text, portfolio_text)를 순서대로 줄인다.
+
+      1) 공백 정리 + 변수별 중복 문장 제거
+         (변수 간 중복은 제거하지 않는다: 포트폴리오가 자기소개서 문장을 인용해도 유지)
+      2) 그래도 넘으면 고정 부분을 뺀 남은 예산 중 MIN_SHARE_RATIO 만큼을 변수마다
+         고르게 최소 몫으로 주고, 나머지를 크기에 비례해 나눈 뒤
+         단락 순위(trim_to_budget)로 잘라낸다
+
+    (렌더링된 프롬프트, 전후 토큰 수 보고서) 를 반환한다.
+    """
+
+    budget = token_budget(model) if budget is None else budget
+    vars = dict(vars)
+    prompt = template.format(**vars)
+    report = PromptBudgetReport(
+        model=model,
+        budget=budget,
+        tokens_before=estimate_tokens(prompt),
+        tokens_after=0,
+    )
+    before = {name: estimate_tokens(str(vars[name])) for name in compactable}
+
+    if budget and report.tokens_before > budget:
+        for name in compactable:
+            vars[name] = dedupe_sentences(collapse_whitespace(str(vars[name])))
+        report.steps.append("dedupe")
+        prompt = template.format(**vars)
+
+        if estimate_tokens(prompt) > budget:
+            sizes = {name: estimate_tokens(vars[name]) for name in compactable}
+            fixed = estimate_tokens(prompt) - sum(sizes.values())
+            available = max(0, budget - fixed)
+            shares = _split_budget(available, sizes)
+            for name in compactable:
+                vars[name] = trim_to_budget(vars[name], shares[name], query)
+            report.steps.append("trim")
+            prompt = template.format(**vars)
+
+    report.tokens_after = estimate_tokens(prompt)
+    report.variables = {
+        name: {"before": before[name], "after": estimate_tokens(str(vars[name]))}
+        for name in compactable
+    }
+    return prompt, report
@@ -0,0 +1,116 @@
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Tuple, Union
+
+from langchain.prompts import PromptTemplate
+
+from app.utils.llm_utils import PROMPT_BASE_DIR, load_prompt_template
+
+# 프롬프트 파일 변경(mtime) 확인 간격. 0이면 매 요청마다 확인
+PROMPT_RELOAD_CHECK_SEC = float(os.getenv("PROMPT_RELOAD_CHECK_SEC", "1.0"))
+
+
+class _Entry:
+    def __init__(
+        self, template: PromptTemplate, signature: Tuple[int, int], checked_at: float
+    ):
+        self.template = template
+        self.signature = signature  # (mtime_ns, size)
+        self.checked_at = checked_at
+
+
+class PromptRegistry:
+    """
+    PROMPT_BASE_DIR 아래 프롬프트 템플릿을 한 번 읽어 PromptTemplate 으로 컴파일해 둔다.
+
+    - get / render 는 컴파일된 템플릿을 재사용하고, check_interval_sec 마다
+      파일 mtime / 크기를 확인해 바뀐 경우에만 다시 읽는다 (재시작 없이 프롬프트 수정 반영)
+    - reload() 는 캐시를 비우고 디렉터리의 모든 템플릿을 다시 컴파일한다
+    """
+
+    def __init__(
+        self,
+        base_dir: Path = PROMPT_BASE_DIR,
+        check_interval_sec: float = PROMPT_RELOAD_CHECK_SEC,
+        clock=time.monotonic,
+    ):
+        self.base_dir = Path(base_dir).resolve()
+        self.check_interval_sec = check_interval_sec
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries: Dict[Path, _Entry] = {}
+        self._stats = {"hits": 0, "compiles": 0, "reloads": 0}
+
+    def _resolve(self, name: Union[str, Path]) -> Path:
+        path = Path(name)
+        return path if path.is_absolute() else self.base_dir / path
+
+    @staticmethod
+    def _signature(path: Path) -> Tuple[int, int]:
+        st = os.stat(path)
+        return st.st_mtime_ns, st.st_size
+
+    def _compile(self, path: Path) -> _Entry:
+        signature = self._signature(path)
+        template = PromptTemplate.from_template(load_prompt_template(path))
+        return _Entry(template, signature, self._clock())
+
+    def get(self, name: Union[str, Path]) -> PromptTemplate:
+        """name: PROMPT_BASE_DIR 기준 상대 경로 또는 절대 경로"""
+
+        path = self._resolve(name)
+        now = self._clock()
+
+        with self._lock:
+            entry = self._entries.get(path)
+            if entry is not None and now - entry.checked_at < self.check_interval_sec:
+                self._stats["hits"] += 1
+                return entry.template
+
+        # 확인 주기가 지났거나 처음 요청된 템플릿
+        if entry is not None and self._signature(path) == entry.signature:
+            with self._lock:
+                entry.checked_at = now
+                self._stats["hits"] += 1
+            return entry.template
+
+        entry = self._compile(path)
+        with self._lock:
+            self._entries[path] = entry
+            self._stats["compiles"] += 1
+        return entry.template
+
+    def render(self, name: Union[str, Path], /, **vars: Any) -> str:
+        return self.get(name).format(**vars)
+
+    def reload(self) -> List[str]:
+        """모든 템플릿을 다시 컴파일하고 로드된 파일 이름 목록을 반환"""
+
+        entries = {
+            path: self._compile(path) for path in sorted(self.base_dir.glob("*.txt"))
+        }
+        with self._lock:
+            self._entries = entries
+            self._stats["reloads"] += 1
+        return [path.name for path in entries]
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            stats: Dict[str, Any] = dict(self._stats)
+            stats.update(
+                base_dir=str(self.base_dir),
+                check_interval_sec=self.check_interval_sec,
+                templates={
+                    path.name: {
+                        "input_variables": entry.template.input_variables,
+                        "size": entry.signature[1],
+                    }
+                    for path, entry in self._entries.items()
+                },
+            )
+        return stats
+
+
+prompt_registry = PromptRegistry()
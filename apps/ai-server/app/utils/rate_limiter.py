@@ -0,0 +1,304 @@
+import asyncio
+import heapq
+import itertools
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+# 우선순위 클래스 (값이 작을수록 먼저 처리)
+PRIORITY_INTERACTIVE = (
+    "interactive"  # 꼬리 질문, 답변 평가: 면접 진행 중 사용자가 기다리는 호출
+)
+PRIORITY_BATCH = "batch"  # 세션 종합 평가, 질문 사전 생성
+PRIORITY_LEVELS = {PRIORITY_INTERACTIVE: 0, PRIORITY_BATCH: 1}
+
+
+class RateLimitedError(RuntimeError):
+    """대기열이 가득 찼거나 최대 대기 시간 안에 호출 예산을 얻지 못했을 때 발생"""
+
+    def __init__(self, message: str, retry_after: float = 1.0):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+class TokenBucket:
+    """분당 rate_per_min 만큼 채워지는 토큰 버킷 (용량 = 1분치)"""
+
+    def __init__(self, rate_per_min: float, clock=time.monotonic):
+        self.capacity = float(rate_per_min)
+        self.rate = rate_per_min / 60.0
+        self.tokens = self.capacity
+        self._clock = clock
+        self._updated = clock()
+
+    def _refill(self) -> None:
+        now = self._clock()
+        self.tokens = min(
+            self.capacity, self.tokens + (now - self._updated) * self.rate
+        )
+        self._updated = now
+
+    def wait_time(self, amount: float) -> float:
+        """amount 를 꺼낼 수 있을 때까지 남은 시간 (용량보다 큰 요청은 가득 찰 때까지)"""
+
+        self._refill()
+        amount = min(amount, self.capacity)
+        if self.tokens >= amount:
+            return 0.0
+        return (amount - self.tokens) / self.rate
+
+    def take(self, amount: float) -> None:
+        self._refill()
+        self.tokens -= min(amount, self.capacity)
+
+    def give(self, amount: float) -> None:
+        self._refill()
+        self.tokens = min(self.capacity, self.tokens + amount)
+
+    def drain(self) -> None:
+        self._refill()
+        self.tokens = min(self.tokens, 0.0)
+
+
+class _Waiter:
+    def __init__(self, priority: int, tokens: int, loop=None):
+        self.priority = priority
+        self.tokens = tokens
+        self.loop = loop
+        self.event = asyncio.Event() if loop is not None else threading.Event()
+
+    def notify(self) -> None:
+        if self.loop is None:
+            self.event.set()
+        else:
+            self.loop.call_soon_threadsafe(self.event.set)
+
+
+class RateScheduler:
+    """
+    업스트림 LLM 호출 예산(분당 요청 수 / 분당 토큰 수)을 나눠주는 스케줄러.
+
+    - 요청마다 요청 버킷 1개 + 예상 토큰 수만큼 토큰 버킷을 소비
+    - 대기 중인 호출은 (우선순위, 도착 순) 으로 줄을 서고, 맨 앞 호출만 예산을 받는다
+      → 예산이 부족할 때 interactive 호출이 batch 호출보다 먼저 나간다
+    - 업스트림이 429 를 돌려주면 backoff() 로 retry-after 동안 전체 발급을 멈춘다
+    - 대기열이 max_queue 를 넘거나 max_wait_sec 안에 예산을 얻지 못하면 RateLimitedError
+
+    rpm / tpm 이 0 이면 해당 제한은 사용하지 않는다. 동기(스레드) / 비동기 호출 모두 지원.
+    """
+
+    def __init__(
+        self,
+        rpm: float = 0,
+        tpm: float = 0,
+        max_queue: int = 256,
+        max_wait_sec: float = 30.0,
+        clock=time.monotonic,
+    ):
+        self.requests = TokenBucket(rpm, clock) if rpm else None
+        self.tokens = TokenBucket(tpm, clock) if tpm else None
+        self.max_queue = max_queue
+        self.max_wait_sec = max_wait_sec
+        self._clock = clock
+
+        self._lock = threading.Lock()
+        self._queue: List[Tuple[int, int, _Waiter]] = []
+        self._seq = itertools.count()
+        self._blocked_until = 0.0
+        self._stats = {
+            "granted": 0,
+            "rejected_queue_full": 0,
+            "rejected_timeout": 0,
+            "upstream_429": 0,
+        }
+        self._waits: Dict[str, Dict[str, float]] = {
+            name: {"count": 0, "total_ms": 0.0, "max_ms": 0.0}
+            for name in PRIORITY_LEVELS
+        }
+
+    @property
+    def enabled(self) -> bool:
+        return self.requests is not None or self.tokens is not None
+
+    # queue
+    def _enqueue(self, priority: str, tokens: int, loop=None) -> _Waiter:
+        waiter = _Waiter(PRIORITY_LEVELS[priority], tokens, loop)
+        with self._lock:
+            if len(self._queue) >= self.max_queue:
+                self._stats["rejected_queue_full"] += 1
+                raise RateLimitedError(
+                    f"LLM request queue is full ({self.max_queue} waiting)",
+                    retry_after=self._retry_after_locked(),
+                )
+            heapq.heappush(self._queue, (waiter.priority, next(self._seq), waiter))
+        return waiter
+
+    def _leave(self, waiter: _Waiter) -> None:
+        with self._lock:
+            for i, (_, _, w) in enumerate(self._queue):
+                if w is waiter:
+                    self._queue.pop(i)
+                    heapq.heapify(self._queue)
+                    break
+            head = self._queue[0][2] if self._queue else None
+        if head is not None:
+            head.notify()
+
+    def _poll(self, waiter: _Waiter) -> Optional[float]:
+        """
+        waiter 가 맨 앞이고 예산이 있으면 소비 후 0, 예산을 기다려야 하면 남은 시간,
+        앞에 다른 호출이 있으면 None (앞 호출이 나가면 notify 로 깨운다)
+        """
+
+        with self._lock:
+            if self._queue[0][2] is not waiter:
+                return None
+
+            delay = max(0.0, self._blocked_until - self._clock())
+            if self.requests is not None:
+                delay = max(delay, self.requests.wait_time(1))
+            if self.tokens is not None:
+                delay = max(delay, self.tokens.wait_time(waiter.tokens))
+            if delay > 0:
+                return delay
+
+            if self.requests is not None:
+                self.requests.take(1)
+            if self.tokens is not None:
+                self.tokens.take(waiter.tokens)
+            heapq.heappop(self._queue)
+            self._stats["granted"] += 1
+            head = self._queue[0][2] if self._queue else None
+
+        if head is not None:
+            head.notify()
+        return 0.0
+
+    def _retry_after_locked(self) -> float:
+        delay = max(1.0, self._blocked_until - self._clock())
+        if self.requests is not None:
+            delay = max(delay, self.requests.wait_time(1))
+        return round(delay, 1)
+
+    def _record_wait(self, priority: str, started: float) -> float:
+        waited_ms = (self._clock() - started) * 1000
+        with self._lock:
+            w = self._waits[priority]
+            w["count"] += 1
+            w["total_ms"] += waited_ms
+            w["max_ms"] = max(w["max_ms"], waited_ms)
+        return waited_ms
+
+    def _timeout(self) -> RateLimitedError:
+        with self._lock:
+            self._stats["rejected_timeout"] += 1
+            retry_after = self._retry_after_locked()
+        return RateLimitedError(
+            f"LLM rate limit budget not available within {self.max_wait_sec}s",
+            retry_after=retry_after,
+        )
+
+    # public API
+    def acquire(self, priority: str = PRIORITY_INTERACTIVE, tokens: int = 0) -> float:
+        """예산을 얻을 때까지 현재 스레드를 대기시킨다. 대기 시간(ms)을 반환."""
+
+        if not self.enabled:
+            return 0.0
+
+        started = self._clock()
+        deadline = started + self.max_wait_sec
+        waiter = self._enqueue(priority, tokens)
+        try:
+            while True:
+                delay = self._poll(waiter)
+                if delay == 0:
+                    return self._record_wait(priority, started)
+
+                remaining = deadline - self._clock()
+                if remaining <= 0:
+                    raise self._timeout()
+                waiter.event.wait(remaining if delay is None else min(delay, remaining))
+                waiter.event.clear()
+        finally:
+            self._leave(waiter)
+
+    async def aacquire(
+        self, priority: str = PRIORITY_INTERACTIVE, tokens: int = 0
+    ) -> float:
+        if not self.enabled:
+            return 0.0
+
+        started = self._clock()
+        deadline = started + self.max_wait_sec
+        waiter = self._enqueue(priority, tokens, asyncio.get_running_loop())
+        try:
+            while True:
+                delay = self._poll(waiter)
+                if delay == 0:
+                    return self._record_wait(priority, started)
+
+                remaining = deadline - self._clock()
+                if remaining <= 0:
+                    raise self._timeout()
+                try:
+                    await asyncio.wait_for(
+                        waiter.event.wait(),
+                        remaining if delay is None else min(delay, remaining),
+                    )
+                except asyncio.TimeoutError:
+                    pass
+                waiter.event.clear()
+        finally:
+            self._leave(waiter)
+
+    def settle(self, estimated_tokens: int, used_tokens: Optional[int]) -> None:
+        """응답의 실제 사용 토큰 수로 예상치와의 차이를 돌려받거나 더 소비한다"""
+
+        if self.tokens is None or used_tokens is None:
+            return
+        with self._lock:
+            if used_tokens < estimated_tokens:
+                self.tokens.give(estimated_tokens - used_tokens)
+            else:
+                self.tokens.take(used_tokens - estimated_tokens)
+
+    def backoff(self, retry_after: float) -> None:
+        """업스트림 429: retry_after 동안 발급을 멈추고 버킷을 비운다"""
+
+        with self._lock:
+            self._stats["upstream_429"] += 1
+            self._blocked_until = max(self._blocked_until, self._clock() + retry_after)
+            if self.requests is not None:
+                self.requests.drain()
+            head = self._queue[0][2] if self._queue else None
+        if head is not None:
+            head.notify()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            stats: Dict[str, Any] = dict(self._stats)
+            queued: Dict[str, int] = {name: 0 for name in PRIORITY_LEVELS}
+            names = {level: name for name, level in PRIORITY_LEVELS.items()}
+            for level, _, _ in self._queue:
+                queued[names[level]] += 1
+
+            stats.update(
+                enabled=self.enabled,
+                rpm=self.requests.capacity if self.requests is not None else 0,
+                tpm=self.tokens.capacity if self.tokens is not None else 0,
+                max_queue=self.max_queue,
+                max_wait_sec=self.max_wait_sec,
+                queued=queued,
+                blocked_for_sec=round(max(0.0, self._blocked_until - self._clock()), 2),
+                wait_ms={
+                    name: {
+                        "count": int(w["count"]),
+                        "avg": round(w["total_ms"] / w["count"], 1)
+                        if w["count"]
+                        else 0.0,
+                        "max": round(w["max_ms"], 1),
+                    }
+                    for name, w in self._waits.items()
+                },
+            )
+        return stats
@@ -0,0 +1,85 @@
+import asyncio
+import threading
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+
+class _Flight:
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """
+    같은 키로 동시에 들어온 호출을 하나로 합친다 (스레드용).
+    먼저 들어온 호출(leader)만 fn 을 실행하고, 실행 중에 들어온 호출은
+    그 결과(또는 예외)를 함께 받는다. 끝난 키는 바로 지워지므로 결과를 캐시하지 않는다.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._flights: Dict[str, _Flight] = {}
+        self.calls = 0
+        self.coalesced = 0
+
+    def run(self, key: str, fn: Callable[[], Any]) -> Any:
+        with self._lock:
+            self.calls += 1
+            flight = self._flights.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._flights[key] = _Flight()
+            else:
+                self.coalesced += 1
+
+        if not leader:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.result
+
+        try:
+            flight.result = fn()
+            return flight.result
+        except BaseException as e:
+            flight.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._flights[key]
+            flight.done.set()
+
+    def in_flight(self) -> int:
+        with self._lock:
+            return len(self._flights)
+
+
+class AsyncSingleFlight:
+    """
+    SingleFlight 의 asyncio 버전. 실행은 별도 태스크로 하므로 기다리던 호출 하나가
+    취소되어도 다른 호출자가 받을 결과에는 영향이 없다.
+    """
+
+    def __init__(self):
+        self._flights: Dict[Tuple[int, str], asyncio.Task] = {}
+        self.calls = 0
+        self.coalesced = 0
+
+    async def run(self, key: str, fn: Callable[[], Awaitable[Any]]) -> Any:
+        loop = asyncio.get_running_loop()
+        flight_key = (id(loop), key)
+        self.calls += 1
+
+        task = self._flights.get(flight_key)
+        if task is None:
+            task = loop.create_task(fn())
+            self._flights[flight_key] = task
+            task.add_done_callback(lambda _: self._flights.pop(flight_key, None))
+        else:
+            self.coalesced += 1
+
+        return await asyncio.shield(task)
+
+    def in_flight(self) -> int:
+        return len(self._flights)
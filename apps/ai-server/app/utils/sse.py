@@ -0,0 +1,59 @@
+import asyncio
+import json
+from typing import Any, AsyncIterator, Callable, Optional, Set
+
+from pydantic import BaseModel
+
+# 클라이언트 연결이 끊겨도 끝까지 실행되는 생성 태스크 (GC 방지용 참조)
+_background_tasks: Set[asyncio.Task] = set()
+
+SSE_HEADERS = {
+    "Cache-Control": "no-cache",
+    "X-Accel-Buffering": "no",  # nginx 프록시 버퍼링 해제
+}
+
+
+def sse_event(event: str, data: Any) -> str:
+    payload = json.dumps(data, ensure_ascii=False, separators=(",", ":"))
+    return f"event: {event}\ndata: {payload}\n\n"
+
+
+async def stream_completion_events(
+    deltas: AsyncIterator[str],
+    finalize: Callable[[str], BaseModel],
+) -> AsyncIterator[str]:
+    """
+    LLM 스트림을 SSE 이벤트로 중계한다.
+
+    - token:  {"delta": "..."}  생성된 텍스트 조각
+    - result: finalize(전체 응답) 의 결과 (검증된 응답 모델)
+    - error:  {"detail": "..."} 생성 / 검증 실패
+
+    생성과 finalize 는 별도 태스크에서 실행되므로 클라이언트가 중간에 연결을 끊어도
+    응답을 끝까지 받아 finalize (MemoryLogger 기록) 가 정확히 한 번 실행된다.
+    """
+
+    queue: "asyncio.Queue[Optional[str]]" = asyncio.Queue()
+
+    async def produce() -> None:
+        parts = []
+        try:
+            async for delta in deltas:
+                parts.append(delta)
+                queue.put_nowait(sse_event("token", {"delta": delta}))
+            result = finalize("".join(parts))
+            queue.put_nowait(sse_event("result", result.model_dump(mode="json")))
+        except Exception as e:
+            queue.put_nowait(sse_event("error", {"detail": str(e)}))
+        finally:
+            queue.put_nowait(None)
+
+    task = asyncio.get_running_loop().create_task(produce())
+    _background_tasks.add(task)
+    task.add_done_callback(_background_tasks.discard)
+
+    while True:
+        event = await queue.get()
+        if event is None:
+            return
+        yield event
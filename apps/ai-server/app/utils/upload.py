@@ -0,0 +1,309 @@
+import hashlib
+import json
+import os
+import tempfile
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, BinaryIO, Dict, List, Optional
+
+from fastapi import HTTPException, Request
+from fastapi.concurrency import run_in_threadpool
+from fastapi.exceptions import RequestValidationError
+from python_multipart.multipart import (
+    MultipartParseError,
+    MultipartParser,
+    parse_options_header,
+)
+
+UPLOAD_CHUNK_SIZE = int(os.getenv("UPLOAD_CHUNK_SIZE", str(1024 * 1024)))
+MAX_PDF_UPLOAD_BYTES = int(os.getenv("MAX_PDF_UPLOAD_BYTES", str(50 * 1024 * 1024)))
+MAX_VIDEO_UPLOAD_BYTES = int(
+    os.getenv("MAX_VIDEO_UPLOAD_BYTES", str(1024 * 1024 * 1024))
+)
+
+# multipart 본문에서 파일 외 부분(boundary, 파트 헤더 등)에 허용하는 여유분
+MULTIPART_OVERHEAD_BYTES = 64 * 1024
+
+
+class UploadTooLargeError(ValueError):
+    """업로드 파일이 허용 크기를 넘었을 때 발생"""
+
+    def __init__(self, limit: int):
+        super().__init__(f"upload exceeds {limit} bytes")
+        self.limit = limit
+
+
+@dataclass
+class SpooledUpload:
+    path: str
+    size: int
+    sha256: str
+    filename: str = ""
+
+
+class _FilePartWriter:
+    """
+    python-multipart 콜백: field 이름의 파일 파트만 임시 파일에 기록한다.
+    파싱은 이벤트 루프에서, 해시 계산 + 디스크 쓰기는 flush() 로 모아서 스레드에서 한다.
+    """
+
+    def __init__(self, field: str, suffix: str, keep_extension: bool):
+        self.field = field.encode("utf-8")
+        self.suffix = suffix
+        self.keep_extension = keep_extension
+
+        self.path = ""
+        self.filename = ""
+        self.size = 0
+        self.pending: List[bytes] = []
+        self.pending_bytes = 0
+        self._dst: Optional[BinaryIO] = None
+        self._hash = hashlib.sha256()
+        self._header_field = b""
+        self._header_value = b""
+        self._disposition = b""
+        self._writing = False
+        self._done = False
+
+    @property
+    def callbacks(self) -> Dict[str, Any]:
+        return {
+            "on_part_begin": self._on_part_begin,
+            "on_header_field": self._on_header_field,
+            "on_header_value": self._on_header_value,
+            "on_header_end": self._on_header_end,
+            "on_headers_finished": self._on_headers_finished,
+            "on_part_data": self._on_part_data,
+            "on_part_end": self._on_part_end,
+        }
+
+    def _on_part_begin(self) -> None:
+        self._disposition = b""
+
+    def _on_header_field(self, data: bytes, start: int, end: int) -> None:
+        self._header_field += data[start:end]
+
+    def _on_header_value(self, data: bytes, start: int, end: int) -> None:
+        self._header_value += data[start:end]
+
+    def _on_header_end(self) -> None:
+        if self._header_field.lower() == b"content-disposition":
+            self._disposition = self._header_value
+        self._header_field = b""
+        self._header_value = b""
+
+    def _on_headers_finished(self) -> None:
+        _, options = parse_options_header(self._disposition)
+        if self._done or options.get(b"name") != self.field:
+            return
+        if b"filename" not in options:
+            return
+
+        # 같은 이름의 파일 파트가 여러 개면 첫 번째만 사용
+        self.filename = options[b"filename"].decode("utf-8", "replace")
+        suffix = self.suffix
+        if self.keep_extension:
+            suffix = os.path.splitext(self.filename)[-1] or suffix
+        fd, self.path = tempfile.mkstemp(suffix=suffix)
+        self._dst = os.fdopen(fd, "wb")
+        self._writing = True
+
+    def _on_part_data(self, data: bytes, start: int, end: int) -> None:
+        if self._writing:
+            chunk = data[start:end]
+            self.size += len(chunk)
+            self.pending.append(chunk)
+            self.pending_bytes += len(chunk)
+
+    def _on_part_end(self) -> None:
+        if self._writing:
+            self._writing = False
+            self._done = True
+
+    def flush(self) -> None:
+        pending, self.pending, self.pending_bytes = self.pending, [], 0
+        for chunk in pending:
+            self._hash.update(chunk)
+            self._dst.write(chunk)
+
+    def close(self) -> None:
+        if self._dst is not None:
+            self._dst.close()
+
+    def result(self) -> SpooledUpload:
+        return SpooledUpload(
+            path=self.path,
+            size=self.size,
+            sha256=self._hash.hexdigest(),
+            filename=self.filename,
+        )
+
+
+async def spool_upload(
+    request: Request,
+    max_bytes: int = 0,
+    suffix: str = "",
+    field: str = "file",
+    keep_extension: bool = False,
+) -> SpooledUpload:
+    """
+    multipart 요청 본문(request.stream())을 받는 대로 파싱해 field 파일 파트를
+    임시 파일에 바로 기록한다 (sha256 도 함께 계산). Starlette 의 UploadFile 스풀링을
+    거치지 않으므로 디스크에는 한 번만 쓰고, 요청당 메모리 사용량은 UPLOAD_CHUNK_SIZE 수준이다.
+
+    파일이 max_bytes 를 넘으면 (Content-Length 가 없는 chunked 요청 포함) 나머지 본문을
+    읽지 않고 UploadTooLargeError 를 발생시킨다.
+    keep_extension 이면 업로드 파일 이름의 확장자를, 없으면 suffix 를 임시 파일에 붙인다.
+    반환된 임시 파일은 호출한 쪽에서 삭제한다.
+    """
+
+    _, params = parse_options_header(request.headers.get("content-type"))
+    boundary = params.get(b"boundary")
+    if not boundary:
+        raise HTTPException(
+            status_code=400, detail="Expected a multipart/form-data body"
+        )
+
+    writer = _FilePartWriter(field, suffix, keep_extension)
+    parser = MultipartParser(boundary, writer.callbacks)
+    body_limit = max_bytes + MULTIPART_OVERHEAD_BYTES if max_bytes else 0
+    received = 0
+    try:
+        try:
+            async for chunk in request.stream():
+                received += len(chunk)
+                parser.write(chunk)
+                if max_bytes and (writer.size > max_bytes or received > body_limit):
+                    raise UploadTooLargeError(max_bytes)
+                if writer.pending_bytes >= UPLOAD_CHUNK_SIZE:
+                    await run_in_threadpool(writer.flush)
+            parser.finalize()
+        except MultipartParseError as e:
+            raise HTTPException(
+                status_code=400, detail="There was an error parsing the body"
+            ) from e
+
+        if not writer.path:
+            raise RequestValidationError(
+                [
+                    {
+                        "type": "missing",
+                        "loc": ("body", field),
+                        "msg": "Field required",
+                        "input": None,
+                    }
+                ]
+            )
+        await run_in_threadpool(writer.flush)
+    except BaseException:
+        writer.close()
+        if writer.path:
+            remove_quietly(writer.path)
+        raise
+
+    writer.close()
+    return writer.result()
+
+
+def remove_quietly(path: str) -> None:
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+
+@asynccontextmanager
+async def spooled_upload(
+    request: Request,
+    max_bytes: int = 0,
+    suffix: str = "",
+    field: str = "file",
+    keep_extension: bool = False,
+) -> AsyncIterator[SpooledUpload]:
+    """spool_upload 후 블록이 끝나면 임시 파일을 삭제한다"""
+
+    upload = await spool_upload(request, max_bytes, suffix, field, keep_extension)
+    try:
+        yield upload
+    finally:
+        remove_quietly(upload.path)
+
+
+def upload_openapi(
+    description: str = "",
+    field: str = "file",
+) -> Dict[str, Any]:
+    """
+    spool_upload 로 본문을 직접 읽는 엔드포인트의 OpenAPI requestBody
+    (File() 파라미터 없이도 Swagger UI 에 업로드 폼이 나오도록)
+    """
+
+    return {
+        "requestBody": {
+            "required": True,
+            "content": {
+                "multipart/form-data": {
+                    "schema": {
+                        "type": "object",
+                        "required": [field],
+                        "properties": {
+                            field: {
+                                "type": "string",
+                                "format": "binary",
+                                "description": description,
+                            }
+                        },
+                    }
+                }
+            },
+        }
+    }
+
+
+class UploadSizeLimitMiddleware:
+    """
+    Content-Length 가 경로별 상한을 넘는 업로드를 본문을 읽기 전에 413 으로 거절한다.
+    (Content-Length 가 없는 chunked 요청은 spool_upload 가 본문을 받는 도중에 거절)
+    """
+
+    def __init__(self, app, limits: Dict[str, int]):
+        self.app = app
+        self.limits = limits
+
+    def _limit_for(self, path: str) -> int:
+        for prefix, limit in self.limits.items():
+            if path.startswith(prefix):
+                return limit
+        return 0
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope.get("method") != "POST":
+            return await self.app(scope, receive, send)
+
+        limit = self._limit_for(scope.get("path", ""))
+        if limit:
+            headers = dict(scope.get("headers") or [])
+            try:
+                length = int(headers.get(b"content-length", b"0"))
+            except ValueError:
+                length = 0
+
+            if length > limit + MULTIPART_OVERHEAD_BYTES:
+                body = json.dumps(
+                    {"detail": f"Upload too large (limit {limit} bytes)"}
+                ).encode("utf-8")
+                await send(
+                    {
+                        "type": "http.response.start",
+                        "status": 413,
+                        "headers": [
+                            (b"content-type", b"application/json"),
+                            (b"content-length", str(len(body)).encode("ascii")),
+                            (b"connection", b"close"),
+                        ],
+                    }
+                )
+                await send({"type": "http.response.body", "body": body})
+                return
+
+        return await self.app(scope, receive, send)
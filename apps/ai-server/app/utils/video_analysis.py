@@ -1,47 +1,145 @@
+import os
+import threading
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional
+
 import cv2
-from fer import FER
+import numpy as np
+
+from app.utils.frame_sampling import TARGET_SAMPLES, sample_frames
+
+if TYPE_CHECKING:
+    from fer import FER
+
+# FER(TensorFlow/MTCNN) 모델은 첫 사용 시점 또는 warmup 호출 시 한 번만 로드
+_emotion_detector: Optional["FER"] = None
+_emotion_detector_lock = threading.Lock()
+
+# 감정 분류 CNN 에 한 번에 넣을 얼굴 crop 수 (메모리 ↔ 처리량)
+FER_BATCH_SIZE = int(os.getenv("FER_BATCH_SIZE", "32"))
+
+FER_LABELS = ["happy", "sad", "neutral", "angry", "fear", "surprise"]
+
+# FER.detect_emotions 와 동일한 얼굴 crop 전처리 값
+_FER_PADDING = 40
+_FER_OFFSETS = (10, 10)
+_FER_DEFAULT_TARGET_SIZE = (64, 64)
+
+
+def get_emotion_detector() -> "FER":
+    global _emotion_detector
+
+    if _emotion_detector is not None:
+        return _emotion_detector
+
+    with _emotion_detector_lock:
+        if _emotion_detector is None:
+            from fer import FER
+
+            _emotion_detector = FER(mtcnn=True)
+    return _emotion_detector
+
+
+def warmup_emotion_detector() -> None:
+    get_emotion_detector()
+
 
-# 모델 초기화 (모듈 import 시 한 번만)
-emotion_detector = FER(mtcnn=True)
+def _prepare_face(detector: "FER", img: np.ndarray) -> Optional[np.ndarray]:
+    """
+    FER.detect_emotions 의 얼굴 검출 + crop 전처리 부분만 수행한다.
+    첫 번째로 유효한 얼굴의 분류기 입력(전처리된 gray crop)을 반환한다.
+    """
+    face_rectangles = detector.find_faces(img, bgr=True)
+    if not face_rectangles:
+        return None
+
+    gray_img = detector.pad(cv2.cvtColor(img, cv2.COLOR_BGR2GRAY))
+    target_size = getattr(
+        detector, "_FER__emotion_target_size", _FER_DEFAULT_TARGET_SIZE
+    )
+    x_off, y_off = _FER_OFFSETS
+
+    for face_coordinates in face_rectangles:
+        x, y, w, h = detector.tosquare(face_coordinates)
+        x1 = max(0, x - x_off + _FER_PADDING)
+        y1 = max(0, y - y_off + _FER_PADDING)
+        x2 = x + w + x_off + _FER_PADDING
+        y2 = y + h + y_off + _FER_PADDING
+
+        try:
+            gray_face = cv2.resize(gray_img[y1:y2, x1:x2], tuple(target_size))
+        except Exception:
+            continue
+
+        gray_face = gray_face.astype("float32") / 255.0
+        return (gray_face - 0.5) * 2.0
+
+    return None
+
+
+def _classify_batch(
+    detector: "FER",
+    frames: List[Dict[str, Any]],
+    faces: List[np.ndarray],
+) -> List[Dict[str, Any]]:
+    emotion_labels = detector._get_labels()
+    predictions = np.asarray(detector._classify_emotions(np.array(faces)))
+
+    results = []
+    for meta, scores in zip(frames, predictions):
+        # detect_emotions 와 같은 반올림(소수 2자리)을 거친 뒤 기존 포맷으로 변환
+        emotions = {
+            emotion_labels[idx]: round(float(score), 2)
+            for idx, score in enumerate(scores)
+        }
+        result = dict(meta)
+        for label in FER_LABELS:
+            result[label] = round(float(emotions.get(label, 0.0)), 3)
+        results.append(result)
+    return results
 
-TARGET_SAMPLES = 100
 
 def video_analysis(
     path: str = "", 
-    target_samples: int = TARGET_SAMPLES
+    target_samples: int = TARGET_SAMPLES,
+    batch_size: int = FER_BATCH_SIZE,
+    progress: Optional[Callable[[int, int], None]] = None,
 ):
-    
-    cap = cv2.VideoCapture(path)
-    if not cap.isOpened():
-        raise ValueError(f"Cannot open video file: {path}")
-
-    total_frames = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
-    fps = cap.get(cv2.CAP_PROP_FPS) or 30  # 기본값 30
-    sample_rate = max(1, total_frames // target_samples)  # 최소 1로 보장
-
+    """
+    샘플 프레임마다 얼굴을 검출해 crop 을 모은 뒤,
+    감정 분류는 batch_size 단위로 묶어서 한 번에 수행한다.
+    progress 가 주어지면 샘플 프레임마다 (처리한 프레임 수, 목표 샘플 수) 로 호출한다.
+    """
+    batch_size = max(1, batch_size)
+    emotion_detector = get_emotion_detector()
     results = []
-    frame_idx = 0
 
-    fer_labels = ["happy", "sad", "neutral", "angry", "fear", "surprise"]
+    pending_frames: List[Dict[str, Any]] = []
+    pending_faces: List[np.ndarray] = []
+    analyzed = 0
+
+    for frame_idx, time_sec, rgb in sample_frames(path, target_samples):
+        analyzed += 1
+        if progress is not None:
+            progress(analyzed, max(analyzed, target_samples))
 
-    while cap.isOpened():
-        ret, frame = cap.read()
-        if not ret:
-            break
-        frame_idx += 1
-        if frame_idx % sample_rate != 0:
+        face = _prepare_face(emotion_detector, rgb)
+        if face is None:
             continue
 
-        rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-        time_sec = frame_idx / fps
+        pending_frames.append({"frame": frame_idx, "time": round(time_sec, 2)})
+        pending_faces.append(face)
+
+        if len(pending_faces) >= batch_size:
+            results.extend(
+                _classify_batch(emotion_detector, pending_frames, pending_faces)
+            )
+            pending_frames, pending_faces = [], []
 
-        fer_result = emotion_detector.detect_emotions(rgb)
-        if fer_result:
-            emotions = fer_result[0]["emotions"]
-            result = {"frame": frame_idx, "time": round(time_sec, 2)}
-            for label in fer_labels:
-                result[label] = round(float(emotions.get(label, 0.0)), 3)
-            results.append(result)
+    if pending_faces:
+        results.extend(
+            _classify_batch(emotion_detector, pending_frames, pending_faces)
+        )
+    if progress is not None:
+        progress(analyzed, analyzed)
 
-    cap.release()
     return results
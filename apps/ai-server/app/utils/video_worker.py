@@ -0,0 +1,35 @@
+"""
+감정 분석 프로세스 풀의 워커 진입점.
+
+메인(API) 프로세스에서는 이 모듈만 import 하고, OpenCV / FER / TensorFlow 는
+워커 프로세스 안에서만 로드된다.
+"""
+
+from typing import Dict, List, Optional
+
+
+def init_worker() -> None:
+    # FER 모델은 워커 프로세스당 한 번만 로드
+    from app.utils.video_analysis import warmup_emotion_detector
+
+    warmup_emotion_detector()
+
+
+def ping() -> bool:
+    return True
+
+
+def analyze(path: str = "", progress_name: Optional[str] = None) -> List[Dict]:
+    from app.utils.video_analysis import video_analysis
+
+    if progress_name is None:
+        return video_analysis(path)
+
+    # 메인 프로세스가 만든 공유 메모리에 진행률(분석한 프레임 수)을 기록
+    from app.utils.worker_pool import SharedProgress
+
+    progress = SharedProgress(progress_name)
+    try:
+        return video_analysis(path, progress=progress.set)
+    finally:
+        progress.close()
@@ -0,0 +1,140 @@
+import asyncio
+import multiprocessing
+import struct
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from multiprocessing import shared_memory
+from typing import Any, Callable, List, Optional, Tuple
+
+_pools: List["BoundedProcessPool"] = []
+
+
+class PoolSaturatedError(RuntimeError):
+    """실행 중 + 대기 중인 작업 수가 풀의 허용치를 넘었을 때 발생"""
+
+
+class BoundedProcessPool:
+    """
+    작업 수에 상한이 있는 ProcessPoolExecutor 래퍼.
+
+    - 프로세스는 첫 작업 제출 시점에 생성 (spawn)
+    - max_workers + queue_depth 를 넘는 제출은 즉시 PoolSaturatedError
+    - 워커 프로세스가 죽어 풀이 깨지면 다음 제출 때 새로 생성
+    """
+
+    def __init__(
+        self,
+        name: str = "",
+        max_workers: int = 1,
+        queue_depth: int = 0,
+        initializer: Optional[Callable[[], None]] = None,
+    ):
+        self.name = name
+        self.max_workers = max(1, max_workers)
+        self.queue_depth = max(0, queue_depth)
+        self.initializer = initializer
+
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+        self._slots = threading.BoundedSemaphore(self.max_workers + self.queue_depth)
+        _pools.append(self)
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                    initializer=self.initializer,
+                )
+            return self._executor
+
+    def _discard_broken(self, executor: ProcessPoolExecutor) -> None:
+        with self._lock:
+            if self._executor is executor:
+                self._executor = None
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    def submit(self, fn: Callable[..., Any], *args: Any) -> Future:
+        if not self._slots.acquire(blocking=False):
+            raise PoolSaturatedError(
+                f"'{self.name}' pool is saturated "
+                f"({self.max_workers} workers, queue depth {self.queue_depth})"
+            )
+
+        executor = self._get_executor()
+        try:
+            future = executor.submit(fn, *args)
+        except BrokenProcessPool:
+            self._slots.release()
+            self._discard_broken(executor)
+            raise
+
+        def _on_done(f: Future) -> None:
+            self._slots.release()
+            if not f.cancelled() and isinstance(f.exception(), BrokenProcessPool):
+                self._discard_broken(executor)
+
+        future.add_done_callback(_on_done)
+        return future
+
+    async def run(self, fn: Callable[..., Any], *args: Any) -> Any:
+        future = self.submit(fn, *args)
+        return await asyncio.wrap_future(future)
+
+    def warmup(self, fn: Callable[[], Any]) -> None:
+        """워커 프로세스를 미리 띄워 initializer(모델 로드 등)를 실행해 둔다"""
+        executor = self._get_executor()
+        for _ in range(self.max_workers):
+            executor.submit(fn)
+
+    def shutdown(self, wait: bool = True) -> None:
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait, cancel_futures=True)
+
+
+class SharedProgress:
+    """
+    워커 프로세스가 갱신하고 메인 프로세스가 읽는 (done, total) 진행률.
+    메인 프로세스에서 생성한 뒤 name 만 작업 인자로 넘기면 워커에서 attach 한다.
+    """
+
+    _FORMAT = "qq"
+
+    def __init__(self, name: Optional[str] = None):
+        self._owner = name is None
+        if self._owner:
+            self._shm = shared_memory.SharedMemory(
+                create=True, size=struct.calcsize(self._FORMAT)
+            )
+            self.set(0, 0)
+        else:
+            # spawn 워커는 메인 프로세스의 resource tracker 를 공유하므로
+            # 세그먼트 정리(unlink)는 생성한 메인 프로세스의 close 에서 한 번만 일어난다
+            self._shm = shared_memory.SharedMemory(name=name)
+
+    @property
+    def name(self) -> str:
+        return self._shm.name
+
+    def set(self, done: int, total: int) -> None:
+        struct.pack_into(self._FORMAT, self._shm.buf, 0, done, total)
+
+    def read(self) -> Tuple[int, int]:
+        return struct.unpack_from(self._FORMAT, self._shm.buf, 0)
+
+    def close(self) -> None:
+        self._shm.close()
+        if self._owner:
+            try:
+                self._shm.unlink()
+            except FileNotFoundError:
+                pass
+
+
+def shutdown_pools(wait: bool = True) -> None:
+    for pool in _pools:
+        pool.shutdown(wait=wait)
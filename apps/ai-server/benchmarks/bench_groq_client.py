@@ -0,0 +1,88 @@
+"""
+Groq 클라이언트 재사용 여부에 따른 groq_chat 지연 시간(p50/p99) 비교.
+
+    python -m benchmarks.bench_groq_client --requests 500 --concurrency 8
+
+- before: 호출마다 Groq 클라이언트(및 커넥션 풀)를 새로 생성
+- after: app.utils.llm_utils 의 프로세스 전역 클라이언트 재사용
+"""
+
+import argparse
+import os
+import statistics
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, List
+
+from benchmarks.stub_groq_server import start_stub_server
+
+
+def _percentile(samples: List[float], pct: float) -> float:
+    ordered = sorted(samples)
+    idx = min(len(ordered) - 1, max(0, round(pct / 100 * len(ordered)) - 1))
+    return ordered[idx]
+
+
+def _run(call: Callable[[], None], requests: int, concurrency: int) -> List[float]:
+    def timed(_):
+        start = time.perf_counter()
+        call()
+        return (time.perf_counter() - start) * 1000
+
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        return list(pool.map(timed, range(requests)))
+
+
+def _report(name: str, samples: List[float]) -> None:
+    print(
+        f"{name:<8} n={len(samples):<5} "
+        f"p50={statistics.median(samples):7.2f}ms "
+        f"p99={_percentile(samples, 99):7.2f}ms "
+        f"mean={statistics.fmean(samples):7.2f}ms"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=300)
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--latency-ms", type=float, default=5.0)
+    args = parser.parse_args()
+
+    server = start_stub_server(latency_ms=args.latency_ms)
+    os.environ["GROQ_BASE_URL"] = f"http://127.0.0.1:{server.server_port}"
+    os.environ.setdefault("GROQ_API_KEY", "stub-key")
+
+    from groq import Groq
+
+    from app.utils import llm_utils
+
+    prompt = "벤치마크 프롬프트"
+
+    def per_call_client() -> None:
+        client = Groq(api_key=os.environ["GROQ_API_KEY"])
+        try:
+            client.chat.completions.create(
+                messages=[{"role": "user", "content": prompt}],
+                model="llama-3.1-8b-instant",
+                response_format={"type": "json_object"},
+            )
+        finally:
+            client.close()
+
+    def shared_client() -> None:
+        llm_utils.groq_chat(prompt)
+
+    # 워밍업 (import 및 최초 연결 비용 제외)
+    per_call_client()
+    shared_client()
+
+    _report("before", _run(per_call_client, args.requests, args.concurrency))
+    _report("after", _run(shared_client, args.requests, args.concurrency))
+
+    llm_utils.close_groq_clients()
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,138 @@
+"""
+이미지 PDF 페이지 렌더링 → OCR 입력 이미지 전달 방식 비교.
+
+    python -m benchmarks.bench_pdf_render --pages 4 --dpi 300
+    python -m benchmarks.bench_pdf_render --ocr   # tesseract 가 설치된 경우 OCR 까지 포함
+
+방식
+  png   : 기존 방식. pix.tobytes("png") → Image.open → pytesseract 가 PNG 로 다시 저장
+  raw   : pixmap 샘플 버퍼를 Image.frombuffer 로 감싸고 PNM 으로 전달
+  gray  : raw + 처음부터 흑백으로 렌더링
+
+각 방식은 별도 프로세스에서 실행해 페이지당 시간과 최대 RSS 를 따로 잰다.
+same_pixels 는 png 방식과 OCR 입력 픽셀이 같은지 (gray 는 채널 수가 달라 항상 False).
+"""
+
+import argparse
+import hashlib
+import io
+import json
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+import fitz  # PyMuPDF
+from PIL import Image
+
+from app.utils.pdf_utils import pixmap_to_image
+
+MODES = ("png", "raw", "gray")
+
+
+def _write_scanned_pdf(path: str, pages: int) -> None:
+    """텍스트 레이어 없이 이미지로만 구성된 (스캔본 같은) PDF 생성"""
+    src = fitz.open()
+    page = src.new_page()
+    body = "\n".join(
+        f"{i:03d} The quick brown fox jumps over the lazy dog." for i in range(40)
+    )
+    page.insert_text((50, 60), body, fontsize=11)
+    scan = page.get_pixmap(dpi=200)
+
+    doc = fitz.open()
+    for _ in range(pages):
+        out = doc.new_page()
+        out.insert_image(out.rect, pixmap=scan)
+    doc.save(path)
+
+
+def _to_image(page: fitz.Page, mode: str, dpi: int):
+    if mode == "png":
+        pix = page.get_pixmap(dpi=dpi)
+        return pix, Image.open(io.BytesIO(pix.tobytes("png")))
+
+    colorspace = fitz.csGRAY if mode == "gray" else fitz.csRGB
+    pix = page.get_pixmap(dpi=dpi, colorspace=colorspace, alpha=False)
+    return pix, pixmap_to_image(pix)
+
+
+def _run_mode(path: str, mode: str, dpi: int, ocr: bool) -> dict:
+    if ocr:
+        import pytesseract
+
+    timings = []
+    texts = []
+    digest = hashlib.md5()
+    with fitz.open(path) as doc:
+        for page in doc:
+            start = time.perf_counter()
+            pix, image = _to_image(page, mode, dpi)
+            if ocr:
+                texts.append(pytesseract.image_to_string(image, lang="eng"))
+            else:
+                image.load()
+            timings.append(time.perf_counter() - start)
+            digest.update(image.tobytes())
+            del image, pix
+
+    return {
+        "mode": mode,
+        "per_page_ms": 1000 * sum(timings) / len(timings),
+        "max_rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+        "texts": texts,
+        "pixels": digest.hexdigest(),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--pages", type=int, default=4)
+    parser.add_argument("--dpi", type=int, default=300)
+    parser.add_argument("--ocr", action="store_true")
+    parser.add_argument(
+        "--child", nargs=2, metavar=("PATH", "MODE"), help=argparse.SUPPRESS
+    )
+    args = parser.parse_args()
+
+    if args.child:
+        print(json.dumps(_run_mode(args.child[0], args.child[1], args.dpi, args.ocr)))
+        return
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "scanned.pdf")
+        _write_scanned_pdf(path, args.pages)
+
+        print(f"{args.pages} pages @ {args.dpi} dpi, ocr={args.ocr}")
+        baseline = None
+        baseline_pixels = None
+        for mode in MODES:
+            cmd = [
+                sys.executable,
+                "-m",
+                "benchmarks.bench_pdf_render",
+                "--dpi",
+                str(args.dpi),
+                "--child",
+                path,
+                mode,
+            ]
+            if args.ocr:
+                cmd.append("--ocr")
+            out = subprocess.run(cmd, check=True, capture_output=True, text=True).stdout
+            result = json.loads(out.strip().splitlines()[-1])
+
+            if baseline is None:
+                baseline, baseline_pixels = result["texts"], result["pixels"]
+            same = "-" if not args.ocr else result["texts"] == baseline
+            print(
+                f"  {mode:<5} per-page={result['per_page_ms']:8.1f}ms "
+                f"max_rss={result['max_rss_mb']:7.1f}MB "
+                f"same_pixels={result['pixels'] == baseline_pixels} same_text={same}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,237 @@
+"""
+preprocess_text 골든 출력 검증 + 입력 크기별 마이크로벤치마크.
+
+    python -m benchmarks.bench_preprocess_text                # 골든 검증 + 벤치마크
+    python -m benchmarks.bench_preprocess_text --fuzz 20000   # 기존 구현과 무작위 입력 비교 추가
+
+benchmarks/data/preprocess_golden.json 의 각 입력에 대해 현재 구현의 출력이
+기록된 기대값과 바이트 단위로 같은지 확인하고, 기존(문자열 += / 인라인 정규식)
+구현과 현재 구현의 소요 시간을 비교한다.
+"""
+
+import argparse
+import json
+import os
+import random
+import re
+import sys
+import time
+
+from app.utils.pdf_utils import preprocess_text
+
+GOLDEN_PATH = os.path.join(os.path.dirname(__file__), "data", "preprocess_golden.json")
+
+# 줄 단위로 섞어 쓰는 OCR 스타일 조각
+_FRAGMENTS = [
+    "",
+    " ",
+    "  \t",
+    "프로젝트에서",
+    "Redis 캐시를 도입했다",
+    "성능이 개선되었습니다.",
+    "응답 시간을",
+    "40% 줄였고",
+    "및",
+    "그 결과…",
+    "Why?",
+    "done!",
+    "ㅋㅋ 테스트",
+    "ㅏ모음 시작",
+    "2023.01 ~ 2023.06",
+    "- 리더 역할",
+    "• bullet item",
+    "Spring Boot 와",
+    "kafka consumer 를",
+    "있다",
+    "때문",
+    "수",
+    "으로서",
+    "(주)에이아이",
+    "경력 3년",
+    "  앞뒤 공백  ",
+    "email@example.com",
+    "https://github.com/x",
+    "Ⅰ. 개요",
+    "①",
+    "…",
+]
+_SEPARATORS = ["\n", "\n", "\n", "\r\n", "\r", "\n\n", "\x0c", " ", "\x1c"]
+
+
+def _legacy_preprocess_text(text: str) -> str:
+    """기존 구현 (비교용)"""
+    lines = text.splitlines()
+    processed_text = ""
+    i = 0
+
+    while i < len(lines):
+        line = lines[i].strip()
+        if not line:
+            processed_text += "\n"
+            i += 1
+            continue
+
+        next_line = lines[i + 1].strip() if i + 1 < len(lines) else ""
+
+        cond1 = not re.search(r"[.?!…]$", line)
+        cond2 = re.search(
+            r"(은|는|이|가|을|를|고|도|지만|하며|하고|되어|한다|했다|있다|같은|되며|및|하거나|위한|에서|으로|으로서|수|때문)$",
+            line,
+        )
+        cond3 = re.match(r"^[a-zA-Z가-힣0-9]", next_line) and not re.match(
+            r"^[ㄱ-ㅎㅏ-ㅣ]", next_line
+        )
+
+        if next_line and (cond1 or cond2 or cond3):
+            processed_text += line + " "
+            i += 1
+        else:
+            processed_text += line + "\n"
+            i += 1
+
+    return "".join(processed_text)
+
+
+def _random_text(rng: random.Random, lines: int) -> str:
+    out = []
+    for _ in range(lines):
+        out.append(rng.choice(_FRAGMENTS))
+        out.append(rng.choice(_SEPARATORS))
+    return "".join(out)
+
+
+def _check_golden() -> bool:
+    with open(GOLDEN_PATH, encoding="utf-8") as f:
+        cases = json.load(f)
+
+    failed = [c["name"] for c in cases if preprocess_text(c["input"]) != c["expected"]]
+    print(f"golden: {len(cases) - len(failed)}/{len(cases)} identical")
+    for name in failed:
+        print(f"  mismatch: {name}")
+    return not failed
+
+
+def _check_fuzz(n: int) -> bool:
+    rng = random.Random(1234)
+    for i in range(n):
+        text = _random_text(rng, rng.randint(0, 30))
+        if preprocess_text(text) != _legacy_preprocess_text(text):
+            print(f"fuzz: mismatch on case {i}: {text!r}")
+            return False
+    print(f"fuzz: {n}/{n} identical to legacy")
+    return True
+
+
+def _bench(sizes, repeat: int) -> None:
+    rng = random.Random(0)
+    print("\nlines     legacy(ms)   current(ms)   speedup")
+    for size in sizes:
+        text = _random_text(rng, size)
+        timings = []
+        for fn in (_legacy_preprocess_text, preprocess_text):
+            best = float("inf")
+            for _ in range(repeat):
+                start = time.perf_counter()
+                fn(text)
+                best = min(best, time.perf_counter() - start)
+            timings.append(best * 1000)
+        print(
+            f"{size:<9} {timings[0]:10.2f}   {timings[1]:11.2f}   {timings[0] / timings[1]:6.1f}x"
+        )
+
+
+def _write_golden() -> None:
+    """골든 코퍼스 재생성 (기존 구현의 출력을 기대값으로 기록)"""
+    rng = random.Random(42)
+    cases = [
+        {"name": "empty", "input": ""},
+        {"name": "only_newlines", "input": "\n\n\n"},
+        {"name": "single_line", "input": "한 줄짜리 문장입니다."},
+        {"name": "josa_join", "input": "이 프로젝트에서는\n캐시를 도입했다.\n"},
+        {"name": "sentence_end", "input": "끝났습니다.\n다음 문단입니다.\n"},
+        {"name": "ellipsis", "input": "그리고…\n계속\n"},
+        {"name": "jamo_start", "input": "결과.\nㅋㅋ 이건 따로\n"},
+        {"name": "english", "input": "Built a service.\nIt scales well!\nwhy?\nok\n"},
+        {"name": "digits", "input": "기간.\n2023.01 ~ 2023.06\n"},
+        {"name": "bullets", "input": "주요 업무.\n- API 설계\n• 성능 개선\n"},
+        {"name": "blank_between", "input": "문단 하나는\n\n문단 둘은\n"},
+        {"name": "whitespace_lines", "input": "  앞 공백\n \t \n  뒤 공백  \n"},
+        {"name": "crlf", "input": "윈도우 줄바꿈은\r\n이렇게 이어진다\r\n"},
+        {"name": "form_feed_pages", "input": "1페이지 끝.\x0c2페이지 시작은\n"},
+        {"name": "unicode_separators", "input": "줄 구분\x1c문자\x1d처리\x85끝"},
+        {"name": "trailing_no_newline", "input": "마지막 줄은 개행이 없고\n그대로"},
+        {
+            "name": "endings_all",
+            "input": "\n".join(
+                f"어미{e}"
+                for e in (
+                    "은",
+                    "는",
+                    "이",
+                    "가",
+                    "을",
+                    "를",
+                    "고",
+                    "도",
+                    "지만",
+                    "하며",
+                    "하고",
+                    "되어",
+                    "한다",
+                    "했다",
+                    "있다",
+                    "같은",
+                    "되며",
+                    "및",
+                    "하거나",
+                    "위한",
+                    "에서",
+                    "으로",
+                    "으로서",
+                    "수",
+                    "때문",
+                )
+            )
+            + "\n.",
+        },
+        {"name": "punct_then_symbol", "input": "완료.\n(괄호 시작)\n①번\n"},
+    ]
+    for i in range(24):
+        cases.append(
+            {"name": f"random_{i:02d}", "input": _random_text(rng, rng.randint(5, 60))}
+        )
+    for case in cases:
+        case["expected"] = _legacy_preprocess_text(case["input"])
+
+    os.makedirs(os.path.dirname(GOLDEN_PATH), exist_ok=True)
+    with open(GOLDEN_PATH, "w", encoding="utf-8") as f:
+        json.dump(cases, f, ensure_ascii=False, indent=2)
+        f.write("\n")
+    print(f"wrote {len(cases)} cases to {GOLDEN_PATH}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--sizes", type=int, nargs="+", default=[100, 1000, 10000, 50000]
+    )
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--fuzz", type=int, default=0)
+    parser.add_argument("--write-golden", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.write_golden:
+        _write_golden()
+        return
+
+    ok = _check_golden()
+    if args.fuzz:
+        ok = _check_fuzz(args.fuzz) and ok
+    if not ok:
+        sys.exit(1)
+
+    _bench(args.sizes, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+"""
+요청당 프롬프트 렌더링 비용 마이크로벤치마크.
+
+    python -m benchmarks.bench_prompt_render --repeat 2000
+
+- legacy:    요청마다 파일 읽기 + PromptTemplate.from_template + format (기존 서비스 코드)
+- registry:  PromptRegistry.render (컴파일된 템플릿 재사용, mtime 확인은 1초 간격)
+- registry0: PromptRegistry.render, check_interval_sec=0 (매 요청 os.stat)
+
+템플릿마다 세 방식의 출력이 같은지 확인하고, 임시 디렉터리의 템플릿을 수정했을 때
+재시작 없이 반영되는지도 확인한다.
+"""
+
+import argparse
+import os
+import shutil
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict
+
+from langchain.prompts import PromptTemplate
+
+from app.utils.llm_utils import PROMPT_BASE_DIR, load_prompt_template
+from app.utils.prompt_registry import PromptRegistry
+
+
+def _sample_vars(template: PromptTemplate) -> Dict[str, Any]:
+    # 이력서 / 대화 기록처럼 긴 입력은 실제 요청과 비슷한 길이로
+    long_fields = {
+        "resume_text": 6000,
+        "portfolio_text": 3000,
+        "conversation": 8000,
+        "user_answer": 1200,
+    }
+    return {
+        name: ("가나다 abc " * (long_fields.get(name, 40) // 8))[
+            : long_fields.get(name, 40)
+        ]
+        for name in template.input_variables
+    }
+
+
+def _legacy_render(path: Path, **vars: Any) -> str:
+    raw = load_prompt_template(path)
+    return PromptTemplate.from_template(raw).format(**vars)
+
+
+def _time_us(fn: Callable[[], Any], repeat: int) -> float:
+    fn()  # warm-up
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - start) / repeat * 1e6
+
+
+def _check_hot_reload() -> bool:
+    tmp = Path(tempfile.mkdtemp())
+    try:
+        path = tmp / "t.txt"
+        path.write_text("hello {name}", encoding="utf-8")
+        registry = PromptRegistry(base_dir=tmp, check_interval_sec=0)
+        before = registry.render("t.txt", name="a")
+
+        path.write_text("bye {name}!", encoding="utf-8")
+        os.utime(path, ns=(time.time_ns(), time.time_ns() + 1_000_000))
+        after = registry.render("t.txt", name="a")
+
+        ok = before == "hello a" and after == "bye a!"
+        print(f"hot reload: {'ok' if ok else 'FAILED'} ({before!r} -> {after!r})")
+        return ok
+    finally:
+        shutil.rmtree(tmp, ignore_errors=True)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=2000)
+    args = parser.parse_args()
+
+    registry = PromptRegistry()
+    registry0 = PromptRegistry(check_interval_sec=0)
+
+    ok = _check_hot_reload()
+    print(
+        "\ntemplate                          legacy(us)  registry(us)  registry0(us)  speedup"
+    )
+    for path in sorted(PROMPT_BASE_DIR.glob("*.txt")):
+        vars = _sample_vars(registry.get(path))
+        expected = _legacy_render(path, **vars)
+        if (
+            registry.render(path, **vars) != expected
+            or registry0.render(path, **vars) != expected
+        ):
+            print(f"  output mismatch: {path.name}")
+            ok = False
+
+        legacy = _time_us(lambda: _legacy_render(path, **vars), args.repeat)
+        cached = _time_us(lambda: registry.render(path, **vars), args.repeat)
+        stat = _time_us(lambda: registry0.render(path, **vars), args.repeat)
+        print(
+            f"{path.name:<33} {legacy:10.1f}  {cached:12.1f}  {stat:13.1f}  {legacy / cached:6.1f}x"
+        )
+
+    if not ok:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""
+`import app.main` 시간과 RSS 측정 (감정 분석 스택 로드 여부 비교).
+
+    python -m benchmarks.bench_startup --repeat 3
+
+각 시나리오를 새 인터프리터에서 실행한다.
+- baseline: 인터프리터만
+- app.main: 전체 기능 API 프로세스 기동 (FER/TensorFlow 는 로드되지 않아야 함)
+- llm-only: session,llm 그룹만 켠 워커 (AIEW_CAPABILITIES=session,llm)
+- app.main+emotion: 기동 후 FER 모델까지 로드 (기존 import 시점 로드와 동일한 비용)
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+
+_PROBE = """
+import json, resource, sys, time
+start = time.perf_counter()
+{body}
+elapsed = time.perf_counter() - start
+rss_mb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+heavy = sorted(m for m in ("tensorflow", "fer", "cv2", "fitz", "pytesseract") if m in sys.modules)
+print(json.dumps({{"sec": elapsed, "rss_mb": rss_mb, "heavy": heavy}}))
+"""
+
+SCENARIOS = {
+    "baseline": "pass",
+    "app.main": "from app.main import app",
+    "llm-only": "from app.main import create_app\ncreate_app(['session', 'llm'])",
+    "app.main+emotion": (
+        "from app.main import app\n"
+        "from app.utils.video_analysis import warmup_emotion_detector\n"
+        "warmup_emotion_detector()"
+    ),
+}
+
+
+def _probe(body: str) -> dict:
+    proc = subprocess.run(
+        [sys.executable, "-c", _PROBE.format(body=body)],
+        capture_output=True,
+        text=True,
+    )
+    if proc.returncode != 0:
+        return {"error": proc.stderr.strip().splitlines()[-1]}
+    return json.loads(proc.stdout.strip().splitlines()[-1])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--scenarios", nargs="+", default=list(SCENARIOS))
+    args = parser.parse_args()
+
+    for name in args.scenarios:
+        runs = [_probe(SCENARIOS[name]) for _ in range(args.repeat)]
+        errors = [r["error"] for r in runs if "error" in r]
+        if errors:
+            print(f"{name:<18} unavailable: {errors[0]}")
+            continue
+        print(
+            f"{name:<18} import={statistics.median(r['sec'] for r in runs):6.2f}s "
+            f"rss={statistics.median(r['rss_mb'] for r in runs):7.1f}MB "
+            f"heavy={runs[0]['heavy']}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,199 @@
+"""
+SQLite / Redis 세션 저장소 동작 확인 (실서버 없이 임시 파일 + fakeredis 사용).
+
+    python -m benchmarks.check_session_backends
+
+저장소마다 "워커" 두 개(같은 저장소를 보는 별도 인스턴스)를 만들어 확인한다.
+- 버전 충돌: 오래된 버전으로 쓴 워커가 VersionConflictError 후 다시 읽고 이어서 기록
+- load_many / append_many: 여러 세션 일괄 읽기 / 쓰기, expected_version 불일치 시 충돌
+- 빈 append: 메시지가 없으면 버전을 바꾸지 않음 (Redis)
+- clear: 메시지 삭제 + 버전 증가, 다른 워커의 히스토리도 비어 보임
+- TTL: ttl_sec 이 지나면 세션 키가 만료됨 (Redis)
+"""
+
+import argparse
+import os
+import shutil
+import tempfile
+import time
+from typing import Callable, List, Tuple
+
+from langchain_core.messages import AIMessage, HumanMessage
+
+from app.services.session_backend import (
+    BackendChatMessageHistory,
+    RedisSessionBackend,
+    SessionBackend,
+    SQLiteSessionBackend,
+    VersionConflictError,
+)
+
+Workers = Tuple[SessionBackend, SessionBackend]
+
+
+class _Checker:
+    def __init__(self, name: str):
+        self.name = name
+        self.failures: List[str] = []
+
+    def check(self, label: str, ok: bool, detail: object = "") -> None:
+        print(
+            f"  [{'ok' if ok else 'FAILED'}] {label}"
+            + (f" ({detail})" if detail else "")
+        )
+        if not ok:
+            self.failures.append(f"{self.name}: {label}")
+
+
+def _texts(messages) -> List[str]:
+    return [m.content for m in messages]
+
+
+def _check_conflict_retry(c: _Checker, workers: Workers) -> None:
+    a = BackendChatMessageHistory(workers[0], "conflict")
+    b = BackendChatMessageHistory(workers[1], "conflict")
+    _ = b.messages  # b 는 빈 세션(버전 0)을 읽어 둔 상태
+
+    a.add_messages([HumanMessage("a-1"), AIMessage("a-2")])
+    try:
+        workers[1].append("conflict", [HumanMessage("x")], expected_version=0)
+        c.check("stale expected_version raises VersionConflictError", False)
+    except VersionConflictError:
+        c.check("stale expected_version raises VersionConflictError", True)
+
+    # b 는 버전 0 으로 쓰려다 충돌 → 다시 읽고 a 의 기록 뒤에 이어서 기록
+    b.add_messages([HumanMessage("b-1"), AIMessage("b-2")])
+    expected = ["a-1", "a-2", "b-1", "b-2"]
+    c.check(
+        "retry appends after the other worker",
+        _texts(b.messages) == expected,
+        _texts(b.messages),
+    )
+    c.check("other worker reloads on version change", _texts(a.messages) == expected)
+    c.check("version counts both appends", workers[0].version("conflict") == 2)
+
+
+def _check_batch(c: _Checker, workers: Workers) -> None:
+    backend = workers[0]
+    versions = backend.append_many(
+        {
+            "batch-1": ([HumanMessage("1-a")], None),
+            "batch-2": ([HumanMessage("2-a"), AIMessage("2-b")], 0),
+        }
+    )
+    c.check(
+        "append_many returns new versions",
+        versions == {"batch-1": 1, "batch-2": 1},
+        versions,
+    )
+
+    loaded = workers[1].load_many(["batch-1", "batch-2", "batch-none", "batch-1"])
+    c.check(
+        "load_many reads every session once",
+        sorted(loaded) == ["batch-1", "batch-2", "batch-none"],
+    )
+    c.check(
+        "load_many messages / versions",
+        _texts(loaded["batch-2"][0]) == ["2-a", "2-b"]
+        and loaded["batch-1"][1] == 1
+        and loaded["batch-none"] == ([], 0),
+    )
+
+    try:
+        workers[1].append_many({"batch-1": ([HumanMessage("stale")], 0)})
+        c.check("append_many rejects stale expected_version", False)
+    except VersionConflictError:
+        c.check("append_many rejects stale expected_version", True)
+    c.check(
+        "rejected batch left the session untouched",
+        _texts(backend.load("batch-1")[0]) == ["1-a"]
+        and backend.version("batch-1") == 1,
+    )
+
+    version = backend.append("batch-1", [])
+    c.check(
+        "empty append keeps version", version == backend.version("batch-1"), version
+    )
+
+
+def _check_clear(c: _Checker, workers: Workers) -> None:
+    a = BackendChatMessageHistory(workers[0], "clear")
+    b = BackendChatMessageHistory(workers[1], "clear")
+    a.add_messages([HumanMessage("q"), AIMessage("a")])
+    c.check("other worker sees messages before clear", len(b.messages) == 2)
+
+    before = workers[0].version("clear")
+    a.clear()
+    c.check("clear empties the session", a.messages == [] and b.messages == [])
+    c.check("clear bumps version", workers[0].version("clear") > before)
+
+    b.add_messages([HumanMessage("after")])
+    c.check("append after clear", _texts(a.messages) == ["after"], _texts(a.messages))
+
+
+def _check_ttl(c: _Checker, workers: Workers, ttl_sec: int) -> None:
+    history = BackendChatMessageHistory(workers[0], "ttl")
+    history.add_messages([HumanMessage("expires")])
+    c.check("stored before ttl", _texts(workers[1].load("ttl")[0]) == ["expires"])
+
+    time.sleep(ttl_sec + 0.5)
+    c.check("expired after ttl_sec", workers[1].load("ttl") == ([], 0))
+
+
+def _run(name: str, make_workers: Callable[[], Workers], ttl_sec: int = 0) -> List[str]:
+    print(f"\n{name}")
+    c = _Checker(name)
+    workers = make_workers()
+    try:
+        _check_conflict_retry(c, workers)
+        _check_batch(c, workers)
+        _check_clear(c, workers)
+        if ttl_sec:
+            _check_ttl(c, workers, ttl_sec)
+    finally:
+        for backend in workers:
+            backend.close()
+    return c.failures
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--ttl-sec", type=int, default=1)
+    args = parser.parse_args()
+
+    failures: List[str] = []
+    tmp = tempfile.mkdtemp()
+    try:
+        path = os.path.join(tmp, "sessions.sqlite3")
+        failures += _run(
+            "sqlite (temp file)",
+            lambda: (SQLiteSessionBackend(path), SQLiteSessionBackend(path)),
+        )
+    finally:
+        shutil.rmtree(tmp, ignore_errors=True)
+
+    try:
+        import fakeredis
+    except ImportError:
+        print("\nredis: skipped (pip install fakeredis)")
+    else:
+        server = fakeredis.FakeServer()
+
+        def redis_workers() -> Workers:
+            return tuple(
+                RedisSessionBackend(
+                    client=fakeredis.FakeRedis(server=server), ttl_sec=args.ttl_sec
+                )
+                for _ in range(2)
+            )
+
+        failures += _run("redis (fakeredis)", redis_workers, ttl_sec=args.ttl_sec)
+
+    if failures:
+        print("\nfailed:\n  " + "\n  ".join(failures))
+        raise SystemExit(1)
+    print("\nall checks passed")
+
+
+if __name__ == "__main__":
+    main()
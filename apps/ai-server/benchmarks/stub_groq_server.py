@@ -0,0 +1,187 @@
+"""
+로컬 벤치마크용 Groq(OpenAI 호환) chat completions 스텁 서버.
+
+    python -m benchmarks.stub_groq_server --port 8765 --latency-ms 20
+    python -m benchmarks.stub_groq_server --rpm 30   # 분당 30회 초과 시 429 응답
+
+GROQ_BASE_URL=http://127.0.0.1:8765 로 지정하면 app.utils.llm_utils 가
+실제 Groq 대신 이 서버를 호출한다.
+"""
+
+import argparse
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+COMPLETION_CONTENT = json.dumps({"ok": True})
+
+# 받은 chat completions 요청 수 (캐시/중복 제거 효과 확인용) / 429 로 거절한 수
+STATS = {"requests": 0, "rate_limited": 0}
+_stats_lock = threading.Lock()
+
+# Groq 조직 한도 흉내: 분당 rpm 회 (토큰 버킷, 0이면 제한 없음)
+_bucket = {"tokens": 0.0, "updated": 0.0}
+
+
+def _take_request(rpm: float) -> float:
+    """허용되면 0, 한도 초과면 retry-after(초)"""
+
+    if not rpm:
+        return 0.0
+    with _stats_lock:
+        now = time.monotonic()
+        if not _bucket["updated"]:
+            _bucket["tokens"] = rpm
+        else:
+            _bucket["tokens"] = min(
+                rpm, _bucket["tokens"] + (now - _bucket["updated"]) * rpm / 60.0
+            )
+        _bucket["updated"] = now
+        if _bucket["tokens"] >= 1:
+            _bucket["tokens"] -= 1
+            return 0.0
+        STATS["rate_limited"] += 1
+        return (1 - _bucket["tokens"]) * 60.0 / rpm
+
+
+def _completion_body(model: str) -> bytes:
+    return json.dumps(
+        {
+            "id": "chatcmpl-stub",
+            "object": "chat.completion",
+            "created": int(time.time()),
+            "model": model,
+            "choices": [
+                {
+                    "index": 0,
+                    "message": {"role": "assistant", "content": COMPLETION_CONTENT},
+                    "finish_reason": "stop",
+                }
+            ],
+            "usage": {"prompt_tokens": 1, "completion_tokens": 1, "total_tokens": 2},
+        }
+    ).encode("utf-8")
+
+
+class StubGroqHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive 지원
+    latency_sec = 0.0
+    rpm = 0.0
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length", "0"))
+        payload = json.loads(self.rfile.read(length) or b"{}")
+        retry_after = _take_request(self.rpm)
+        if retry_after:
+            self._send_rate_limited(retry_after)
+            return
+        with _stats_lock:
+            STATS["requests"] += 1
+        if payload.get("stream"):
+            self._send_stream(payload.get("model", "stub"))
+            return
+        time.sleep(self.latency_sec)
+
+        body = _completion_body(payload.get("model", "stub"))
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _send_stream(self, model: str, pieces: int = 8) -> None:
+        """stream=True 요청: COMPLETION_CONTENT 를 나눠 SSE 청크로 전송 (latency 를 청크 사이에 분배)"""
+
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+
+        size = max(1, -(-len(COMPLETION_CONTENT) // pieces))
+        deltas = [
+            COMPLETION_CONTENT[i : i + size]
+            for i in range(0, len(COMPLETION_CONTENT), size)
+        ]
+        for i, delta in enumerate(deltas):
+            time.sleep(self.latency_sec / len(deltas))
+            chunk = {
+                "id": "chatcmpl-stub",
+                "object": "chat.completion.chunk",
+                "created": int(time.time()),
+                "model": model,
+                "choices": [
+                    {"index": 0, "delta": {"content": delta}, "finish_reason": None}
+                ],
+            }
+            if i == len(deltas) - 1:
+                chunk["choices"][0]["finish_reason"] = "stop"
+                chunk["x_groq"] = {
+                    "id": "req-stub",
+                    "usage": {
+                        "prompt_tokens": 1,
+                        "completion_tokens": 1,
+                        "total_tokens": 2,
+                    },
+                }
+            self._write_chunk(f"data: {json.dumps(chunk)}\n\n".encode("utf-8"))
+        self._write_chunk(b"data: [DONE]\n\n")
+        self._write_chunk(b"")
+
+    def _write_chunk(self, data: bytes) -> None:
+        self.wfile.write(b"%x\r\n%s\r\n" % (len(data), data))
+        self.wfile.flush()
+
+    def _send_rate_limited(self, retry_after: float) -> None:
+        body = json.dumps(
+            {
+                "error": {
+                    "message": "Rate limit reached for requests per minute (RPM)",
+                    "type": "requests",
+                    "code": "rate_limit_exceeded",
+                }
+            }
+        ).encode("utf-8")
+        self.send_response(429)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("Retry-After", f"{retry_after:.2f}")
+        self.end_headers()
+        self.wfile.write(body)
+
+
+def start_stub_server(
+    host: str = "127.0.0.1", port: int = 0, latency_ms: float = 0.0, rpm: float = 0.0
+) -> ThreadingHTTPServer:
+    handler = type(
+        "ConfiguredStubGroqHandler",
+        (StubGroqHandler,),
+        {"latency_sec": latency_ms / 1000.0, "rpm": rpm},
+    )
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    parser.add_argument("--rpm", type=float, default=0.0)
+    args = parser.parse_args()
+
+    server = start_stub_server(args.host, args.port, args.latency_ms, args.rpm)
+    print(f"stub groq server listening on http://{args.host}:{server.server_port}")
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()